@@ -7,8 +7,9 @@ import asyncio
 import os
 from professor.scm.github import GitHubClient
 from professor.llm import AnthropicClient
-from professor.reviewer import PRReviewer
+from professor.reviewer import PRReviewer, ReviewResult
 from professor.config import get_settings
+from professor.core import Severity
 
 
 async def main():
@@ -59,6 +60,7 @@ async def main():
         llm_client=llm_client,
         max_files=50,
         max_file_size_kb=500,
+        concurrency=10,
     )
 
     # Run review
@@ -66,7 +68,13 @@ async def main():
     print()
 
     try:
-        result = await reviewer.review_pull_request(OWNER, REPO, PR_NUMBER)
+        # Print each file's findings as soon as it finishes
+        result = None
+        async for event in reviewer.stream_review(OWNER, REPO, PR_NUMBER):
+            if isinstance(event, ReviewResult):
+                result = event
+                continue
+            print(f"  {event.file_path}: {len(event.findings)} finding(s)")
 
         # Display results
         print()
@@ -93,7 +101,7 @@ async def main():
         critical_high = [
             f
             for f in result.review.findings
-            if f.severity.value in ["critical", "high"]
+            if f.severity >= Severity.HIGH
         ]
 
         if critical_high:
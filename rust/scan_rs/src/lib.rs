@@ -0,0 +1,50 @@
+//! Per-line rule scanning for Professor's regex language analyzers.
+//!
+//! A `RuleSet` compiles an analyzer's patterns into one `regex::RegexSet`,
+//! whose literal prefilter (Teddy/Aho-Corasick) skips most of the input.
+//! Scanning runs without the GIL.
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use regex::RegexSet;
+
+/// Compiled set of rule patterns, matched line by line.
+#[pyclass(frozen)]
+struct RuleSet {
+    set: RegexSet,
+}
+
+#[pymethods]
+impl RuleSet {
+    #[new]
+    fn new(patterns: Vec<String>) -> PyResult<Self> {
+        RegexSet::new(&patterns)
+            .map(|set| RuleSet { set })
+            .map_err(|e| PyValueError::new_err(e.to_string()))
+    }
+
+    /// Return `(line, rule_index)` pairs for every rule matching a line.
+    ///
+    /// Lines are split on `\n` and numbered from 1; pairs are ordered by
+    /// line, then by rule index.
+    fn scan(&self, py: Python<'_>, code: &str) -> Vec<(u32, u32)> {
+        py.allow_threads(|| {
+            let mut hits = Vec::new();
+            if !self.set.is_match(code) {
+                return hits;
+            }
+            for (index, line) in code.split('\n').enumerate() {
+                for rule in self.set.matches(line).iter() {
+                    hits.push((index as u32 + 1, rule as u32));
+                }
+            }
+            hits
+        })
+    }
+}
+
+#[pymodule]
+fn professor_scan_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<RuleSet>()?;
+    Ok(())
+}
@@ -9,7 +9,29 @@ or machine, deserves the highest standard of review.
 __version__ = "0.1.0"
 __author__ = "Professor Team"
 
-from professor.core.models import Finding, Review, Severity
-from professor.core.analyzer import Analyzer
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from professor.core.models import Finding, Review, Severity
+    from professor.core.analyzer import Analyzer
 
 __all__ = ["Finding", "Review", "Severity", "Analyzer", "__version__"]
+
+# Re-exports are imported on first access, so reading __version__ (as the
+# CLI does at startup) does not load Pydantic and the core models
+_LAZY_EXPORTS = {
+    "Finding": "professor.core.models",
+    "Review": "professor.core.models",
+    "Severity": "professor.core.models",
+    "Analyzer": "professor.core.analyzer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
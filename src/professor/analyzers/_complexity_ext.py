@@ -0,0 +1,198 @@
+"""Single-pass AST metrics collection for ComplexityAnalyzer.
+
+This module is self-contained and fully annotated so it can be compiled
+with mypyc for a faster walk:
+
+    mypyc src/professor/analyzers/_complexity_ext.py
+
+A compiled extension module takes import precedence over this file; when
+none is built, the pure-Python module is imported as usual.
+"""
+
+import ast
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Sources with at least this many lines are split at top-level definitions
+# and the pieces parsed independently
+CHUNKED_PARSE_MIN_LINES = 10_000
+
+# Approximate number of lines per piece
+CHUNK_LINES = 2_000
+
+_TOP_LEVEL_RE = re.compile(r"^(?:async\s+def|def|class)\s+\w+", re.M)
+
+# Node types that add one decision point each
+_DECISION_TYPES: frozenset[type] = frozenset(
+    {
+        ast.If,
+        ast.While,
+        ast.For,
+        ast.AsyncFor,
+        ast.ExceptHandler,
+        ast.With,
+        ast.AsyncWith,
+    }
+)
+
+
+@dataclass
+class FunctionMetrics:
+    """Complexity metrics collected for one function definition."""
+
+    name: str
+    lineno: int
+    end_lineno: Optional[int]
+    params: int
+    complexity: int = 1
+
+
+@dataclass
+class ClassMetrics:
+    """Size metrics collected for one class definition."""
+
+    name: str
+    lineno: int
+    methods: int
+
+
+@dataclass
+class ParsedFile:
+    """Function and class metrics extracted from one source file."""
+
+    functions: list[FunctionMetrics] = field(default_factory=list)
+    classes: list[ClassMetrics] = field(default_factory=list)
+
+
+def measure(code: str) -> ParsedFile:
+    """Parse source and collect its function and class metrics.
+
+    Raises:
+        SyntaxError: If the code cannot be parsed
+    """
+    result = ParsedFile()
+    _visit(ast.parse(code, type_comments=False), result, [])
+    return result
+
+
+def measure_piece(line_offset: int, code: str) -> ParsedFile:
+    """Measure a piece of a larger file, shifting line numbers by ``line_offset``.
+
+    Raises:
+        SyntaxError: If the piece cannot be parsed on its own
+    """
+    result = measure(code)
+    for function in result.functions:
+        function.lineno += line_offset
+        if function.end_lineno is not None:
+            function.end_lineno += line_offset
+    for class_metrics in result.classes:
+        class_metrics.lineno += line_offset
+    return result
+
+
+def merge(parts: list[ParsedFile]) -> ParsedFile:
+    """Concatenate the metrics of consecutive pieces of one file."""
+    result = ParsedFile()
+    for part in parts:
+        result.functions.extend(part.functions)
+        result.classes.extend(part.classes)
+    return result
+
+
+def split_top_level(code: str, chunk_lines: int = CHUNK_LINES) -> list[tuple[int, str]]:
+    """Split source into pieces of about ``chunk_lines`` lines.
+
+    Pieces only start at a column-0 ``def``/``class`` (or the decorators
+    directly above it) and are returned as ``(line_offset, text)`` pairs.
+    A cut that lands inside a string or bracket leaves the preceding piece
+    unparseable, so callers must fall back to parsing the whole file when
+    any piece raises ``SyntaxError``.
+    """
+    pieces: list[tuple[int, str]] = []
+    start = 0
+    start_line = 0
+    # Newlines are counted incrementally up to ``scanned``
+    scanned = 0
+    line = 0
+    for match in _TOP_LEVEL_RE.finditer(code):
+        cut = _decorated_start(code, match.start())
+        if cut <= start:
+            continue
+        line += code.count("\n", scanned, cut)
+        scanned = cut
+        if line - start_line < chunk_lines:
+            continue
+        pieces.append((start_line, code[start:cut]))
+        start = cut
+        start_line = line
+    pieces.append((start_line, code[start:]))
+    return pieces
+
+
+def _decorated_start(code: str, position: int) -> int:
+    """Move a line-start ``position`` up over the decorator lines above it."""
+    while position > 0:
+        previous = code.rfind("\n", 0, position - 1) + 1
+        if not code.startswith("@", previous):
+            break
+        position = previous
+    return position
+
+
+def _children(node: ast.AST) -> list[ast.AST]:
+    """Return child nodes in field order, leaving out annotation subtrees.
+
+    Annotations never contribute decision points worth counting, so
+    return annotations, annotated-assignment annotations and ``ast.arg``
+    nodes (which hold nothing but annotations) are not walked.
+    """
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return [node.args, *node.body, *node.decorator_list]
+    if isinstance(node, ast.AnnAssign):
+        return [node.target] if node.value is None else [node.target, node.value]
+    return [child for child in ast.iter_child_nodes(node) if not isinstance(child, ast.arg)]
+
+
+def _visit(node: ast.AST, result: ParsedFile, stack: list[FunctionMetrics]) -> None:
+    """Walk ``node``'s children in source order, updating ``result``.
+
+    Decision points are counted against the innermost enclosing function;
+    when a nested function is finished its count is folded into the parent,
+    so a function's complexity still covers everything defined inside it.
+    """
+    for child in _children(node):
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            metrics = FunctionMetrics(
+                name=child.name,
+                lineno=child.lineno,
+                end_lineno=child.end_lineno,
+                params=len(child.args.args),
+            )
+            result.functions.append(metrics)
+            stack.append(metrics)
+            _visit(child, result, stack)
+            stack.pop()
+            if stack:
+                stack[-1].complexity += metrics.complexity - 1
+            continue
+
+        if isinstance(child, ast.ClassDef):
+            methods = 0
+            for item in child.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    methods += 1
+            result.classes.append(
+                ClassMetrics(name=child.name, lineno=child.lineno, methods=methods)
+            )
+        elif stack:
+            kind = type(child)
+            if kind in _DECISION_TYPES:
+                stack[-1].complexity += 1
+            elif isinstance(child, ast.BoolOp):
+                stack[-1].complexity += len(child.values) - 1
+            elif isinstance(child, (ast.ListComp, ast.DictComp, ast.SetComp, ast.GeneratorExp)):
+                stack[-1].complexity += len(child.generators)
+
+        _visit(child, result, stack)
@@ -1,13 +1,86 @@
 """Code complexity analyzer."""
 
-import ast
+import asyncio
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
 from typing import Any, Optional
 import structlog
 
+from professor.analyzers._complexity_ext import (
+    CHUNKED_PARSE_MIN_LINES,
+    ClassMetrics,
+    FunctionMetrics,
+    ParsedFile,
+    measure,
+    measure_piece,
+    merge,
+    split_top_level,
+)
 from professor.core import Analyzer, Finding, FindingCategory, Location, Severity
+from professor.core.executor import (
+    PROCESS_POOL_MIN_SIZE,
+    map_sync_in_process,
+    run_sync_in_process,
+)
+from professor.core.line_index import cached_newline_offsets
 
 logger = structlog.get_logger()
 
+_PARSE_CACHE_SIZE = 512
+
+# Keyed by source digest only, so entries do not keep whole sources alive
+_parse_cache: OrderedDict[bytes, ParsedFile] = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _parse_cached(code_hash: bytes, code: str) -> ParsedFile:
+    """Parse and measure source once per unique content digest.
+
+    Raises:
+        SyntaxError: If the code cannot be parsed (failures are not cached)
+    """
+    with _parse_cache_lock:
+        parsed = _parse_cache.get(code_hash)
+        if parsed is not None:
+            _parse_cache.move_to_end(code_hash)
+            return parsed
+
+    parsed = _parse(code)
+    with _parse_cache_lock:
+        _parse_cache[code_hash] = parsed
+        if len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return parsed
+
+
+def _parse(code: str) -> ParsedFile:
+    """Parse and measure source.
+
+    Large sources are measured in the shared process pool; very long ones are
+    split at top-level definitions and the pieces measured in parallel.
+    """
+    if _is_long(code):
+        pieces = split_top_level(code)
+        if len(pieces) > 1:
+            offsets = [offset for offset, _ in pieces]
+            texts = [text for _, text in pieces]
+            try:
+                return merge(map_sync_in_process(measure_piece, offsets, texts))
+            except SyntaxError:
+                # A cut fell inside a string or bracket; parse the file whole
+                pass
+    if len(code) >= PROCESS_POOL_MIN_SIZE:
+        return run_sync_in_process(measure, code)
+    return measure(code)
+
+
+def _is_long(code: str, offsets: Optional[array] = None) -> bool:
+    # A newline index built by another analyzer already holds the count
+    newlines = len(offsets) if offsets is not None else code.count("\n")
+    return newlines >= CHUNKED_PARSE_MIN_LINES
+
 
 class ComplexityAnalyzer(Analyzer):
     """Analyzes code complexity metrics."""
@@ -33,6 +106,13 @@ class ComplexityAnalyzer(Analyzer):
         self.max_function_lines = max_function_lines
         self.max_params = max_params
 
+    def cache_namespace(self) -> str:
+        """Include thresholds, which decide which findings are reported."""
+        return (
+            f"{super().cache_namespace()}:"
+            f"{self.max_complexity}:{self.max_function_lines}:{self.max_params}"
+        )
+
     async def analyze(self, context: dict[str, Any]) -> list[Finding]:
         """Analyze code complexity.
 
@@ -51,8 +131,12 @@ class ComplexityAnalyzer(Analyzer):
         if not file_path.endswith(".py") or not code:
             return []
 
+        code_hash = hashlib.sha256(code.encode("utf-8", "surrogatepass")).digest()
         try:
-            tree = ast.parse(code)
+            if len(code) >= PROCESS_POOL_MIN_SIZE or _is_long(code, cached_newline_offsets(context)):
+                parsed = await asyncio.to_thread(_parse_cached, code_hash, code)
+            else:
+                parsed = _parse_cached(code_hash, code)
         except SyntaxError as e:
             logger.warning("ast_parse_failed", file_path=file_path, error=str(e))
             return []
@@ -60,28 +144,22 @@ class ComplexityAnalyzer(Analyzer):
         findings = []
 
         # Analyze each function
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                func_findings = self._analyze_function(node, file_path, code)
-                findings.extend(func_findings)
+        for function in parsed.functions:
+            findings.extend(self._analyze_function(function, file_path))
 
-            # Check for nested complexity
-            if isinstance(node, ast.ClassDef):
-                class_findings = self._analyze_class(node, file_path)
-                findings.extend(class_findings)
+        # Check for nested complexity
+        for class_metrics in parsed.classes:
+            findings.extend(self._analyze_class(class_metrics, file_path))
 
         logger.info("complexity_analysis_complete", file_path=file_path, findings=len(findings))
         return findings
 
-    def _analyze_function(
-        self, node: ast.FunctionDef, file_path: str, code: str
-    ) -> list[Finding]:
+    def _analyze_function(self, node: FunctionMetrics, file_path: str) -> list[Finding]:
         """Analyze a single function.
 
         Args:
-            node: AST function node
+            node: Collected function metrics
             file_path: File path
-            code: Full code
 
         Returns:
             List of findings for this function
@@ -89,7 +167,7 @@ class ComplexityAnalyzer(Analyzer):
         findings = []
 
         # Calculate cyclomatic complexity
-        complexity = self._calculate_complexity(node)
+        complexity = node.complexity
         if complexity > self.max_complexity:
             location = Location(file_path=file_path, line_start=node.lineno)
 
@@ -129,7 +207,7 @@ class ComplexityAnalyzer(Analyzer):
             findings.append(finding)
 
         # Check parameter count
-        param_count = len(node.args.args)
+        param_count = node.params
         if param_count > self.max_params:
             location = Location(file_path=file_path, line_start=node.lineno)
 
@@ -149,11 +227,11 @@ class ComplexityAnalyzer(Analyzer):
 
         return findings
 
-    def _analyze_class(self, node: ast.ClassDef, file_path: str) -> list[Finding]:
+    def _analyze_class(self, node: ClassMetrics, file_path: str) -> list[Finding]:
         """Analyze a class.
 
         Args:
-            node: AST class node
+            node: Collected class metrics
             file_path: File path
 
         Returns:
@@ -161,65 +239,27 @@ class ComplexityAnalyzer(Analyzer):
         """
         findings = []
 
-        # Count methods
-        methods = [
-            n for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
-        ]
+        methods = node.methods
 
-        if len(methods) > 20:
+        if methods > 20:
             location = Location(file_path=file_path, line_start=node.lineno)
 
             finding = Finding(
                 id=f"complexity-{file_path}-{node.lineno}-class-methods",
                 severity=Severity.MEDIUM,
                 category=FindingCategory.ARCHITECTURE,
-                title=f"Large class: {len(methods)} methods",
-                message=f"Class '{node.name}' has {len(methods)} methods. "
+                title=f"Large class: {methods} methods",
+                message=f"Class '{node.name}' has {methods} methods. "
                 "This may violate Single Responsibility Principle.",
                 location=location,
                 suggestion="Consider splitting into multiple classes",
                 analyzer=self.name,
-                metadata={"methods": len(methods), "class": node.name},
+                metadata={"methods": methods, "class": node.name},
             )
             findings.append(finding)
 
         return findings
 
-    def _calculate_complexity(self, node: ast.FunctionDef) -> int:
-        """Calculate cyclomatic complexity of a function.
-
-        Args:
-            node: Function AST node
-
-        Returns:
-            Cyclomatic complexity
-        """
-        complexity = 1  # Base complexity
-
-        for child in ast.walk(node):
-            # Each decision point adds 1
-            if isinstance(
-                child,
-                (
-                    ast.If,
-                    ast.While,
-                    ast.For,
-                    ast.AsyncFor,
-                    ast.ExceptHandler,
-                    ast.With,
-                    ast.AsyncWith,
-                ),
-            ):
-                complexity += 1
-            # Logical operators
-            elif isinstance(child, ast.BoolOp):
-                complexity += len(child.values) - 1
-            # Comprehensions
-            elif isinstance(child, (ast.ListComp, ast.DictComp, ast.SetComp, ast.GeneratorExp)):
-                complexity += len(child.generators)
-
-        return complexity
-
     def supports(self, context: dict[str, Any]) -> bool:
         """Check if this analyzer supports the context.
 
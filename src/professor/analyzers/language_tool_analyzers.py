@@ -1,16 +1,78 @@
 """Language-specific analyzers for top-6 languages."""
 
 import re
-from typing import Any, Optional
+from array import array
+from typing import Any, NamedTuple, Optional
+
+import structlog
 
 from professor.core import Analyzer, Finding, FindingCategory, Location, Severity
+from professor.core.executor import PROCESS_POOL_MIN_SIZE, run_in_process
+from professor.core.line_index import get_newline_offsets, line_text
+from professor.core.pattern_scan import PatternSet
+
+try:
+    import professor_scan_rs  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional native rule scanner (rust/scan_rs)
+    professor_scan_rs = None
+
+logger = structlog.get_logger()
+
+_COMMENT_RE = re.compile(r"^\s*(//|#|\*)")
+
+
+class _Rule(NamedTuple):
+    """Compiled form of one entry in an analyzer's ``rules`` table."""
+
+    pattern: re.Pattern[str]
+    id: str
+    severity: Severity
+    category: FindingCategory
+    title: str
+    message: str
+    suggestion: Optional[str]
 
 
 class _RegexLanguageAnalyzer(Analyzer):
-    """Base regex analyzer for language-specific risk patterns."""
+    """Base regex analyzer for language-specific risk patterns.
+
+    Subclasses declare ``rules``; at class creation they are compiled once
+    into ``_Rule`` records and a ``PatternSet`` so each file is scanned in one
+    pass (with Hyperscan when installed). Only lines hit by the scan are
+    re-checked against the individual rules.
+
+    If the native ``professor_scan_rs`` extension is built, it takes over the
+    whole per-line scan and reports ``(line, rule)`` hits directly.
+    """
 
     supported_extensions: tuple[str, ...] = ()
     rules: list[dict[str, Any]] = []
+    _rules: tuple[_Rule, ...] = ()
+    _patterns: Optional[PatternSet] = None
+    _rs_rules: Any = None
+    _rs_disabled: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._rules = tuple(
+            _Rule(
+                pattern=re.compile(rule["pattern"]),
+                id=rule["id"],
+                severity=rule["severity"],
+                category=rule["category"],
+                title=rule["title"],
+                message=rule["message"],
+                suggestion=rule.get("suggestion"),
+            )
+            for rule in cls.rules
+        )
+        cls._patterns = (
+            PatternSet([rule.pattern.pattern for rule in cls._rules], name=cls.__name__)
+            if cls._rules
+            else None
+        )
+        cls._rs_rules = None
+        cls._rs_disabled = professor_scan_rs is None
 
     def __init__(self, config: Optional[Any] = None) -> None:
         super().__init__(config)
@@ -19,38 +81,110 @@ class _RegexLanguageAnalyzer(Analyzer):
     async def analyze(self, context: dict[str, Any]) -> list[Finding]:
         code = context.get("code", "")
         file_path = context.get("file_path", "")
-        if not self.supports(context):
+        if not self.supports(context) or self._patterns is None:
             return []
+        offsets = get_newline_offsets(context)
+        if len(code) >= PROCESS_POOL_MIN_SIZE:
+            return await run_in_process(self._scan, code, file_path, offsets)
+        return self._scan(code, file_path, offsets)
 
+    def _scan(self, code: str, file_path: str, offsets: array) -> list[Finding]:
+        """Run all rules over ``code``; synchronous so it can run in a worker."""
+        native_hits = self._native_hits(code)
+        if native_hits is not None:
+            return self._findings_for_hits(code, file_path, offsets, native_hits)
+
+        patterns = self._patterns
+        if patterns is None:
+            return []
         findings: list[Finding] = []
-        lines = code.split("\n")
-        for index, line in enumerate(lines, start=1):
-            if self._is_comment_line(line):
+        id_prefix = self._id_prefix(file_path)
+        for index in patterns.candidate_lines(code, offsets):
+            line = line_text(code, offsets, index)
+            if _COMMENT_RE.match(line):
                 continue
-            for rule in self.rules:
-                if re.search(rule["pattern"], line):
-                    findings.append(
-                        Finding(
-                            id=f"{self.name.lower()}-{file_path}-{index}-{rule['id']}",
-                            severity=rule["severity"],
-                            category=rule["category"],
-                            title=rule["title"],
-                            message=rule["message"],
-                            location=Location(file_path=file_path, line_start=index),
-                            suggestion=rule.get("suggestion"),
-                            analyzer=self.name,
-                            code_snippet=line.strip(),
-                        )
-                    )
+            location = None
+            for rule in self._rules:
+                if rule.pattern.search(line):
+                    if location is None:
+                        location = Location(file_path=file_path, line_start=index)
+                        snippet = line.strip()
+                    findings.append(self._finding(rule, id_prefix, index, location, snippet))
+        return findings
+
+    def _findings_for_hits(
+        self, code: str, file_path: str, offsets: array, hits: list[tuple[int, int]]
+    ) -> list[Finding]:
+        """Build findings from native ``(line, rule_index)`` hits."""
+        findings: list[Finding] = []
+        id_prefix = self._id_prefix(file_path)
+        current = 0
+        location: Optional[Location] = None
+        snippet = ""
+        for index, rule_index in hits:
+            if index != current:
+                current = index
+                line = line_text(code, offsets, index)
+                # Comment lines get no location and are skipped
+                location = (
+                    None if _COMMENT_RE.match(line) else Location(file_path=file_path, line_start=index)
+                )
+                snippet = line.strip()
+            if location is not None:
+                rule = self._rules[rule_index]
+                findings.append(self._finding(rule, id_prefix, index, location, snippet))
         return findings
 
+    def _id_prefix(self, file_path: str) -> str:
+        """Return the part of a finding id shared by every finding in a file."""
+        return f"{self.name.lower()}-{file_path}-"
+
+    def _finding(
+        self, rule: _Rule, id_prefix: str, index: int, location: Location, snippet: str
+    ) -> Finding:
+        return Finding(
+            id=f"{id_prefix}{index}-{rule.id}",
+            severity=rule.severity,
+            category=rule.category,
+            title=rule.title,
+            message=rule.message,
+            location=location,
+            suggestion=rule.suggestion,
+            analyzer=self.name,
+            code_snippet=snippet,
+        )
+
     def supports(self, context: dict[str, Any]) -> bool:
         file_path = context.get("file_path", "").lower()
         return bool(context.get("code")) and file_path.endswith(self.supported_extensions)
 
-    def _is_comment_line(self, line: str) -> bool:
-        stripped = line.strip()
-        return stripped.startswith("//") or stripped.startswith("#") or stripped.startswith("*")
+    def _native_hits(self, code: str) -> Optional[list[tuple[int, int]]]:
+        """Scan with the native extension, or return None to use the Python path."""
+        rule_set = self._native_rule_set()
+        if rule_set is None:
+            return None
+        try:
+            hits: list[tuple[int, int]] = rule_set.scan(code)
+        except UnicodeEncodeError:
+            # Lone surrogates cannot be passed to Rust as UTF-8
+            return None
+        return hits
+
+    @classmethod
+    def _native_rule_set(cls) -> Any:
+        """Lazily compile the class rules into a native ``RuleSet``."""
+        if cls._rs_rules is not None or cls._rs_disabled:
+            return cls._rs_rules
+
+        try:
+            rule_set = professor_scan_rs.RuleSet([rule.pattern.pattern for rule in cls._rules])
+        except Exception as e:
+            logger.warning("native_scanner_compile_failed", analyzer=cls.__name__, error=str(e))
+            cls._rs_disabled = True
+            return None
+
+        cls._rs_rules = rule_set
+        return rule_set
 
 
 class ESLintAnalyzer(_RegexLanguageAnalyzer):
@@ -1,13 +1,28 @@
 """LLM-powered code analyzer."""
 
 import json
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 import structlog
 from professor.core import Analyzer, Finding, FindingCategory, Location, Severity
 from professor.llm import BaseLLMClient, LLMMessage
 
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional incremental JSON parser
+    ijson = None
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional fast JSON parser
+    _json_loads = json.loads  # type: ignore[assignment]
+
 logger = structlog.get_logger()
 
+# Marks a prompt prefix as cacheable for providers that support prompt caching
+EPHEMERAL_CACHE = {"type": "ephemeral"}
+
 
 class LLMAnalyzer(Analyzer):
     """Code analyzer using LLM for intelligent review."""
@@ -22,6 +37,12 @@ class LLMAnalyzer(Analyzer):
         super().__init__(config)
         self.llm = llm_client
         self.name = "LLMAnalyzer"
+        # Files whose latest review failed; their empty results must not be cached
+        self.failed_paths: set[str] = set()
+
+    def cache_namespace(self) -> str:
+        """Include the model, since findings differ between models."""
+        return f"{super().cache_namespace()}:{getattr(self.llm, 'model', '')}"
 
     async def analyze(self, context: dict[str, Any]) -> list[Finding]:
         """Analyze code using LLM.
@@ -39,41 +60,120 @@ class LLMAnalyzer(Analyzer):
         Raises:
             AnalyzerError: If analysis fails
         """
+        return [finding async for finding in self.analyze_stream(context)]
+
+    async def analyze_stream(self, context: dict[str, Any]) -> AsyncIterator[Finding]:
+        """Analyze code using LLM, yielding findings as the response streams in.
+
+        Each finding is yielded as soon as its JSON array element is complete.
+        Without ``ijson``, or if incremental parsing fails, the full response
+        is parsed at the end and any findings not yet yielded follow.
+
+        Args:
+            context: Same as ``analyze``
+
+        Yields:
+            Findings from LLM analysis
+        """
         file_path = context.get("file_path", "unknown")
         code = context.get("code", "")
         diff = context.get("diff")
         language = context.get("language", "unknown")
+        self.failed_paths.discard(file_path)
 
         if not code and not diff:
             logger.warning("no_code_provided", file_path=file_path)
-            return []
+            return
 
-        # Build prompt
-        prompt = self._build_review_prompt(file_path, code, diff, language)
+        parser = _JSONArrayStream() if ijson is not None else None
+        chunks: list[str] = []
+        emitted = 0
 
         # Call LLM
+        try:
+            messages = self._build_messages(file_path, code, diff, language)
+
+            async for delta in self.llm.stream(messages):
+                chunks.append(delta)
+                if parser is None:
+                    continue
+                for data in parser.feed(delta):
+                    for finding in self._build_findings([data], file_path, start=emitted):
+                        yield finding
+                    emitted += 1
+
+        except Exception as e:
+            logger.error("llm_analysis_failed", error=str(e), file_path=file_path)
+            self.failed_paths.add(file_path)
+            return
+
+        if parser is None or not parser.close():
+            # Parse the full response; elements already seen were yielded
+            findings_data = self._decode_findings("".join(chunks), file_path)
+            if findings_data is not None:
+                findings = self._build_findings(findings_data[emitted:], file_path, start=emitted)
+                logger.info("parsed_findings", count=emitted + len(findings), file_path=file_path)
+                for finding in findings:
+                    yield finding
+        else:
+            logger.info("parsed_findings", count=emitted, file_path=file_path)
+
+        logger.info("llm_analysis_complete", file_path=file_path)
+
+    async def analyze_batch(
+        self, contexts: list[dict[str, Any]]
+    ) -> dict[str, list[Finding]]:
+        """Analyze several files with a single LLM call.
+
+        Files are sent as delimited sections and the model is asked for a
+        JSON object keyed by file path, saving one round-trip per file.
+        Intended for small files; callers control the batch size. Files the
+        response leaves out or garbles are reviewed again one at a time.
+
+        Args:
+            contexts: Analysis contexts, each shaped as for ``analyze``
+
+        Returns:
+            Mapping of file path to findings for every supported context
+        """
+        contexts = [context for context in contexts if context.get("code") or context.get("diff")]
+        if not contexts:
+            return {}
+        if len(contexts) == 1:
+            context = contexts[0]
+            return {context.get("file_path", "unknown"): await self.analyze(context)}
+
+        file_paths = [context.get("file_path", "unknown") for context in contexts]
+        self.failed_paths.difference_update(file_paths)
         try:
             messages = [
-                LLMMessage("system", self._get_system_prompt()),
-                LLMMessage("user", prompt),
+                LLMMessage("system", self._get_system_prompt(), EPHEMERAL_CACHE),
+                LLMMessage("user", self._build_batch_prompt(contexts)),
             ]
 
             response = await self.llm.complete(messages)
 
             logger.info(
-                "llm_analysis_complete",
-                file_path=file_path,
+                "llm_batch_analysis_complete",
+                files=len(file_paths),
                 tokens_used=response.tokens_used,
+                cache_read_input_tokens=response.metadata.get("cache_read_input_tokens", 0),
                 cost=response.cost,
             )
 
-            # Parse findings from response
-            findings = self._parse_findings(response.content, file_path)
-            return findings
+            results = self._parse_batch_findings(response.content, file_paths)
 
         except Exception as e:
-            logger.error("llm_analysis_failed", error=str(e), file_path=file_path)
-            return []
+            logger.error("llm_batch_analysis_failed", error=str(e), files=len(file_paths))
+            self.failed_paths.update(file_paths)
+            return {path: [] for path in file_paths}
+
+        # Fall back to per-file review for files the batch did not answer
+        for context in contexts:
+            file_path = context.get("file_path", "unknown")
+            if file_path in self.failed_paths:
+                results[file_path] = await self.analyze(context)
+        return results
 
     def supports(self, context: dict[str, Any]) -> bool:
         """Check if this analyzer supports the context.
@@ -116,6 +216,84 @@ Return findings in JSON format:
 
 If no issues found, return empty array: []"""
 
+    def _build_messages(
+        self, file_path: str, code: str, diff: Optional[str], language: str
+    ) -> list[LLMMessage]:
+        """Build review messages with cacheable prefixes.
+
+        The system prompt is identical for every file and is always marked
+        cacheable. When a diff is present, the full file goes in its own
+        cached block ahead of the diff so only the diff is uncached input.
+        """
+        messages = [LLMMessage("system", self._get_system_prompt(), EPHEMERAL_CACHE)]
+
+        if code and diff:
+            messages.append(
+                LLMMessage(
+                    "user",
+                    "\n".join(
+                        [f"Review this {language} code from `{file_path}`:\n"]
+                        + self._file_prompt_parts(code, language)
+                    ),
+                    EPHEMERAL_CACHE,
+                )
+            )
+            messages.append(
+                LLMMessage(
+                    "user",
+                    "\n".join(self._diff_prompt_parts(diff) + self._instruction_parts()),
+                )
+            )
+        else:
+            messages.append(
+                LLMMessage("user", self._build_review_prompt(file_path, code, diff, language))
+            )
+
+        return messages
+
+    def _file_prompt_parts(self, code: str, language: str) -> list[str]:
+        """Prompt lines presenting the full file."""
+        return [
+            "FULL FILE:",
+            f"```{language}",
+            code,
+            "```",
+        ]
+
+    def _diff_prompt_parts(self, diff: str) -> list[str]:
+        """Prompt lines presenting the changes."""
+        return ["CHANGES (diff):", "```diff", diff, "```\n"]
+
+    def _instruction_parts(self) -> list[str]:
+        """Closing review instructions."""
+        return [
+            "\nAnalyze for bugs, security issues, logic errors, and quality problems.",
+            "Return JSON array of findings (or [] if no issues).",
+        ]
+
+    def _build_batch_prompt(self, contexts: list[dict[str, Any]]) -> str:
+        """Build one review prompt covering several files."""
+        parts = ["Review the following files. Each file is in its own section.\n"]
+
+        for context in contexts:
+            language = context.get("language", "unknown")
+            parts.append(f"### FILE: {context.get('file_path', 'unknown')}")
+            if context.get("diff"):
+                parts.extend(self._diff_prompt_parts(context["diff"]))
+            if context.get("code"):
+                parts.extend(self._file_prompt_parts(context["code"], language))
+            parts.append("")
+
+        parts.append("Analyze each file for bugs, security issues, logic errors, and quality problems.")
+        parts.append(
+            "Return a single JSON object mapping each file path exactly as given to a "
+            "JSON array of its findings (use [] for files with no issues), e.g. "
+            '{"src/app.py": [{"severity": "high", "category": "bug", "title": "...", '
+            '"message": "...", "line": 42, "suggestion": "..."}], "src/util.py": []}'
+        )
+
+        return "\n".join(parts)
+
     def _build_review_prompt(
         self, file_path: str, code: str, diff: Optional[str], language: str
     ) -> str:
@@ -123,21 +301,12 @@ If no issues found, return empty array: []"""
         parts = [f"Review this {language} code from `{file_path}`:\n"]
 
         if diff:
-            parts.append("CHANGES (diff):")
-            parts.append("```diff")
-            parts.append(diff)
-            parts.append("```\n")
+            parts.extend(self._diff_prompt_parts(diff))
 
         if code:
-            parts.append("FULL FILE:")
-            parts.append(f"```{language}")
-            parts.append(code)
-            parts.append("```")
+            parts.extend(self._file_prompt_parts(code, language))
 
-        parts.append(
-            "\nAnalyze for bugs, security issues, logic errors, and quality problems."
-        )
-        parts.append("Return JSON array of findings (or [] if no issues).")
+        parts.extend(self._instruction_parts())
 
         return "\n".join(parts)
 
@@ -151,6 +320,20 @@ If no issues found, return empty array: []"""
         Returns:
             List of parsed findings
         """
+        findings_data = self._decode_findings(response, file_path)
+        if findings_data is None:
+            return []
+        findings = self._build_findings(findings_data, file_path)
+        logger.info("parsed_findings", count=len(findings), file_path=file_path)
+        return findings
+
+    def _decode_findings(self, response: str, file_path: str) -> Optional[list[Any]]:
+        """Decode the JSON array of raw findings in an LLM response.
+
+        Returns:
+            The decoded array elements, or None (with ``file_path`` marked
+            failed) if the response holds no valid array
+        """
         try:
             # Extract JSON from response
             json_start = response.find("[")
@@ -158,42 +341,154 @@ If no issues found, return empty array: []"""
 
             if json_start == -1 or json_end == 0:
                 logger.warning("no_json_in_response", response=response[:100])
-                return []
+                self.failed_paths.add(file_path)
+                return None
 
             json_str = response[json_start:json_end]
-            findings_data = json.loads(json_str)
-
-            findings = []
-            for idx, data in enumerate(findings_data):
-                try:
-                    location = Location(
-                        file_path=file_path,
-                        line_start=data.get("line", 1),
-                        line_end=data.get("line_end"),
-                    )
-
-                    finding = Finding(
-                        id=f"llm-{file_path}-{idx}",
-                        severity=Severity(data["severity"].lower()),
-                        category=FindingCategory(data["category"].lower()),
-                        title=data["title"],
-                        message=data["message"],
-                        location=location,
-                        suggestion=data.get("suggestion"),
-                        analyzer=self.name,
-                    )
-                    findings.append(finding)
-
-                except (KeyError, ValueError) as e:
-                    logger.warning("invalid_finding_format", error=str(e), data=data)
-                    continue
+            findings_data = _json_loads(json_str)
+
+        except json.JSONDecodeError as e:
+            logger.error("json_parse_error", error=str(e), response=response[:200])
+            self.failed_paths.add(file_path)
+            return None
+        except Exception as e:
+            logger.error("parse_error", error=str(e))
+            self.failed_paths.add(file_path)
+            return None
+
+        if not isinstance(findings_data, list):
+            logger.warning("invalid_findings_response", response=response[:100])
+            self.failed_paths.add(file_path)
+            return None
+        return findings_data
+
+    def _parse_batch_findings(
+        self, response: str, file_paths: list[str]
+    ) -> dict[str, list[Finding]]:
+        """Parse a batched LLM response keyed by file path.
+
+        Args:
+            response: LLM response text containing a JSON object
+            file_paths: File paths included in the batch
+
+        Returns:
+            Mapping of every batched file path to its findings; paths the
+            response does not answer with a list are added to ``failed_paths``
+        """
+        results: dict[str, list[Finding]] = {path: [] for path in file_paths}
+        try:
+            json_start = response.find("{")
+            json_end = response.rfind("}") + 1
 
-            logger.info("parsed_findings", count=len(findings), file_path=file_path)
-            return findings
+            if json_start == -1 or json_end == 0:
+                logger.warning("no_json_in_response", response=response[:100])
+                self.failed_paths.update(file_paths)
+                return results
+
+            findings_by_path = _json_loads(response[json_start:json_end])
+            if not isinstance(findings_by_path, dict):
+                logger.warning("invalid_batch_response", response=response[:100])
+                self.failed_paths.update(file_paths)
+                return results
+
+            for path in file_paths:
+                findings_data = findings_by_path.get(path)
+                if isinstance(findings_data, list):
+                    results[path] = self._build_findings(findings_data, path)
+                else:
+                    # Left out of the response: not reviewed, so not clean
+                    logger.warning("missing_batch_findings", file_path=path)
+                    self.failed_paths.add(path)
+
+            logger.info(
+                "parsed_batch_findings",
+                files=len(file_paths),
+                count=sum(len(findings) for findings in results.values()),
+            )
+            return results
 
         except json.JSONDecodeError as e:
             logger.error("json_parse_error", error=str(e), response=response[:200])
-            return []
+            self.failed_paths.update(file_paths)
+            return results
         except Exception as e:
             logger.error("parse_error", error=str(e))
+            self.failed_paths.update(file_paths)
+            return results
+
+    def _build_findings(
+        self, findings_data: list[Any], file_path: str, start: int = 0
+    ) -> list[Finding]:
+        """Convert decoded finding dicts into Finding objects, skipping bad entries.
+
+        ``start`` is the array index of the first entry, used in finding ids.
+        """
+        findings = []
+        for idx, data in enumerate(findings_data, start):
+            try:
+                location = Location(
+                    file_path=file_path,
+                    line_start=data.get("line", 1),
+                    line_end=data.get("line_end"),
+                )
+
+                finding = Finding(
+                    id=f"llm-{file_path}-{idx}",
+                    severity=Severity(data["severity"].lower()),
+                    category=FindingCategory(data["category"].lower()),
+                    title=data["title"],
+                    message=data["message"],
+                    location=location,
+                    suggestion=data.get("suggestion"),
+                    analyzer=self.name,
+                )
+                findings.append(finding)
+
+            except (KeyError, ValueError) as e:
+                logger.warning("invalid_finding_format", error=str(e), data=data)
+                continue
+
+        return findings
+
+
+class _JSONArrayStream:
+    """Incrementally parse a JSON array embedded in streamed LLM text.
+
+    Text before the first ``[`` is skipped. Once a parse error occurs the
+    stream is marked failed and further input is ignored.
+    """
+
+    def __init__(self) -> None:
+        self._items = ijson.sendable_list()
+        self._coro = ijson.items_coro(self._items, "item")
+        self._started = False
+        self.failed = False
+
+    def feed(self, text: str) -> list[Any]:
+        """Feed a text fragment and return array elements completed by it."""
+        if self.failed:
             return []
+        if not self._started:
+            start = text.find("[")
+            if start == -1:
+                return []
+            text = text[start:]
+            self._started = True
+
+        try:
+            self._coro.send(text.encode("utf-8"))
+        except Exception:
+            self.failed = True
+        items = list(self._items)
+        del self._items[:]
+        return items
+
+    def close(self) -> bool:
+        """Finish parsing; return True if a complete array was parsed cleanly."""
+        if self.failed or not self._started:
+            return False
+        try:
+            self._coro.close()
+        except Exception:
+            return False
+        return True
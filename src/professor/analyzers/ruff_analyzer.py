@@ -1,17 +1,271 @@
 """Static code analysis using Ruff for Python."""
 
-import subprocess
+import asyncio
+import contextlib
+import itertools
 import json
-from typing import Any, Optional
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional, cast
 import structlog
 
 from professor.core import Analyzer, Finding, FindingCategory, Location, Severity
 
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional incremental JSON parser
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast JSON parser
+    orjson = None  # type: ignore[assignment]
+
 logger = structlog.get_logger()
 
+RUFF_TIMEOUT_SECONDS = 30
+
+_JSON_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError,)
+if ijson is not None:
+    _JSON_ERRORS += (ijson.JSONError,)
+
+
+async def _iter_json_array(stream: asyncio.StreamReader) -> AsyncIterator[Any]:
+    """Yield the elements of a JSON array read from ``stream``.
+
+    Ruff writes its report in one go when it exits, so with ``orjson`` the
+    raw bytes are read and parsed at once, which is several times faster
+    than parsing incrementally. Without it, ``ijson`` parses each element as
+    soon as it has been read; failing both, ``json`` loads the document.
+    """
+    if orjson is not None:
+        for item in orjson.loads(await stream.read()):
+            yield item
+    elif ijson is not None:
+        async for item in ijson.items_async(stream, "item", use_float=True):
+            yield item
+    else:
+        for item in json.loads(await stream.read()):
+            yield item
+
+
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(message: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(message)
+    return json.dumps(message, ensure_ascii=False).encode("utf-8")
+
+
+class _RuffServer:
+    """A long-lived ``ruff server`` process queried over the Language Server Protocol.
+
+    Messages are JSON-RPC with ``Content-Length`` framing on the process's
+    stdin and stdout; a reader task hands responses to the waiting requests
+    by id, so several files can be checked at once. Documents are opened in
+    memory under a virtual directory of the workspace and never written to
+    disk.
+
+    The workspace is the current directory, so Ruff resolves its settings as
+    ``ruff check`` run from there does.
+    """
+
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self.process = process
+        self.loop = asyncio.get_running_loop()
+        self._ids = itertools.count(1)
+        self._documents = itertools.count()
+        # Documents outside the workspace would get the server's fallback
+        # settings instead of the project's, so they are placed inside it
+        self._root = Path.cwd() / f".professor-ruff-{os.getpid()}"
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        self._write_lock = asyncio.Lock()
+        self._error: Optional[ConnectionError] = None
+        self._reader = asyncio.create_task(self._read_messages())
+
+    @classmethod
+    async def start(cls) -> "_RuffServer":
+        """Spawn ``ruff server`` and complete the LSP handshake.
+
+        Raises:
+            FileNotFoundError: If Ruff is not installed
+            ConnectionError: If the server exits or answers with an error
+            TimeoutError: If the handshake takes longer than
+                ``RUFF_TIMEOUT_SECONDS``
+        """
+        process = await asyncio.create_subprocess_exec(
+            "ruff",
+            "server",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        server = cls(process)
+        workspace = Path.cwd().as_uri()
+        try:
+            await asyncio.wait_for(
+                server.request(
+                    "initialize",
+                    {
+                        "processId": os.getpid(),
+                        "rootUri": workspace,
+                        "workspaceFolders": [{"uri": workspace, "name": "workspace"}],
+                        "capabilities": {
+                            # Columns in characters, as ``ruff check`` reports them
+                            "general": {"positionEncodings": ["utf-32"]},
+                            "textDocument": {"diagnostic": {"dynamicRegistration": False}},
+                        },
+                    },
+                ),
+                RUFF_TIMEOUT_SECONDS,
+            )
+            await server.notify("initialized", {})
+        except BaseException:
+            await server.close()
+            raise
+        return server
+
+    async def diagnostics(self, code: str) -> list[dict[str, Any]]:
+        """Return the LSP diagnostics Ruff reports for ``code``."""
+        document = {"uri": (self._root / f"{next(self._documents)}.py").as_uri()}
+        await self.notify(
+            "textDocument/didOpen",
+            {"textDocument": {**document, "languageId": "python", "version": 1, "text": code}},
+        )
+        try:
+            report = await self.request("textDocument/diagnostic", {"textDocument": document})
+        finally:
+            with contextlib.suppress(ConnectionError):
+                await self.notify("textDocument/didClose", {"textDocument": document})
+        return cast(list[dict[str, Any]], (report or {}).get("items", []))
+
+    async def request(self, method: str, params: Optional[dict[str, Any]] = None) -> Any:
+        """Send a request and wait for its result.
+
+        Raises:
+            ConnectionError: If the server has exited or returns an error
+        """
+        request_id = next(self._ids)
+        future = self.loop.create_future()
+        self._pending[request_id] = future
+        try:
+            await self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def notify(self, method: str, params: Optional[dict[str, Any]] = None) -> None:
+        """Send a notification, which gets no response."""
+        await self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    async def close(self) -> None:
+        """Shut the server down, killing it if it does not exit in time."""
+        try:
+            if self.process.returncode is None and self._error is None:
+                with contextlib.suppress(TimeoutError, ConnectionError):
+                    await asyncio.wait_for(self.request("shutdown"), RUFF_TIMEOUT_SECONDS)
+                    await self.notify("exit")
+                    await asyncio.wait_for(self.process.wait(), RUFF_TIMEOUT_SECONDS)
+        finally:
+            if self.process.returncode is None:
+                self.process.kill()
+            await self.process.wait()
+            self._reader.cancel()
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        if self._error is not None:
+            raise self._error
+        assert self.process.stdin is not None
+        body = _json_dumps(message)
+        try:
+            async with self._write_lock:
+                self.process.stdin.write(b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+                await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise ConnectionError(f"ruff server stopped: {e}") from e
+
+    async def _read_messages(self) -> None:
+        """Read messages until the server exits, failing any requests left waiting."""
+        assert self.process.stdout is not None
+        stdout = self.process.stdout
+        try:
+            while True:
+                length = None
+                while True:
+                    header = await stdout.readline()
+                    if not header:
+                        raise ConnectionError("ruff server closed its output")
+                    if not header.strip():
+                        break
+                    name, _, value = header.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                if length is None:
+                    raise ConnectionError("ruff server sent a message without Content-Length")
+                await self._dispatch(_json_loads(await stdout.readexactly(length)))
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            self._error = e if isinstance(e, ConnectionError) else ConnectionError(str(e))
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(self._error)
+
+    async def _dispatch(self, message: dict[str, Any]) -> None:
+        if "method" in message:
+            # Requests from the server (progress, registrations) need an answer
+            # but none of them affect diagnostics; notifications are dropped
+            if "id" in message:
+                await self._send({"jsonrpc": "2.0", "id": message["id"], "result": None})
+            return
+        future = self._pending.get(message["id"]) if "id" in message else None
+        if future is None or future.done():
+            return
+        if "error" in message:
+            error = message["error"] or {}
+            future.set_exception(ConnectionError(f"ruff server error: {error.get('message')}"))
+        else:
+            future.set_result(message.get("result"))
+
+
+def _diagnostic_to_issue(diagnostic: dict[str, Any]) -> dict[str, Any]:
+    """Reshape an LSP diagnostic from ``ruff server`` like a ``ruff check`` JSON issue."""
+    start = diagnostic.get("range", {}).get("start", {})
+    data = diagnostic.get("data") or {}
+    # The server appends the fix title to the message as a help line
+    message, _, _ = diagnostic.get("message", "").partition("\n\nhelp: ")
+    return {
+        "code": diagnostic.get("code"),
+        "message": message,
+        "location": {"row": start.get("line", 0) + 1, "column": start.get("character", 0) + 1},
+        "fix": {"message": data.get("title")} if data.get("edits") else None,
+        "url": (diagnostic.get("codeDescription") or {}).get("href"),
+    }
+
+
+def _prefix_table(
+    severities: dict[str, Severity], categories: dict[str, FindingCategory]
+) -> dict[str, tuple[Severity, FindingCategory]]:
+    """Pair each rule prefix's severity with its category (STYLE if unmapped).
+
+    Built by a function because a comprehension in the class body cannot
+    see the other class attributes.
+    """
+    return {
+        prefix: (severity, categories.get(prefix, FindingCategory.STYLE))
+        for prefix, severity in severities.items()
+    }
+
 
 class RuffAnalyzer(Analyzer):
-    """Python code analyzer using Ruff linter."""
+    """Python code analyzer using Ruff linter.
+
+    Single files are checked by one ``ruff server`` process kept running
+    across calls, which saves spawning Ruff for every file; call ``aclose``
+    to stop it. If the server cannot be started or fails, the analyzer falls
+    back to running ``ruff check``.
+    """
 
     SEVERITY_MAP = {
         "E": Severity.HIGH,      # Error
@@ -35,10 +289,21 @@ class RuffAnalyzer(Analyzer):
         "I": FindingCategory.STYLE,
     }
 
-    def __init__(self, config: Optional[Any] = None) -> None:
-        """Initialize Ruff analyzer."""
+    # (severity, category) per rule prefix, so each issue needs one lookup
+    _PREFIX_TABLE = _prefix_table(SEVERITY_MAP, CATEGORY_MAP)
+    _DEFAULT_PREFIX = (Severity.MEDIUM, FindingCategory.STYLE)
+
+    def __init__(self, config: Optional[Any] = None, use_server: bool = True) -> None:
+        """Initialize Ruff analyzer.
+
+        Args:
+            config: Optional configuration
+            use_server: Check single files with a long-lived ``ruff server``
+        """
         super().__init__(config)
         self.name = "RuffAnalyzer"
+        self.use_server = use_server
+        self._server_start: Optional[asyncio.Future[_RuffServer]] = None
 
     async def analyze(self, context: dict[str, Any]) -> list[Finding]:
         """Analyze Python code using Ruff.
@@ -52,79 +317,194 @@ class RuffAnalyzer(Analyzer):
             List of findings from Ruff
         """
         file_path = context.get("file_path", "unknown.py")
-        code = context.get("code", "")
-
-        if not code:
+        # Dispatchers only call analyze for supported contexts; this guard
+        # is for direct callers and never touches the code
+        if not file_path.endswith(".py") or not context.get("code"):
             return []
 
-        # Check if this is Python
-        if not file_path.endswith(".py"):
-            return []
+        server = await self._get_server()
+        if server is not None:
+            try:
+                diagnostics = await asyncio.wait_for(
+                    server.diagnostics(context["code"]), RUFF_TIMEOUT_SECONDS
+                )
+            except (TimeoutError, ConnectionError) as e:
+                logger.warning("ruff_server_failed", error=str(e) or type(e).__name__)
+                self.use_server = False
+                await self.aclose()
+            else:
+                findings = [
+                    finding
+                    for finding in (
+                        self._issue_to_finding(_diagnostic_to_issue(diagnostic), file_path)
+                        for diagnostic in diagnostics
+                    )
+                    if finding is not None
+                ]
+                logger.info("ruff_analysis_complete", file_path=file_path, findings=len(findings))
+                return findings
 
-        try:
-            # Run ruff on the code
-            result = subprocess.run(
-                ["ruff", "check", "--output-format=json", "-"],
-                input=code.encode("utf-8"),
-                capture_output=True,
-                timeout=30,
-            )
+        return (await self.analyze_batch([context])).get(file_path, [])
 
-            if result.returncode == 0:
-                # No issues found
-                logger.info("ruff_analysis_clean", file_path=file_path)
-                return []
+    async def aclose(self) -> None:
+        """Stop the Ruff server, if one was started."""
+        start, self._server_start = self._server_start, None
+        if start is None:
+            return
+        if not start.done():
+            start.cancel()
+        elif not start.cancelled() and start.exception() is None:
+            await start.result().close()
 
-            # Parse JSON output
-            try:
-                issues = json.loads(result.stdout.decode("utf-8"))
-            except json.JSONDecodeError:
-                logger.warning("ruff_json_parse_failed", output=result.stdout[:200])
-                return []
-
-            # Convert to findings
-            findings = []
-            for issue in issues:
-                try:
-                    code_prefix = issue.get("code", "E")[0]
-                    severity = self.SEVERITY_MAP.get(code_prefix, Severity.MEDIUM)
-                    category = self.CATEGORY_MAP.get(code_prefix, FindingCategory.STYLE)
-
-                    location = Location(
-                        file_path=file_path,
-                        line_start=issue.get("location", {}).get("row", 1),
-                        column_start=issue.get("location", {}).get("column", 1),
-                    )
+    async def _get_server(self) -> Optional[_RuffServer]:
+        """Return the running Ruff server, starting it on first use.
 
-                    finding = Finding(
-                        id=f"ruff-{file_path}-{issue.get('code')}",
-                        severity=severity,
-                        category=category,
-                        title=f"{issue.get('code')}: {issue.get('message', 'Unknown issue')}",
-                        message=issue.get("message", ""),
-                        location=location,
-                        suggestion=issue.get("fix", {}).get("message") if issue.get("fix") else None,
-                        analyzer=self.name,
-                        metadata={"rule": issue.get("code"), "url": issue.get("url")},
-                    )
-                    findings.append(finding)
+        Returns None when the server is disabled or cannot be started, in
+        which case it stays disabled for this analyzer.
+        """
+        if not self.use_server:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._server_start is None or self._server_start.get_loop() is not loop:
+            # A server started under another (finished) event loop is unusable;
+            # its process is killed when its transport is collected
+            self._server_start = asyncio.ensure_future(_RuffServer.start())
+        try:
+            # Shielded so a caller being cancelled does not abort a shared start
+            return await asyncio.shield(self._server_start)
+        except (OSError, TimeoutError) as e:
+            # OSError covers FileNotFoundError and ConnectionError
+            logger.warning("ruff_server_unavailable", error=str(e) or type(e).__name__)
+            self.use_server = False
+            self._server_start = None
+            return None
 
-                except (KeyError, ValueError) as e:
-                    logger.warning("ruff_finding_parse_failed", error=str(e), issue=issue)
-                    continue
+    async def analyze_batch(self, contexts: list[dict[str, Any]]) -> dict[str, list[Finding]]:
+        """Analyze several Python files with a single Ruff run.
 
-            logger.info("ruff_analysis_complete", file_path=file_path, findings=len(findings))
-            return findings
+        Ruff's startup cost is paid once per batch instead of once per file.
+        The sources are written to a temporary directory under the current
+        directory, so Ruff resolves the project's settings as it does for
+        ``ruff check`` run there, and the issues reported for each temporary
+        file are mapped back to its path.
 
-        except subprocess.TimeoutExpired:
-            logger.error("ruff_timeout", file_path=file_path)
-            return []
+        Args:
+            contexts: Analysis contexts, each shaped as for ``analyze``
+
+        Returns:
+            Mapping of file path to findings for every Python context with code
+        """
+        contexts = [
+            context
+            for context in contexts
+            if context.get("code") and context.get("file_path", "").endswith(".py")
+        ]
+        if not contexts:
+            return {}
+        file_paths = [context["file_path"] for context in contexts]
+        empty: dict[str, list[Finding]] = {file_path: [] for file_path in file_paths}
+
+        try:
+            with tempfile.TemporaryDirectory(
+                prefix=".professor-ruff-", dir=os.getcwd()
+            ) as directory:
+                sources = await asyncio.to_thread(_write_sources, directory, contexts)
+                results = await self._run_ruff(sources, file_paths)
+        except TimeoutError:
+            logger.error("ruff_timeout", files=len(file_paths))
+            return empty
         except FileNotFoundError:
             logger.warning("ruff_not_installed")
-            return []
+            return empty
+        except _JSON_ERRORS:
+            logger.warning("ruff_json_parse_failed", files=len(file_paths))
+            return empty
         except Exception as e:
-            logger.error("ruff_analysis_failed", error=str(e), file_path=file_path)
-            return []
+            logger.error("ruff_analysis_failed", error=str(e), files=len(file_paths))
+            return empty
+
+        for file_path, findings in results.items():
+            logger.info("ruff_analysis_complete", file_path=file_path, findings=len(findings))
+        return results
+
+    async def _run_ruff(
+        self, sources: list[str], file_paths: list[str]
+    ) -> dict[str, list[Finding]]:
+        """Run Ruff over ``sources``, converting issues as its JSON output streams in.
+
+        Args:
+            sources: Files to check; the i-th reports as ``file_paths[i]``
+            file_paths: Repository paths of the sources
+
+        Raises:
+            TimeoutError: If Ruff runs longer than ``RUFF_TIMEOUT_SECONDS``
+        """
+        process = await asyncio.create_subprocess_exec(
+            "ruff",
+            "check",
+            "--no-cache",
+            "--output-format=json",
+            *sources,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            return await asyncio.wait_for(
+                self._collect_findings(process, sources, file_paths), RUFF_TIMEOUT_SECONDS
+            )
+        finally:
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+
+    async def _collect_findings(
+        self, process: asyncio.subprocess.Process, sources: list[str], file_paths: list[str]
+    ) -> dict[str, list[Finding]]:
+        """Convert a running Ruff process's output into findings per file."""
+        assert process.stdout is not None
+        by_source = {
+            os.path.basename(source): file_path
+            for source, file_path in zip(sources, file_paths, strict=True)
+        }
+        results: dict[str, list[Finding]] = {file_path: [] for file_path in file_paths}
+
+        async for issue in _iter_json_array(process.stdout):
+            file_path = by_source.get(os.path.basename(issue.get("filename") or ""))
+            if file_path is None:
+                continue
+            finding = self._issue_to_finding(issue, file_path)
+            if finding is not None:
+                results[file_path].append(finding)
+        return results
+
+    def _issue_to_finding(self, issue: dict[str, Any], file_path: str) -> Optional[Finding]:
+        """Convert one Ruff JSON issue to a finding, or None if it is malformed."""
+        try:
+            code_prefix = issue.get("code", "E")[0]
+            severity, category = self._PREFIX_TABLE.get(code_prefix, self._DEFAULT_PREFIX)
+
+            location = Location(
+                file_path=file_path,
+                line_start=issue.get("location", {}).get("row", 1),
+                column_start=issue.get("location", {}).get("column", 1),
+            )
+
+            return Finding(
+                id=f"ruff-{file_path}-{issue.get('code')}",
+                severity=severity,
+                category=category,
+                title=f"{issue.get('code')}: {issue.get('message', 'Unknown issue')}",
+                message=issue.get("message", ""),
+                location=location,
+                suggestion=issue.get("fix", {}).get("message") if issue.get("fix") else None,
+                analyzer=self.name,
+                metadata={"rule": issue.get("code"), "url": issue.get("url")},
+            )
+
+        except (KeyError, ValueError) as e:
+            logger.warning("ruff_finding_parse_failed", error=str(e), issue=issue)
+            return None
 
     def supports(self, context: dict[str, Any]) -> bool:
         """Check if this analyzer supports the context.
@@ -137,3 +517,14 @@ class RuffAnalyzer(Analyzer):
         """
         file_path = context.get("file_path", "")
         return file_path.endswith(".py") and "code" in context
+
+
+def _write_sources(directory: str, contexts: list[dict[str, Any]]) -> list[str]:
+    """Write each context's code to ``directory``, returning the file paths in order."""
+    sources = []
+    for index, context in enumerate(contexts):
+        source = os.path.join(directory, f"{index}.py")
+        with open(source, "w", encoding="utf-8", newline="") as f:
+            f.write(context["code"])
+        sources.append(source)
+    return sources
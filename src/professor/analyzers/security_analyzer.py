@@ -1,19 +1,52 @@
 """Security analyzer for detecting vulnerabilities and secrets."""
 
+import asyncio
+import os
 import re
+from array import array
 from typing import Any, Optional
 import structlog
 
 from professor.core import Analyzer, Finding, FindingCategory, Location, Severity
+from professor.core.executor import PROCESS_POOL_MIN_SIZE, run_in_process
+from professor.core.line_index import (
+    build_newline_offsets,
+    cached_newline_offsets,
+    get_newline_offsets,
+    line_span,
+)
+from professor.core.pattern_scan import PatternSet
 
 logger = structlog.get_logger()
 
+# Substrings marking a matched secret as an example/dummy value
+_DUMMY_RE = re.compile(r"example|dummy|fake|test|sample|placeholder|your_|xxx|\*\*\*")
+
+# A line whose first non-blank characters start a ``#`` or ``//`` comment
+_COMMENT_LINE_RE = re.compile(r"\s*(?:#|//)")
+
+# Patterns matched regardless of case: variable and key names such as
+# PASSWORD or Api_Key, and call names that other languages capitalize
+# (Execute, Subprocess). The rest match fixed-case token formats (AKIA,
+# ghp_, eyJ, PEM headers) or case-sensitive identifiers (pickle, eval,
+# hashlib).
+_CASE_INSENSITIVE = frozenset(
+    {
+        "Generic API Key",
+        "Generic Secret",
+        "Password in Code",
+        "Hardcoded Password",
+        "SQL Injection",
+        "Command Injection",
+    }
+)
+
 
 class SecurityAnalyzer(Analyzer):
     """Security analyzer for detecting common vulnerabilities."""
 
-    # Common secret patterns
-    SECRET_PATTERNS = {
+    # Common secret patterns, compiled once at class creation
+    _SECRET_SOURCES = {
         "AWS Access Key": r"AKIA[0-9A-Z]{16}",
         "GitHub Token": r"ghp_[0-9a-zA-Z]{36}",
         "Generic API Key": r"api[_-]?key['\"]?\s*[:=]\s*['\"]([0-9a-zA-Z\-_]{20,})['\"]",
@@ -22,9 +55,13 @@ class SecurityAnalyzer(Analyzer):
         "Password in Code": r"password['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]",
         "JWT Token": r"eyJ[A-Za-z0-9-_=]+\.eyJ[A-Za-z0-9-_=]+\.[A-Za-z0-9-_.+/=]*",
     }
+    SECRET_PATTERNS: dict[str, re.Pattern[str]] = {
+        secret_type: re.compile(pattern, re.IGNORECASE if secret_type in _CASE_INSENSITIVE else 0)
+        for secret_type, pattern in _SECRET_SOURCES.items()
+    }
 
     # Security vulnerability patterns
-    VULNERABILITY_PATTERNS = {
+    _VULNERABILITY_SOURCES: dict[str, dict[str, Any]] = {
         "SQL Injection": {
             "pattern": r"(execute|cursor\.execute)\s*\([^)]*\.format\s*\(",
             "message": "Potential SQL injection vulnerability - user input in SQL query",
@@ -56,6 +93,50 @@ class SecurityAnalyzer(Analyzer):
             "severity": Severity.MEDIUM,
         },
     }
+    VULNERABILITY_PATTERNS: dict[str, dict[str, Any]] = {
+        vuln_name: {
+            **vuln_config,
+            "pattern": re.compile(
+                vuln_config["pattern"], re.IGNORECASE if vuln_name in _CASE_INSENSITIVE else 0
+            ),
+        }
+        for vuln_name, vuln_config in _VULNERABILITY_SOURCES.items()
+    }
+
+    # Literals of which every match of the named pattern contains one, so a
+    # pattern is skipped for files containing none of them (compared
+    # case-insensitively for case-insensitive patterns)
+    PATTERN_ANCHORS = {
+        "AWS Access Key": ("AKIA",),
+        "GitHub Token": ("ghp_",),
+        "Generic API Key": ("api",),
+        "Private Key": ("-----BEGIN ",),
+        "Generic Secret": ("secret",),
+        "Password in Code": ("password",),
+        "JWT Token": ("eyJ",),
+        "SQL Injection": ("execute",),
+        "Command Injection": ("os.system", "subprocess."),
+        "Hardcoded Password": ("password",),
+        "Unsafe Deserialization": ("pickle.load",),
+        "eval() Usage": ("eval",),
+        "Weak Hash": ("hashlib.",),
+    }
+
+    # Each detector's patterns scanned together (with Hyperscan when
+    # installed), so a file is scanned once to find the lines any pattern
+    # can match on
+    _SECRET_SCAN = PatternSet(
+        [pattern.pattern for pattern in SECRET_PATTERNS.values()],
+        [pattern.flags for pattern in SECRET_PATTERNS.values()],
+        name="SecurityAnalyzer",
+        anchors=list(map(PATTERN_ANCHORS.get, SECRET_PATTERNS)),
+    )
+    _VULNERABILITY_SCAN = PatternSet(
+        [vuln_config["pattern"].pattern for vuln_config in VULNERABILITY_PATTERNS.values()],
+        [vuln_config["pattern"].flags for vuln_config in VULNERABILITY_PATTERNS.values()],
+        name="SecurityAnalyzer",
+        anchors=list(map(PATTERN_ANCHORS.get, VULNERABILITY_PATTERNS)),
+    )
 
     def __init__(self, config: Optional[Any] = None) -> None:
         """Initialize security analyzer."""
@@ -79,16 +160,78 @@ class SecurityAnalyzer(Analyzer):
         if not code:
             return []
 
-        findings = []
+        secret_findings, vuln_findings = self._scan(
+            file_path, code, get_newline_offsets(context)
+        )
+        self._log_complete(file_path, secret_findings, vuln_findings)
+        return secret_findings + vuln_findings
 
-        # Check for secrets
-        secret_findings = self._detect_secrets(file_path, code)
-        findings.extend(secret_findings)
+    async def analyze_batch(self, contexts: list[dict[str, Any]]) -> dict[str, list[Finding]]:
+        """Analyze several files, spreading them over the shared process pool.
 
-        # Check for vulnerabilities
-        vuln_findings = self._detect_vulnerabilities(file_path, code)
-        findings.extend(vuln_findings)
+        Files are grouped into tasks of at least ``PROCESS_POOL_MIN_SIZE``
+        characters, one group per CPU for large batches, so pickling stays
+        cheap next to the scan. A batch that fits in one task runs inline.
+
+        Args:
+            contexts: Analysis contexts, each shaped as for ``analyze``
 
+        Returns:
+            Mapping of file path to findings for every context with code
+        """
+        files = [
+            (context.get("file_path", "unknown"), context["code"], cached_newline_offsets(context))
+            for context in contexts
+            if context.get("code")
+        ]
+        total = sum(len(code) for _, code, _ in files)
+        target = max(PROCESS_POOL_MIN_SIZE, total // (os.cpu_count() or 1))
+        groups: list[list[tuple[str, str, Optional[array]]]] = [[]]
+        size = 0
+        for file in files:
+            if size >= target:
+                groups.append([])
+                size = 0
+            groups[-1].append(file)
+            size += len(file[1])
+
+        if len(groups) == 1:
+            scanned = [self._scan_files(groups[0])]
+        else:
+            scanned = await asyncio.gather(
+                *(run_in_process(self._scan_files, group) for group in groups)
+            )
+
+        results: dict[str, list[Finding]] = {}
+        for group, group_results in zip(groups, scanned, strict=True):
+            for (file_path, _, _), (secret_findings, vuln_findings) in zip(
+                group, group_results, strict=True
+            ):
+                self._log_complete(file_path, secret_findings, vuln_findings)
+                results[file_path] = secret_findings + vuln_findings
+        return results
+
+    def _scan_files(
+        self, files: list[tuple[str, str, Optional[array]]]
+    ) -> list[tuple[list[Finding], list[Finding]]]:
+        """Scan ``(file_path, code, offsets)`` triples; synchronous so it can run in a worker."""
+        return [self._scan(file_path, code, offsets) for file_path, code, offsets in files]
+
+    def _scan(
+        self, file_path: str, code: str, offsets: Optional[array] = None
+    ) -> tuple[list[Finding], list[Finding]]:
+        """Return the secret and vulnerability findings for one file."""
+        if offsets is None:
+            offsets = build_newline_offsets(code)
+        return (
+            self._detect_secrets(file_path, code, offsets),
+            self._detect_vulnerabilities(file_path, code, offsets),
+        )
+
+    def _log_complete(
+        self, file_path: str, secret_findings: list[Finding], vuln_findings: list[Finding]
+    ) -> None:
+        """Log the finding counts for one analyzed file."""
         logger.info(
             "security_analysis_complete",
             file_path=file_path,
@@ -96,43 +239,55 @@ class SecurityAnalyzer(Analyzer):
             vulnerabilities=len(vuln_findings),
         )
 
-        return findings
-
-    def _detect_secrets(self, file_path: str, code: str) -> list[Finding]:
+    def _detect_secrets(
+        self, file_path: str, code: str, offsets: Optional[array] = None
+    ) -> list[Finding]:
         """Detect potential secrets in code.
 
         Args:
             file_path: File path
             code: Code content
+            offsets: Newline index of ``code``, built if not given
 
         Returns:
             List of findings for detected secrets
         """
         findings = []
-        lines = code.split("\n")
-
-        for secret_type, pattern in self.SECRET_PATTERNS.items():
-            for line_num, line in enumerate(lines, 1):
-                matches = re.finditer(pattern, line, re.IGNORECASE)
+        active = self._SECRET_SCAN.active(code)
+        lines = self._candidate_lines(self._SECRET_SCAN, code, offsets, active)
+        # Per-file and per-pattern parts of each finding are built once
+        id_prefix = f"secret-{file_path}-"
+
+        for index, (secret_type, pattern) in enumerate(self.SECRET_PATTERNS.items()):
+            if index not in active:
+                continue
+            id_suffix = f"-{secret_type}"
+            title = f"Potential {secret_type} exposed in code"
+            message = (
+                f"Found what appears to be a {secret_type}. "
+                "Secrets should never be committed to source code."
+            )
+            for line_num, start, end in lines:
+                matches = pattern.finditer(code, start, end)
                 for match in matches:
-                    # Skip comments and example values
+                    line = code[start:end]
+                    # Skip example values (comment lines are never candidates)
                     if self._is_false_positive(line, match.group(0)):
                         continue
 
                     location = Location(
                         file_path=file_path,
                         line_start=line_num,
-                        column_start=match.start() + 1,
-                        column_end=match.end() + 1,
+                        column_start=match.start() - start + 1,
+                        column_end=match.end() - start + 1,
                     )
 
                     finding = Finding(
-                        id=f"secret-{file_path}-{line_num}-{secret_type}",
+                        id=f"{id_prefix}{line_num}{id_suffix}",
                         severity=Severity.CRITICAL,
                         category=FindingCategory.SECURITY,
-                        title=f"Potential {secret_type} exposed in code",
-                        message=f"Found what appears to be a {secret_type}. "
-                        "Secrets should never be committed to source code.",
+                        title=title,
+                        message=message,
                         location=location,
                         suggestion="Move secrets to environment variables or secret management system",
                         analyzer=self.name,
@@ -142,44 +297,78 @@ class SecurityAnalyzer(Analyzer):
 
         return findings
 
-    def _detect_vulnerabilities(self, file_path: str, code: str) -> list[Finding]:
+    def _detect_vulnerabilities(
+        self, file_path: str, code: str, offsets: Optional[array] = None
+    ) -> list[Finding]:
         """Detect security vulnerabilities in code.
 
         Args:
             file_path: File path
             code: Code content
+            offsets: Newline index of ``code``, built if not given
 
         Returns:
             List of vulnerability findings
         """
         findings = []
-        lines = code.split("\n")
-
-        for vuln_name, vuln_config in self.VULNERABILITY_PATTERNS.items():
+        active = self._VULNERABILITY_SCAN.active(code)
+        lines = self._candidate_lines(self._VULNERABILITY_SCAN, code, offsets, active)
+        id_prefix = f"vuln-{file_path}-"
+        # One location and snippet per line, shared by every pattern hitting it
+        shared: dict[int, tuple[Location, str]] = {}
+
+        for index, (vuln_name, vuln_config) in enumerate(self.VULNERABILITY_PATTERNS.items()):
+            if index not in active:
+                continue
             pattern = vuln_config["pattern"]
+            id_suffix = "-" + vuln_name.replace(" ", "-")
 
-            for line_num, line in enumerate(lines, 1):
-                if re.search(pattern, line, re.IGNORECASE):
-                    # Skip comments
-                    if line.strip().startswith("#") or line.strip().startswith("//"):
-                        continue
-
-                    location = Location(file_path=file_path, line_start=line_num)
+            for line_num, start, end in lines:
+                if pattern.search(code, start, end):
+                    if line_num not in shared:
+                        shared[line_num] = (
+                            Location(file_path=file_path, line_start=line_num),
+                            code[start:end].strip(),
+                        )
+                    location, snippet = shared[line_num]
 
                     finding = Finding(
-                        id=f"vuln-{file_path}-{line_num}-{vuln_name.replace(' ', '-')}",
+                        id=f"{id_prefix}{line_num}{id_suffix}",
                         severity=vuln_config["severity"],
                         category=FindingCategory.SECURITY,
                         title=vuln_name,
                         message=vuln_config["message"],
                         location=location,
                         analyzer=self.name,
-                        code_snippet=line.strip(),
+                        code_snippet=snippet,
                     )
                     findings.append(finding)
 
         return findings
 
+    @staticmethod
+    def _candidate_lines(
+        patterns: PatternSet,
+        code: str,
+        offsets: Optional[array],
+        active: Optional[tuple[int, ...]] = None,
+    ) -> list[tuple[int, int, int]]:
+        """Return ``(line number, start, end)`` for lines a pattern scan touches.
+
+        Only these lines can match an individual pattern, so the per-pattern
+        checks skip the rest of the file. Patterns are then run over the
+        line's span of ``code`` (``pos``/``endpos``) rather than a copy of it.
+        Comment lines are dropped here, once, since no detector reports them.
+        """
+        if offsets is None:
+            offsets = build_newline_offsets(code)
+        lines = []
+        for line_num in patterns.candidate_lines(code, offsets, active):
+            start, end = line_span(code, offsets, line_num)
+            if not _COMMENT_LINE_RE.match(code, start, end):
+                lines.append((line_num, start, end))
+        return lines
+
     def _is_false_positive(self, line: str, match: str) -> bool:
         """Check if a secret detection is likely a false positive.
 
@@ -195,20 +384,7 @@ class SecurityAnalyzer(Analyzer):
             return True
 
         # Skip example/dummy values
-        dummy_indicators = [
-            "example",
-            "dummy",
-            "fake",
-            "test",
-            "sample",
-            "placeholder",
-            "your_",
-            "xxx",
-            "***",
-        ]
-
-        match_lower = match.lower()
-        return any(indicator in match_lower for indicator in dummy_indicators)
+        return _DUMMY_RE.search(match.lower()) is not None
 
     def supports(self, context: dict[str, Any]) -> bool:
         """Check if this analyzer supports the context.
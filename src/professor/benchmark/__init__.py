@@ -1,6 +1,7 @@
 """Benchmarking tools for evaluating review quality."""
 
 from professor.benchmark.harness import (
+    CorpusFile,
     CurationStatus,
     DEFAULT_LANGUAGE_TARGETS,
     BenchmarkCase,
@@ -15,6 +16,7 @@ from professor.benchmark.harness import (
     benchmark_report_json,
     benchmark_report_markdown,
     evaluate_benchmark,
+    evaluate_benchmark_with_scorecards,
     evaluate_case,
     evaluate_curation_status,
     evaluate_release_gate,
@@ -43,6 +45,7 @@ __all__ = [
     "DatasetValidation",
     "evaluate_case",
     "evaluate_benchmark",
+    "evaluate_benchmark_with_scorecards",
     "evaluate_curation_status",
     "evaluate_release_gate",
     "generate_curation_work_items",
@@ -54,6 +57,7 @@ __all__ = [
     "scorecards_by_repo_family",
     "validate_dataset_coverage",
     "update_corpus_cases",
+    "CorpusFile",
     "benchmark_report_markdown",
     "benchmark_report_json",
 ]
@@ -3,12 +3,19 @@
 from dataclasses import dataclass
 from collections import defaultdict
 import json
+import os
+from math import fsum
+from operator import attrgetter
 from pathlib import Path
-from statistics import fmean
-from typing import Any
+from typing import Any, Callable, cast
 
 from professor.core import FindingCategory, Severity
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast JSON parser
+    orjson = None  # type: ignore[assignment]
+
 
 DEFAULT_LANGUAGE_TARGETS: dict[str, int] = {
     "python": 10,
@@ -20,8 +27,21 @@ DEFAULT_LANGUAGE_TARGETS: dict[str, int] = {
     "cpp": 4,
 }
 
+# Severities counted for severe recall and that block a PR by default
+_SEVERE_SEVERITIES: frozenset[Severity] = frozenset((Severity.CRITICAL, Severity.HIGH))
+
+# Enum members by value, probed directly instead of calling the Enum class
+_SEVERITY_BY_VALUE: dict[str, Severity] = {severity.value: severity for severity in Severity}
+_CATEGORY_BY_VALUE: dict[str, FindingCategory] = {
+    category.value: category for category in FindingCategory
+}
+
+# Canonical LabeledFinding per (signature, severity, category), scoped to
+# one corpus load so labels do not outlive the dataset that holds them
+FindingPool = dict[tuple[str, Severity, FindingCategory], "LabeledFinding"]
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LabeledFinding:
     """Normalized finding used for benchmark labels and predictions."""
 
@@ -30,16 +50,36 @@ class LabeledFinding:
     category: FindingCategory
 
     @classmethod
-    def from_dict(cls, data: dict[str, str]) -> "LabeledFinding":
-        """Build finding from JSON-like mapping."""
-        return cls(
-            signature=data["signature"],
-            severity=Severity(data["severity"].lower()),
-            category=FindingCategory(data["category"].lower()),
-        )
+    def intern(
+        cls,
+        signature: str,
+        severity: Severity,
+        category: FindingCategory,
+        pool: FindingPool,
+    ) -> "LabeledFinding":
+        """Return the instance for a label in ``pool``, creating it on first use.
+
+        Corpora repeat the same labels across many cases; interning them
+        keeps one object per distinct label instead of one per occurrence.
+        """
+        key = (signature, severity, category)
+        finding = pool.get(key)
+        if finding is None:
+            finding = pool[key] = cls(signature, severity, category)
+        return finding
+
+    @classmethod
+    def from_dict(cls, data: dict[str, str], pool: FindingPool | None = None) -> "LabeledFinding":
+        """Build finding from JSON-like mapping, shared through ``pool`` if given."""
+        signature = data["signature"]
+        severity = _parse_severity(data["severity"])
+        category = _parse_category(data["category"])
+        if pool is None:
+            return cls(signature, severity, category)
+        return cls.intern(signature, severity, category, pool)
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkCase:
     """Single labeled PR case for benchmark evaluation."""
 
@@ -54,14 +94,14 @@ class BenchmarkCase:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkDataset:
     """Collection of benchmark cases."""
 
     cases: list[BenchmarkCase]
 
 
-@dataclass
+@dataclass(slots=True)
 class CaseMetrics:
     """Evaluation metrics for a benchmark case."""
 
@@ -77,7 +117,7 @@ class CaseMetrics:
     verdict_correct: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkMetrics:
     """Aggregate benchmark report."""
 
@@ -90,7 +130,7 @@ class BenchmarkMetrics:
     verdict_accuracy: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Scorecard:
     """Grouped benchmark scorecard."""
 
@@ -103,7 +143,7 @@ class Scorecard:
     verdict_accuracy: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DatasetValidation:
     """Validation status for benchmark corpus coverage."""
 
@@ -113,7 +153,7 @@ class DatasetValidation:
     language_counts: dict[str, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class CurationStatus:
     """Curation completeness status for benchmark corpus."""
 
@@ -126,7 +166,7 @@ class CurationStatus:
     issues: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReleaseGateThresholds:
     """Thresholds required to pass benchmark release gate."""
 
@@ -137,7 +177,7 @@ class ReleaseGateThresholds:
     min_verdict_accuracy: float = 0.9
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleaseGateResult:
     """Result of benchmark release-gate evaluation."""
 
@@ -146,49 +186,107 @@ class ReleaseGateResult:
     thresholds: ReleaseGateThresholds
 
 
-def _safe_div(numerator: float, denominator: float) -> float:
-    return 0.0 if denominator == 0 else numerator / denominator
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, straight from its bytes when ``orjson`` is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    """Write ``payload`` as JSON indented by two spaces.
+
+    The file is replaced atomically, so readers and interrupted writes
+    never see it half written. Non-ASCII text is written as UTF-8 rather
+    than escaped, as ``orjson`` does, so the file is the same with or
+    without it.
+    """
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        temporary.write_bytes(data)
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def _parse_severity(value: str) -> Severity:
+    """Return the Severity for a label, in any case.
+
+    Raises:
+        ValueError: If the label is not a severity, as ``Severity(...)`` would
+    """
+    value = value.lower()
+    severity = _SEVERITY_BY_VALUE.get(value)
+    if severity is None:
+        raise ValueError(f"{value!r} is not a valid Severity")
+    return severity
+
+
+def _parse_category(value: str) -> FindingCategory:
+    """Return the FindingCategory for a label, in any case.
+
+    Raises:
+        ValueError: If the label is not a category, as ``FindingCategory(...)`` would
+    """
+    value = value.lower()
+    category = _CATEGORY_BY_VALUE.get(value)
+    if category is None:
+        raise ValueError(f"{value!r} is not a valid FindingCategory")
+    return category
 
 
-def _finding_key(finding: LabeledFinding) -> str:
-    return f"{finding.signature}|{finding.severity.value}|{finding.category.value}"
+def _safe_div(numerator: float, denominator: float) -> float:
+    return 0.0 if denominator == 0 else numerator / denominator
 
 
-def _is_severe(finding: LabeledFinding) -> bool:
-    return finding.severity in {Severity.CRITICAL, Severity.HIGH}
+# Findings match when signature, severity and category are all equal
+_FindingKey = tuple[str, Severity, FindingCategory]
 
 
-def _infer_blocked(findings: list[LabeledFinding]) -> bool:
-    return any(_is_severe(finding) for finding in findings)
+def _key_sets(findings: list[LabeledFinding]) -> tuple[set[_FindingKey], set[_FindingKey]]:
+    """Return the keys of all findings and of the severe ones, building each key once."""
+    keys: set[_FindingKey] = set()
+    severe: set[_FindingKey] = set()
+    for finding in findings:
+        key = (finding.signature, finding.severity, finding.category)
+        keys.add(key)
+        if finding.severity in _SEVERE_SEVERITIES:
+            severe.add(key)
+    return keys, severe
 
 
 def evaluate_case(case: BenchmarkCase) -> CaseMetrics:
     """Evaluate one labeled case and compute precision/recall/verdict."""
-    expected = {_finding_key(finding) for finding in case.expected_findings}
-    predicted = {_finding_key(finding) for finding in case.predicted_findings}
+    expected, expected_severe = _key_sets(case.expected_findings)
+    predicted, predicted_severe = _key_sets(case.predicted_findings)
 
+    # Counts and ratios follow from the set sizes, without building the
+    # set differences or calling helpers per case
     tp = len(expected & predicted)
-    fp = len(predicted - expected)
-    fn = len(expected - predicted)
+    fp = len(predicted) - tp
+    fn = len(expected) - tp
 
-    precision = _safe_div(tp, tp + fp)
-    recall = _safe_div(tp, tp + fn)
-    f1 = _safe_div(2 * precision * recall, precision + recall)
+    precision = tp / len(predicted) if predicted else 0.0
+    recall = tp / len(expected) if expected else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
 
-    expected_severe = {_finding_key(finding) for finding in case.expected_findings if _is_severe(finding)}
-    predicted_severe = {
-        _finding_key(finding) for finding in case.predicted_findings if _is_severe(finding)
-    }
-    severe_tp = len(expected_severe & predicted_severe)
-    severe_recall = _safe_div(severe_tp, len(expected_severe))
+    severe_recall = (
+        len(expected_severe & predicted_severe) / len(expected_severe) if expected_severe else 0.0
+    )
 
+    # A case without a labeled verdict is blocked when it has a severe finding
     expected_blocked = case.expected_blocked
     if expected_blocked is None:
-        expected_blocked = _infer_blocked(case.expected_findings)
+        expected_blocked = bool(expected_severe)
 
     predicted_blocked = case.predicted_blocked
     if predicted_blocked is None:
-        predicted_blocked = _infer_blocked(case.predicted_findings)
+        predicted_blocked = bool(predicted_severe)
 
     return CaseMetrics(
         case_id=case.case_id,
@@ -206,7 +304,38 @@ def evaluate_case(case: BenchmarkCase) -> CaseMetrics:
 
 def evaluate_benchmark(dataset: BenchmarkDataset) -> BenchmarkMetrics:
     """Evaluate all cases in dataset."""
-    if not dataset.cases:
+    return _aggregate_metrics([evaluate_case(case) for case in dataset.cases])
+
+
+def evaluate_benchmark_with_scorecards(
+    dataset: BenchmarkDataset,
+) -> tuple[BenchmarkMetrics, list[Scorecard], list[Scorecard]]:
+    """Evaluate all cases once and score them by language and by repo family.
+
+    Same results as ``evaluate_benchmark``, ``scorecards_by_language`` and
+    ``scorecards_by_repo_family``, from one sweep over the cases.
+
+    Returns:
+        Aggregate report, language scorecards and repo family scorecards
+    """
+    case_metrics: list[CaseMetrics] = []
+    by_language: dict[str, list[CaseMetrics]] = defaultdict(list)
+    by_repo_family: dict[str, list[CaseMetrics]] = defaultdict(list)
+    for case in dataset.cases:
+        metrics = evaluate_case(case)
+        case_metrics.append(metrics)
+        by_language[case.language].append(metrics)
+        by_repo_family[case.repo_family].append(metrics)
+    return (
+        _aggregate_metrics(case_metrics),
+        _build_scorecards(by_language),
+        _build_scorecards(by_repo_family),
+    )
+
+
+def _aggregate_metrics(case_metrics: list[CaseMetrics]) -> BenchmarkMetrics:
+    """Average per-case metrics into a benchmark report."""
+    if not case_metrics:
         return BenchmarkMetrics(
             case_metrics=[],
             total_cases=0,
@@ -217,19 +346,43 @@ def evaluate_benchmark(dataset: BenchmarkDataset) -> BenchmarkMetrics:
             verdict_accuracy=0.0,
         )
 
-    case_metrics = [evaluate_case(case) for case in dataset.cases]
     total = len(case_metrics)
 
+    # One pass over the metrics for all five sums. Each float sum carries a
+    # Neumaier compensation term, so means that fall on a rounding tie do not
+    # depend on summation order or the Python version
+    precision = recall = f1 = severe_recall = 0.0
+    precision_c = recall_c = f1_c = severe_recall_c = 0.0
+    verdicts_correct = 0
+    for metric in case_metrics:
+        value = metric.precision
+        t = precision + value
+        precision_c += (precision - t) + value if precision >= value else (value - t) + precision
+        precision = t
+        value = metric.recall
+        t = recall + value
+        recall_c += (recall - t) + value if recall >= value else (value - t) + recall
+        recall = t
+        value = metric.f1
+        t = f1 + value
+        f1_c += (f1 - t) + value if f1 >= value else (value - t) + f1
+        f1 = t
+        value = metric.severe_recall
+        t = severe_recall + value
+        severe_recall_c += (
+            (severe_recall - t) + value if severe_recall >= value else (value - t) + severe_recall
+        )
+        severe_recall = t
+        verdicts_correct += metric.verdict_correct
+
     return BenchmarkMetrics(
         case_metrics=case_metrics,
         total_cases=total,
-        mean_precision=round(sum(metric.precision for metric in case_metrics) / total, 4),
-        mean_recall=round(sum(metric.recall for metric in case_metrics) / total, 4),
-        mean_f1=round(sum(metric.f1 for metric in case_metrics) / total, 4),
-        mean_severe_recall=round(sum(metric.severe_recall for metric in case_metrics) / total, 4),
-        verdict_accuracy=round(
-            _safe_div(sum(1 for metric in case_metrics if metric.verdict_correct), total), 4
-        ),
+        mean_precision=round((precision + precision_c) / total, 4),
+        mean_recall=round((recall + recall_c) / total, 4),
+        mean_f1=round((f1 + f1_c) / total, 4),
+        mean_severe_recall=round((severe_recall + severe_recall_c) / total, 4),
+        verdict_accuracy=round(verdicts_correct / total, 4),
     )
 
 
@@ -265,33 +418,65 @@ def evaluate_release_gate(
 
 
 def _build_scorecard(group: str, metrics: list[CaseMetrics]) -> Scorecard:
-    """Build scorecard for grouped metrics."""
+    """Build scorecard for grouped metrics.
+
+    Means are exact sums (``fsum``, as ``statistics.fmean`` uses) divided
+    by the count: the metrics are rounded to four places, so their means
+    often fall on a rounding tie that a plain running sum can tip either way.
+    """
     total = len(metrics)
+    if not total:
+        return Scorecard(group, 0, 0.0, 0.0, 0.0, 0.0, 0.0)
     return Scorecard(
         group=group,
         cases=total,
-        mean_precision=round(fmean(m.precision for m in metrics), 4),
-        mean_recall=round(fmean(m.recall for m in metrics), 4),
-        mean_f1=round(fmean(m.f1 for m in metrics), 4),
-        severe_recall=round(fmean(m.severe_recall for m in metrics), 4),
-        verdict_accuracy=round(_safe_div(sum(1 for m in metrics if m.verdict_correct), total), 4),
+        mean_precision=round(fsum([m.precision for m in metrics]) / total, 4),
+        mean_recall=round(fsum([m.recall for m in metrics]) / total, 4),
+        mean_f1=round(fsum([m.f1 for m in metrics]) / total, 4),
+        severe_recall=round(fsum([m.severe_recall for m in metrics]) / total, 4),
+        verdict_accuracy=round(sum([m.verdict_correct for m in metrics]) / total, 4),
     )
 
 
-def scorecards_by_language(dataset: BenchmarkDataset) -> list[Scorecard]:
-    """Compute scorecards grouped by language."""
+def _grouped_scorecards(
+    dataset: BenchmarkDataset,
+    case_metrics: list[CaseMetrics] | None,
+    group_of: Callable[[BenchmarkCase], str],
+) -> list[Scorecard]:
+    """Build one scorecard per group, evaluating the cases unless metrics are given."""
+    if case_metrics is None:
+        case_metrics = [evaluate_case(case) for case in dataset.cases]
     grouped: dict[str, list[CaseMetrics]] = defaultdict(list)
-    for case in dataset.cases:
-        grouped[case.language].append(evaluate_case(case))
-    return [_build_scorecard(language, metrics) for language, metrics in sorted(grouped.items())]
+    for case, metrics in zip(dataset.cases, case_metrics, strict=True):
+        grouped[group_of(case)].append(metrics)
+    return _build_scorecards(grouped)
 
 
-def scorecards_by_repo_family(dataset: BenchmarkDataset) -> list[Scorecard]:
-    """Compute scorecards grouped by repository family."""
-    grouped: dict[str, list[CaseMetrics]] = defaultdict(list)
-    for case in dataset.cases:
-        grouped[case.repo_family].append(evaluate_case(case))
-    return [_build_scorecard(family, metrics) for family, metrics in sorted(grouped.items())]
+def _build_scorecards(grouped: dict[str, list[CaseMetrics]]) -> list[Scorecard]:
+    """Build one scorecard per group, ordered by group name."""
+    return [_build_scorecard(group, metrics) for group, metrics in sorted(grouped.items())]
+
+
+def scorecards_by_language(
+    dataset: BenchmarkDataset, case_metrics: list[CaseMetrics] | None = None
+) -> list[Scorecard]:
+    """Compute scorecards grouped by language.
+
+    Pass ``case_metrics`` from ``evaluate_benchmark(dataset)`` to reuse them
+    instead of evaluating every case again.
+    """
+    return _grouped_scorecards(dataset, case_metrics, attrgetter("language"))
+
+
+def scorecards_by_repo_family(
+    dataset: BenchmarkDataset, case_metrics: list[CaseMetrics] | None = None
+) -> list[Scorecard]:
+    """Compute scorecards grouped by repository family.
+
+    Pass ``case_metrics`` from ``evaluate_benchmark(dataset)`` to reuse them
+    instead of evaluating every case again.
+    """
+    return _grouped_scorecards(dataset, case_metrics, attrgetter("repo_family"))
 
 
 def validate_dataset_coverage(
@@ -326,53 +511,47 @@ def validate_dataset_coverage(
     )
 
 
+def _scorecard_rows(cards: list[Scorecard]) -> str:
+    """Render scorecards as markdown table rows, each ending in a newline."""
+    return "".join(
+        [
+            f"| {card.group} | {card.cases} | {card.mean_precision:.4f} | {card.mean_recall:.4f} | "
+            f"{card.mean_f1:.4f} | {card.severe_recall:.4f} | {card.verdict_accuracy:.4f} |\n"
+            for card in cards
+        ]
+    )
+
+
 def benchmark_report_markdown(
     aggregate: BenchmarkMetrics,
     language_cards: list[Scorecard],
     repo_family_cards: list[Scorecard],
 ) -> str:
     """Render benchmark report as markdown."""
-    lines = [
-        "# Professor Benchmark Report",
-        "",
-        "## Aggregate",
-        "",
-        "| Metric | Value |",
-        "| --- | ---: |",
-        f"| Cases | {aggregate.total_cases} |",
-        f"| Mean Precision | {aggregate.mean_precision:.4f} |",
-        f"| Mean Recall | {aggregate.mean_recall:.4f} |",
-        f"| Mean F1 | {aggregate.mean_f1:.4f} |",
-        f"| Severe Recall | {aggregate.mean_severe_recall:.4f} |",
-        f"| Verdict Accuracy | {aggregate.verdict_accuracy:.4f} |",
-        "",
-        "## By Language",
-        "",
-        "| Language | Cases | Precision | Recall | F1 | Severe Recall | Verdict Accuracy |",
-        "| --- | ---: | ---: | ---: | ---: | ---: | ---: |",
-    ]
-    for card in language_cards:
-        lines.append(
-            f"| {card.group} | {card.cases} | {card.mean_precision:.4f} | {card.mean_recall:.4f} | "
-            f"{card.mean_f1:.4f} | {card.severe_recall:.4f} | {card.verdict_accuracy:.4f} |"
-        )
+    return f"""\
+# Professor Benchmark Report
 
-    lines.extend(
-        [
-            "",
-            "## By Repo Family",
-            "",
-            "| Repo Family | Cases | Precision | Recall | F1 | Severe Recall | Verdict Accuracy |",
-            "| --- | ---: | ---: | ---: | ---: | ---: | ---: |",
-        ]
-    )
-    for card in repo_family_cards:
-        lines.append(
-            f"| {card.group} | {card.cases} | {card.mean_precision:.4f} | {card.mean_recall:.4f} | "
-            f"{card.mean_f1:.4f} | {card.severe_recall:.4f} | {card.verdict_accuracy:.4f} |"
-        )
+## Aggregate
+
+| Metric | Value |
+| --- | ---: |
+| Cases | {aggregate.total_cases} |
+| Mean Precision | {aggregate.mean_precision:.4f} |
+| Mean Recall | {aggregate.mean_recall:.4f} |
+| Mean F1 | {aggregate.mean_f1:.4f} |
+| Severe Recall | {aggregate.mean_severe_recall:.4f} |
+| Verdict Accuracy | {aggregate.verdict_accuracy:.4f} |
+
+## By Language
+
+| Language | Cases | Precision | Recall | F1 | Severe Recall | Verdict Accuracy |
+| --- | ---: | ---: | ---: | ---: | ---: | ---: |
+{_scorecard_rows(language_cards)}
+## By Repo Family
 
-    return "\n".join(lines) + "\n"
+| Repo Family | Cases | Precision | Recall | F1 | Severe Recall | Verdict Accuracy |
+| --- | ---: | ---: | ---: | ---: | ---: | ---: |
+{_scorecard_rows(repo_family_cards)}"""
 
 
 def benchmark_report_json(
@@ -420,12 +599,17 @@ def benchmark_report_json(
 
 def load_benchmark_dataset(path: Path) -> BenchmarkDataset:
     """Load benchmark dataset JSON file."""
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = _read_json(path)
     cases: list[BenchmarkCase] = []
+    pool: FindingPool = {}
 
     for row in raw.get("cases", []):
-        expected = [LabeledFinding.from_dict(item) for item in row.get("expected_findings", [])]
-        predicted = [LabeledFinding.from_dict(item) for item in row.get("predicted_findings", [])]
+        expected = [
+            LabeledFinding.from_dict(item, pool) for item in row.get("expected_findings", [])
+        ]
+        predicted = [
+            LabeledFinding.from_dict(item, pool) for item in row.get("predicted_findings", [])
+        ]
         cases.append(
             BenchmarkCase(
                 case_id=row["case_id"],
@@ -462,33 +646,38 @@ def evaluate_curation_status(
         )
 
     pending: list[str] = []
-    language_totals: dict[str, int] = defaultdict(int)
-    language_curated: dict[str, int] = defaultdict(int)
+    # [total, curated] case counts per language, updated with one lookup per case
+    language_counts: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    # Which requirements any pending case misses, noted in the same pass
+    missing_source = False
+    missing_findings = False
 
     for case in dataset.cases:
-        language = case.language.lower()
-        language_totals[language] += 1
+        counts = language_counts[case.language.lower()]
+        counts[0] += 1
 
         has_findings = len(case.expected_findings) >= min_expected_findings
         has_source = bool(case.source_url.strip()) if require_source_url else True
 
         if has_findings and has_source:
-            language_curated[language] += 1
+            counts[1] += 1
         else:
             pending.append(case.case_id)
+            missing_findings = missing_findings or not has_findings
+            missing_source = missing_source or not has_source
 
     curated_cases = total - len(pending)
     by_language = {
-        language: round(_safe_div(language_curated.get(language, 0), count), 4)
-        for language, count in language_totals.items()
+        language: round(curated / count, 4)
+        for language, (count, curated) in language_counts.items()
     }
 
     issues: list[str] = []
     if curated_cases < total:
         issues.append(f"{len(pending)} case(s) still missing curation requirements.")
-    if require_source_url and any(not case.source_url.strip() for case in dataset.cases):
+    if missing_source:
         issues.append("Some cases are missing source_url metadata.")
-    if any(len(case.expected_findings) < min_expected_findings for case in dataset.cases):
+    if missing_findings:
         issues.append("Some cases are missing expected findings labels.")
 
     return CurationStatus(
@@ -543,10 +732,158 @@ def generate_corpus_template(
         },
         "cases": cases,
     }
-    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    _write_json(output_path, payload)
     return payload
 
 
+class CorpusFile:
+    """A corpus JSON file kept parsed across case updates.
+
+    The file is read on first use and its cases indexed by id, so each
+    update is a dictionary lookup. Changes stay in memory until ``save``
+    writes the whole file once.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open a corpus file.
+
+        Args:
+            path: Corpus JSON file; read on first use
+        """
+        self.path = path
+        self._raw: dict[str, Any] | None = None
+        self._index: dict[str, dict[str, Any]] = {}
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The parsed corpus document."""
+        return self._raw if self._raw is not None else self._load()
+
+    def update_case(
+        self,
+        case_id: str,
+        *,
+        source_url: str | None = None,
+        notes: str | None = None,
+        expected_finding: dict[str, str] | None = None,
+        predicted_finding: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Update one case's metadata/findings in memory.
+
+        Raises:
+            ValueError: If the case does not exist or is repeated, or a
+                finding is invalid; nothing is changed then
+        """
+        target_case = self._case(case_id)
+        if expected_finding is not None:
+            _validate_finding_payload(expected_finding)
+        if predicted_finding is not None:
+            _validate_finding_payload(predicted_finding)
+
+        if source_url is not None:
+            target_case["source_url"] = source_url
+        if notes is not None:
+            target_case["notes"] = notes
+        if expected_finding is not None:
+            target_case.setdefault("expected_findings", []).append(expected_finding)
+        if predicted_finding is not None:
+            target_case.setdefault("predicted_findings", []).append(predicted_finding)
+        return _case_update_summary(case_id, target_case)
+
+    def update_cases(self, updates: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Apply several case updates in memory, all or none.
+
+        Raises:
+            ValueError: If any update is invalid; nothing is changed then
+        """
+        # Validate first (fail-fast) before mutating.
+        for update in updates:
+            case_id = str(update.get("case_id", "")).strip()
+            if not case_id:
+                raise ValueError("Each update item must include non-empty 'case_id'.")
+            self._case(case_id)
+
+            if update.get("expected_finding") is not None:
+                _validate_finding_payload(update["expected_finding"])
+            if update.get("predicted_finding") is not None:
+                _validate_finding_payload(update["predicted_finding"])
+
+        return [
+            self.update_case(
+                str(update["case_id"]).strip(),
+                source_url=update.get("source_url"),
+                notes=update.get("notes"),
+                expected_finding=update.get("expected_finding"),
+                predicted_finding=update.get("predicted_finding"),
+            )
+            for update in updates
+        ]
+
+    def save(self) -> None:
+        """Write the corpus back to its file atomically."""
+        _write_json(self.path, self.raw)
+
+    def _load(self) -> dict[str, Any]:
+        raw = cast(dict[str, Any], _read_json(self.path))
+        index: dict[str, dict[str, Any]] = {}
+        for row in raw.get("cases", []):
+            case_id = row.get("case_id")
+            # Updates to a repeated id would be ambiguous
+            if case_id in index:
+                raise ValueError(f"Case '{case_id}' appears more than once in corpus.")
+            index[case_id] = row
+        self._index = index
+        self._raw = raw
+        return raw
+
+    def _case(self, case_id: str) -> dict[str, Any]:
+        if self._raw is None:
+            self._load()
+        target_case = self._index.get(case_id)
+        if target_case is None:
+            raise ValueError(f"Case '{case_id}' not found in corpus.")
+        return target_case
+
+
+def _case_update_summary(case_id: str, case: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "case_id": case_id,
+        "expected_count": len(case.get("expected_findings", [])),
+        "predicted_count": len(case.get("predicted_findings", [])),
+        "source_url_set": bool(str(case.get("source_url", "")).strip()),
+    }
+
+
+# Corpora updated through update_corpus_case(s), by resolved path, with the
+# (st_mtime_ns, st_size) of the file as last saved
+_corpus_cache: dict[Path, tuple[int, int, CorpusFile]] = {}
+
+
+def _open_corpus(path: Path) -> CorpusFile:
+    """Return the corpus last saved to ``path`` if the file is unchanged since.
+
+    Otherwise the file is opened afresh. The cache entry is taken out until
+    ``_keep_corpus`` puts it back, so changes that failed to save are never
+    served from it.
+    """
+    entry = _corpus_cache.pop(path.resolve(), None)
+    if entry is not None:
+        mtime_ns, size, corpus = entry
+        try:
+            stat = path.stat()
+        except OSError:
+            return CorpusFile(path)
+        if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+            return corpus
+    return CorpusFile(path)
+
+
+def _keep_corpus(corpus: CorpusFile) -> None:
+    """Cache a just-saved corpus against the current state of its file."""
+    stat = corpus.path.stat()
+    _corpus_cache[corpus.path.resolve()] = (stat.st_mtime_ns, stat.st_size, corpus)
+
+
 def update_corpus_case(
     corpus_path: Path,
     case_id: str,
@@ -556,39 +893,23 @@ def update_corpus_case(
     expected_finding: dict[str, str] | None = None,
     predicted_finding: dict[str, str] | None = None,
 ) -> dict[str, Any]:
-    """Update one corpus case with metadata/findings and persist changes."""
-    raw = json.loads(corpus_path.read_text(encoding="utf-8"))
-    cases = raw.get("cases", [])
-    target_case: dict[str, Any] | None = None
-
-    for row in cases:
-        if row.get("case_id") == case_id:
-            target_case = row
-            break
-
-    if target_case is None:
-        raise ValueError(f"Case '{case_id}' not found in corpus.")
-
-    if source_url is not None:
-        target_case["source_url"] = source_url
-    if notes is not None:
-        target_case["notes"] = notes
-
-    if expected_finding is not None:
-        _validate_finding_payload(expected_finding)
-        target_case.setdefault("expected_findings", []).append(expected_finding)
-    if predicted_finding is not None:
-        _validate_finding_payload(predicted_finding)
-        target_case.setdefault("predicted_findings", []).append(predicted_finding)
-
-    corpus_path.write_text(json.dumps(raw, indent=2), encoding="utf-8")
-
-    return {
-        "case_id": case_id,
-        "expected_count": len(target_case.get("expected_findings", [])),
-        "predicted_count": len(target_case.get("predicted_findings", [])),
-        "source_url_set": bool(str(target_case.get("source_url", "")).strip()),
-    }
+    """Update one corpus case with metadata/findings and persist changes.
+
+    The parsed corpus is kept between calls and reused while the file is
+    unchanged on disk. To apply many updates, use a ``CorpusFile`` and save
+    once.
+    """
+    corpus = _open_corpus(corpus_path)
+    result = corpus.update_case(
+        case_id,
+        source_url=source_url,
+        notes=notes,
+        expected_finding=expected_finding,
+        predicted_finding=predicted_finding,
+    )
+    corpus.save()
+    _keep_corpus(corpus)
+    return result
 
 
 def update_corpus_cases(
@@ -596,54 +917,16 @@ def update_corpus_cases(
     updates: list[dict[str, Any]],
 ) -> list[dict[str, Any]]:
     """Apply multiple case updates atomically and persist once."""
-    raw = json.loads(corpus_path.read_text(encoding="utf-8"))
-    cases = raw.get("cases", [])
-    case_map = {row.get("case_id"): row for row in cases}
-    results: list[dict[str, Any]] = []
-
-    # Validate first (fail-fast) before mutating.
-    for update in updates:
-        case_id = str(update.get("case_id", "")).strip()
-        if not case_id:
-            raise ValueError("Each update item must include non-empty 'case_id'.")
-        if case_id not in case_map:
-            raise ValueError(f"Case '{case_id}' not found in corpus.")
-
-        if update.get("expected_finding") is not None:
-            _validate_finding_payload(update["expected_finding"])
-        if update.get("predicted_finding") is not None:
-            _validate_finding_payload(update["predicted_finding"])
-
-    # Apply updates.
-    for update in updates:
-        case_id = update["case_id"]
-        target_case = case_map[case_id]
-
-        if "source_url" in update and update["source_url"] is not None:
-            target_case["source_url"] = update["source_url"]
-        if "notes" in update and update["notes"] is not None:
-            target_case["notes"] = update["notes"]
-        if update.get("expected_finding") is not None:
-            target_case.setdefault("expected_findings", []).append(update["expected_finding"])
-        if update.get("predicted_finding") is not None:
-            target_case.setdefault("predicted_findings", []).append(update["predicted_finding"])
-
-        results.append(
-            {
-                "case_id": case_id,
-                "expected_count": len(target_case.get("expected_findings", [])),
-                "predicted_count": len(target_case.get("predicted_findings", [])),
-                "source_url_set": bool(str(target_case.get("source_url", "")).strip()),
-            }
-        )
-
-    corpus_path.write_text(json.dumps(raw, indent=2), encoding="utf-8")
+    corpus = _open_corpus(corpus_path)
+    results = corpus.update_cases(updates)
+    corpus.save()
+    _keep_corpus(corpus)
     return results
 
 
 def load_curation_updates(path: Path) -> list[dict[str, Any]]:
     """Load curation updates list from JSON file."""
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = _read_json(path)
     updates = raw.get("updates")
     if not isinstance(updates, list):
         raise ValueError("Updates file must contain an 'updates' array.")
@@ -678,7 +961,7 @@ def generate_curation_work_items(
                 }
             )
 
-    return {
+    payload = {
         "meta": {
             "description": "Professor curation work items",
             "per_language_limit": per_language_limit,
@@ -686,6 +969,7 @@ def generate_curation_work_items(
         },
         "updates": updates,
     }
+    return payload
 
 
 def _validate_finding_payload(finding: dict[str, str]) -> None:
@@ -693,6 +977,6 @@ def _validate_finding_payload(finding: dict[str, str]) -> None:
     missing = [key for key in required if key not in finding or not str(finding[key]).strip()]
     if missing:
         raise ValueError(f"Finding payload missing required fields: {', '.join(sorted(missing))}")
-    Severity(str(finding["severity"]).lower())
-    FindingCategory(str(finding["category"]).lower())
+    _parse_severity(str(finding["severity"]))
+    _parse_category(str(finding["category"]))
 
@@ -0,0 +1,135 @@
+"""On-disk cache of analyzer results across review runs."""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import structlog
+from pydantic import TypeAdapter, ValidationError
+
+from professor.core import Analyzer, Finding
+
+logger = structlog.get_logger()
+
+DEFAULT_CACHE_DIR = ".professor-cache"
+
+_FINDINGS = TypeAdapter(list[Finding])
+
+
+class ResultCache:
+    """SQLite-backed store of findings keyed by analyzer and file content.
+
+    Re-running a review of the same commit (CI retries, workflow re-runs)
+    then skips every analyzer whose inputs are unchanged, including LLM calls.
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_CACHE_DIR) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            directory: Directory holding the cache database
+        """
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path / "results.sqlite3", check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, findings BLOB NOT NULL)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def key(namespace: str, context: dict[str, Any]) -> bytes:
+        """Build the cache key for an analyzer namespace and analysis context.
+
+        Covers the file path (embedded in finding ids), language, code and diff.
+        """
+        hasher = hashlib.sha256()
+        for part in (
+            namespace,
+            context.get("file_path") or "",
+            context.get("language") or "",
+            context.get("code") or "",
+            context.get("diff") or "",
+        ):
+            hasher.update(part.encode("utf-8", "surrogatepass"))
+            hasher.update(b"\x00")
+        return hasher.digest()
+
+    def get(self, key: bytes) -> Optional[list[Finding]]:
+        """Return cached findings for ``key``, or None on a miss."""
+        with self._lock:
+            row = self._db.execute("SELECT findings FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return _FINDINGS.validate_json(row[0])
+        except ValidationError as e:
+            # Written by an incompatible version; treat as a miss
+            logger.warning("result_cache_entry_invalid", error=str(e))
+            return None
+
+    def set(self, key: bytes, findings: list[Finding]) -> None:
+        """Store findings under ``key``."""
+        payload = _FINDINGS.dump_json(findings)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, findings) VALUES (?, ?)", (key, payload)
+            )
+            self._db.commit()
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            self._db.close()
+
+
+class CachedAnalyzer(Analyzer):
+    """Analyzer wrapper that serves repeat inputs from a ``ResultCache``."""
+
+    def __init__(self, analyzer: Analyzer, cache: ResultCache) -> None:
+        """Initialize cached analyzer.
+
+        Args:
+            analyzer: Analyzer whose results are cached
+            cache: Result cache to read and populate
+        """
+        super().__init__(analyzer.config)
+        self.analyzer = analyzer
+        self.cache = cache
+        self.name = analyzer.name
+
+    async def analyze(self, context: dict[str, Any]) -> list[Finding]:
+        """Return cached findings, running the wrapped analyzer on a miss.
+
+        Args:
+            context: Analysis context
+
+        Returns:
+            Findings for the context
+        """
+        key = ResultCache.key(self.analyzer.cache_namespace(), context)
+        findings = self.cache.get(key)
+        if findings is not None:
+            logger.debug("result_cache_hit", analyzer=self.name, file=context.get("file_path"))
+            return findings
+
+        findings = await self.analyzer.analyze(context)
+        self.cache.set(key, findings)
+        return findings
+
+    def supports(self, context: dict[str, Any]) -> bool:
+        """Check if the wrapped analyzer supports the context."""
+        return self.analyzer.supports(context)
+
+    async def aclose(self) -> None:
+        """Close the wrapped analyzer."""
+        await self.analyzer.aclose()
+
+    def __str__(self) -> str:
+        """String representation."""
+        return f"CachedAnalyzer({self.analyzer})"
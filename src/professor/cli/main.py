@@ -1,101 +1,182 @@
 """Command-line interface for Professor."""
 
-import asyncio
-import json
+import re
+from collections.abc import Coroutine, Iterable
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from professor import __version__
-from professor.config import get_settings
-from professor.logging import setup_logging, get_logger
-from professor.reviewer import PRReviewer
-from professor.core import Severity
-from professor.benchmark import (
-    DEFAULT_LANGUAGE_TARGETS,
-    benchmark_report_json,
-    benchmark_report_markdown,
-    evaluate_benchmark,
-    evaluate_curation_status,
-    evaluate_release_gate,
-    generate_curation_work_items,
-    generate_corpus_template,
-    load_curation_updates,
-    load_benchmark_dataset,
-    scorecards_by_language,
-    scorecards_by_repo_family,
-    ReleaseGateThresholds,
-    update_corpus_case,
-    update_corpus_cases,
-    validate_dataset_coverage,
-)
 
-console = Console()
-logger = get_logger(__name__)
+if TYPE_CHECKING:
+    from rich.console import Console
+
+T = TypeVar("T")
+
+_PR_URL_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+
+# Keyed by Severity value, so professor.core is not imported to build it
+_SEVERITY_LABELS = {
+    "critical": "[red bold]● CRITICAL[/red bold]",
+    "high": "[red]● HIGH[/red]",
+    "medium": "[yellow]● MEDIUM[/yellow]",
+    "low": "[blue]● LOW[/blue]",
+    "info": "[dim]● INFO[/dim]",
+}
+
+# Default professor.yaml written by `professor init`
+_DEFAULT_CONFIG = b"""# Professor Configuration
+professor:
+  version: 1
+  
+  standards:
+    severity_threshold: medium
+    auto_approve_threshold: low
+    
+  analyzers:
+    - llm:
+        provider: anthropic
+        model: claude-3-5-sonnet-20240620
+    - static:
+        - ruff
+        - mypy
+        
+  rules:
+    max_file_changes: 50
+    max_function_complexity: 15
+    require_tests: true
+    require_docs: true
+"""
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared Rich console.
+
+    Rich is imported on first output, so ``--help`` and ``--version`` do
+    not load it; commands import the Rich renderables they draw.
+
+    Automatic highlighting is off: every style shown comes from explicit
+    markup, and printed finding text is not regex-scanned for numbers,
+    paths and URLs to color.
+    """
+    from rich.console import Console
+
+    return Console(highlight=False)
+
+
+def _print_items(items: Iterable[str]) -> None:
+    """Print ``items`` as yellow bullet lines, in one console write."""
+    lines = "\n".join(f"[yellow]- {item}[/yellow]" for item in items)
+    if lines:
+        _console().print(lines)
+
+
+def _run_async(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run ``coroutine`` to completion, on a uvloop event loop when installed."""
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional faster event loop (not on Windows)
+        return asyncio.run(coroutine)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coroutine)
 
 
 async def _run_review(
-    owner: str, repo: str, pr_number: int, post_comments: bool, min_severity: str
+    owner: str,
+    repo: str,
+    pr_number: int,
+    post_comments: bool,
+    min_severity: str,
+    use_cache: bool = True,
+    concurrency: int = 10,
+    rate_limit: Optional[float] = None,
 ) -> None:
     """Run PR review asynchronously."""
+    from professor.config import get_settings
+
     settings = get_settings()
+    llm_settings = settings.llm
+    review_settings = settings.review
 
     # Initialize clients
-    console.print(f"[blue]Initializing Professor for {owner}/{repo}#{pr_number}...[/blue]")
+    _console().print(f"[blue]Initializing Professor for {owner}/{repo}#{pr_number}...[/blue]")
 
     if not settings.github.token:
-        console.print("[red]Error: GITHUB_TOKEN not set in environment[/red]")
-        console.print("[yellow]Set GITHUB_TOKEN in .env file or environment[/yellow]")
+        _console().print("[red]Error: GITHUB_TOKEN not set in environment[/red]")
+        _console().print("[yellow]Set GITHUB_TOKEN in .env file or environment[/yellow]")
+        return
+
+    # Check the LLM credentials too before any client is built
+    api_keys = {
+        "anthropic": ("ANTHROPIC_API_KEY", llm_settings.anthropic_api_key),
+        "openai": ("OPENAI_API_KEY", llm_settings.openai_api_key),
+    }
+    if llm_settings.provider not in api_keys:
+        _console().print(f"[red]Error: Unknown LLM provider: {llm_settings.provider}[/red]")
+        return
+    key_name, api_key = api_keys[llm_settings.provider]
+    if not api_key:
+        _console().print(f"[red]Error: {key_name} not set[/red]")
         return
 
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+    from rich.text import Text
+
+    from professor.core import Severity
+    from professor.logging import get_logger
+    from professor.reviewer import PRReviewer
     from professor.scm.github import GitHubClient
 
-    github_client = GitHubClient(settings.github.token)
+    github_client = GitHubClient(settings.github.token, requests_per_second=rate_limit)
 
     # Initialize LLM client based on config
-    if settings.llm.provider == "anthropic":
+    if llm_settings.provider == "anthropic":
         from professor.llm import AnthropicClient
 
-        if not settings.llm.anthropic_api_key:
-            console.print("[red]Error: ANTHROPIC_API_KEY not set[/red]")
-            return
         llm_client = AnthropicClient(
-            api_key=settings.llm.anthropic_api_key,
-            model=settings.llm.model,
-            temperature=settings.llm.temperature,
+            api_key=api_key,
+            model=llm_settings.model,
+            temperature=llm_settings.temperature,
         )
-    elif settings.llm.provider == "openai":
+    else:
         from professor.llm import OpenAIClient
 
-        if not settings.llm.openai_api_key:
-            console.print("[red]Error: OPENAI_API_KEY not set[/red]")
-            return
         llm_client = OpenAIClient(
-            api_key=settings.llm.openai_api_key,
-            model=settings.llm.model,
-            temperature=settings.llm.temperature,
+            api_key=api_key,
+            model=llm_settings.model,
+            temperature=llm_settings.temperature,
         )
-    else:
-        console.print(f"[red]Error: Unknown LLM provider: {settings.llm.provider}[/red]")
-        return
+
+    result_cache = None
+    if use_cache:
+        from professor.cache import ResultCache
+
+        result_cache = ResultCache(review_settings.cache_dir)
 
     # Create reviewer
     reviewer = PRReviewer(
         github_client=github_client,
         llm_client=llm_client,
-        max_files=settings.review.max_review_files,
-        max_file_size_kb=settings.review.max_file_size_kb,
+        max_files=review_settings.max_review_files,
+        max_file_size_kb=review_settings.max_file_size_kb,
+        concurrency=concurrency,
+        result_cache=result_cache,
     )
 
     # Run review with progress indicator
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console,
+        console=_console(),
+        # No spinner (or its refresh thread) when piped or run in CI
+        disable=not _console().is_terminal,
     ) as progress:
         task = progress.add_task("Reviewing PR...", total=None)
 
@@ -104,8 +185,8 @@ async def _run_review(
             progress.update(task, completed=True)
 
             # Display results
-            console.print()
-            console.print(Panel.fit(
+            _console().print()
+            _console().print(Panel.fit(
                 f"[bold green]✓ Review Complete![/bold green]\n"
                 f"PR: {result.pr.title}\n"
                 f"Author: {result.pr.author}\n"
@@ -117,61 +198,64 @@ async def _run_review(
             ))
 
             # Show findings summary
-            console.print()
+            _console().print()
             table = Table(title="📊 Review Summary")
             table.add_column("Severity", style="cyan")
             table.add_column("Count", style="magenta", justify="right")
 
-            table.add_row("Critical", str(result.review.summary.critical), style="red bold")
-            table.add_row("High", str(result.review.summary.high), style="red")
-            table.add_row("Medium", str(result.review.summary.medium), style="yellow")
-            table.add_row("Low", str(result.review.summary.low), style="blue")
-            table.add_row("Info", str(result.review.summary.info), style="dim")
+            summary = result.review.summary
+            table.add_row("Critical", str(summary.critical), style="red bold")
+            table.add_row("High", str(summary.high), style="red")
+            table.add_row("Medium", str(summary.medium), style="yellow")
+            table.add_row("Low", str(summary.low), style="blue")
+            table.add_row("Info", str(summary.info), style="dim")
             table.add_row("", "")
-            table.add_row("Total", str(result.review.summary.total_findings), style="bold")
-
-            console.print(table)
-
-            # Show findings
-            min_sev = Severity(min_severity)
-            severity_order = [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO]
-            filtered_findings = [
-                f for f in result.review.findings
-                if severity_order.index(f.severity) <= severity_order.index(min_sev)
-            ]
-
-            if filtered_findings:
-                console.print()
-                console.print(f"[bold]🔍 Findings (>= {min_severity}):[/bold]")
-                for finding in filtered_findings:
-                    severity_colors = {
-                        Severity.CRITICAL: "red bold",
-                        Severity.HIGH: "red",
-                        Severity.MEDIUM: "yellow",
-                        Severity.LOW: "blue",
-                        Severity.INFO: "dim",
-                    }
-                    color = severity_colors.get(finding.severity, "white")
-
-                    console.print()
-                    console.print(f"[{color}]● {finding.severity.upper()}[/{color}] {finding.title}")
-                    console.print(f"  📍 {finding.location}")
-                    console.print(f"  💬 {finding.message}")
-                    if finding.suggestion:
-                        console.print(f"  💡 [dim]Suggestion: {finding.suggestion}[/dim]")
+            table.add_row("Total", str(summary.total_findings), style="bold")
+
+            _console().print(table)
+
+            # Show findings as they are filtered; the header comes before the first
+            min_rank = Severity(min_severity).rank
+            # One render and write per finding; render_str styles each line
+            # as console.print would, keeping its markup to itself
+            render = _console().render_str
+            header_shown = False
+            for finding in result.review.findings:
+                if finding.severity.rank < min_rank:
+                    continue
+                if not header_shown:
+                    _console().print()
+                    _console().print(f"[bold]🔍 Findings (>= {min_severity}):[/bold]")
+                    header_shown = True
+                lines = [
+                    Text(),
+                    render(f"{_SEVERITY_LABELS[finding.severity]} {finding.title}"),
+                    render(f"  📍 {finding.location}"),
+                    render(f"  💬 {finding.message}"),
+                ]
+                if finding.suggestion:
+                    lines.append(render(f"  💡 [dim]Suggestion: {finding.suggestion}[/dim]"))
+                _console().print(Group(*lines))
 
             # Show approval status
-            console.print()
+            _console().print()
             if result.approved:
-                console.print("[bold green]✓ PR APPROVED - No blocking issues found[/bold green]")
+                _console().print("[bold green]✓ PR APPROVED - No blocking issues found[/bold green]")
             else:
-                console.print(f"[bold red]✗ PR BLOCKED - {result.blocking_issues} blocking issue(s)[/bold red]")
+                _console().print(f"[bold red]✗ PR BLOCKED - {result.blocking_issues} blocking issue(s)[/bold red]")
 
         except Exception as e:
             progress.update(task, completed=True)
-            console.print(f"[red]Error during review: {e}[/red]")
-            logger.error("review_failed", error=str(e))
+            _console().print(f"[red]Error during review: {e}[/red]")
+            get_logger(__name__).error("review_failed", error=str(e))
             raise
+        finally:
+            try:
+                await reviewer.aclose()
+            finally:
+                # Closing checkpoints the WAL into the cache database
+                if result_cache is not None:
+                    result_cache.close()
 
 
 @click.group()
@@ -184,13 +268,16 @@ def cli(config: Optional[str], verbose: bool) -> None:
     Professor ensures that every line of code, whether written by human or machine,
     meets the highest standards of quality, security, and correctness.
     """
+    from professor.config import get_settings
+    from professor.logging import setup_logging
+
     setup_logging()
     if verbose:
         settings = get_settings()
         settings.log.level = "DEBUG"
 
     if config:
-        console.print(f"[blue]Loading configuration from: {config}[/blue]")
+        _console().print(f"[blue]Loading configuration from: {config}[/blue]")
 
 
 @cli.command()
@@ -200,6 +287,19 @@ def cli(config: Optional[str], verbose: bool) -> None:
 @click.option("--pr-number", type=int, help="Pull request number")
 @click.option("--post-comments", is_flag=True, help="Post review comments to GitHub")
 @click.option("--min-severity", type=click.Choice(["critical", "high", "medium", "low", "info"]), default="medium", help="Minimum severity to report")
+@click.option("--no-cache", is_flag=True, help="Ignore and do not update the on-disk result cache")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Maximum number of files fetched and analyzed at once",
+)
+@click.option(
+    "--rate-limit",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Maximum GitHub API requests per second (default: PyGithub's request spacing)",
+)
 def review(
     pr_url: Optional[str],
     owner: Optional[str],
@@ -207,6 +307,9 @@ def review(
     pr_number: Optional[int],
     post_comments: bool,
     min_severity: str,
+    no_cache: bool,
+    concurrency: int,
+    rate_limit: Optional[float],
 ) -> None:
     """Review a pull request and generate findings.
 
@@ -214,7 +317,9 @@ def review(
         professor review --pr-url https://github.com/owner/repo/pull/123
         professor review --owner octocat --repo Hello-World --pr-number 1
     """
-    console.print(Panel.fit(
+    from rich.panel import Panel
+
+    _console().print(Panel.fit(
         "[bold cyan]🎓 Professor Code Review[/bold cyan]\n"
         "Analyzing code with superhuman precision...",
         border_style="cyan"
@@ -222,22 +327,32 @@ def review(
 
     # Parse PR URL if provided
     if pr_url:
-        import re
-        match = re.match(r"https://github\.com/([^/]+)/([^/]+)/pull/(\d+)", pr_url)
+        match = _PR_URL_RE.match(pr_url)
         if match:
             owner, repo, pr_number = match.groups()
             pr_number = int(pr_number)
         else:
-            console.print("[red]Error: Invalid PR URL format[/red]")
+            _console().print("[red]Error: Invalid PR URL format[/red]")
             return
 
     # Validate we have all required info
     if not (owner and repo and pr_number):
-        console.print("[red]Error: Specify either --pr-url or --owner, --repo, --pr-number[/red]")
+        _console().print("[red]Error: Specify either --pr-url or --owner, --repo, --pr-number[/red]")
         return
 
     # Run async review
-    asyncio.run(_run_review(owner, repo, pr_number, post_comments, min_severity))
+    _run_async(
+        _run_review(
+            owner,
+            repo,
+            pr_number,
+            post_comments,
+            min_severity,
+            use_cache=not no_cache,
+            concurrency=concurrency,
+            rate_limit=rate_limit,
+        )
+    )
 
 
 @cli.command()
@@ -245,18 +360,20 @@ def review(
 @click.option("--output", "-o", type=click.Choice(["json", "markdown", "text"]), default="text", help="Output format")
 def analyze(path: str, output: str) -> None:
     """Analyze code at the specified path."""
-    console.print(f"[blue]Analyzing: {path}[/blue]")
-    console.print(f"[blue]Output format: {output}[/blue]")
+    _console().print(f"[blue]Analyzing: {path}[/blue]")
+    _console().print(f"[blue]Output format: {output}[/blue]")
     
     # TODO: Implement analysis
-    console.print("[yellow]Analysis not yet implemented[/yellow]")
+    _console().print("[yellow]Analysis not yet implemented[/yellow]")
 
 
 @cli.command()
 @click.option("--days", type=int, default=30, help="Number of days to report")
 def stats(days: int) -> None:
     """Show review statistics and metrics."""
-    console.print(f"[blue]Showing statistics for the last {days} days[/blue]")
+    from rich.table import Table
+
+    _console().print(f"[blue]Showing statistics for the last {days} days[/blue]")
     
     # TODO: Implement stats from database
     table = Table(title="📊 Professor Statistics")
@@ -269,8 +386,8 @@ def stats(days: int) -> None:
     table.add_row("High Issues", "0")
     table.add_row("Files Analyzed", "0")
     
-    console.print(table)
-    console.print("[yellow]Statistics tracking not yet implemented[/yellow]")
+    _console().print(table)
+    _console().print("[yellow]Statistics tracking not yet implemented[/yellow]")
 
 
 @cli.command("benchmark")
@@ -302,8 +419,22 @@ def benchmark(
     min_verdict_accuracy: float,
 ) -> None:
     """Evaluate labeled PR benchmark dataset."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from professor.benchmark import (
+        ReleaseGateThresholds,
+        benchmark_report_json,
+        benchmark_report_markdown,
+        evaluate_benchmark_with_scorecards,
+        evaluate_release_gate,
+        load_benchmark_dataset,
+        validate_dataset_coverage,
+    )
+
     dataset = load_benchmark_dataset(Path(dataset_path))
-    report = evaluate_benchmark(dataset)
+    report, language_cards, family_cards = evaluate_benchmark_with_scorecards(dataset)
     gate = evaluate_release_gate(
         report,
         ReleaseGateThresholds(
@@ -314,11 +445,8 @@ def benchmark(
             min_verdict_accuracy=min_verdict_accuracy,
         ),
     )
-    language_cards = scorecards_by_language(dataset)
-    family_cards = scorecards_by_repo_family(dataset)
     coverage = validate_dataset_coverage(dataset)
 
-    console.print(Panel.fit("[bold cyan]🎯 Benchmark Report[/bold cyan]", border_style="cyan"))
     summary = Table(show_header=True, header_style="bold magenta")
     summary.add_column("Metric", style="cyan")
     summary.add_column("Value", style="yellow")
@@ -330,7 +458,6 @@ def benchmark(
     summary.add_row("Verdict Accuracy", f"{report.verdict_accuracy:.4f}")
     summary.add_row("Coverage Ready", "yes" if coverage.valid else "no")
     summary.add_row("Release Gate", "pass" if gate.passed else "fail")
-    console.print(summary)
 
     lang_table = Table(title="🌐 Language Scorecards")
     lang_table.add_column("Language", style="cyan")
@@ -339,28 +466,32 @@ def benchmark(
     lang_table.add_column("Severe Recall", justify="right", style="magenta")
     for card in language_cards:
         lang_table.add_row(card.group, str(card.cases), f"{card.mean_f1:.4f}", f"{card.severe_recall:.4f}")
-    console.print(lang_table)
+    _console().print(
+        Group(
+            Panel.fit("[bold cyan]🎯 Benchmark Report[/bold cyan]", border_style="cyan"),
+            summary,
+            lang_table,
+        )
+    )
 
     if output_markdown_path:
         markdown = benchmark_report_markdown(report, language_cards, family_cards)
         Path(output_markdown_path).write_text(markdown, encoding="utf-8")
-        console.print(f"[green]✓ Wrote markdown report to {output_markdown_path}[/green]")
+        _console().print(f"[green]✓ Wrote markdown report to {output_markdown_path}[/green]")
 
     if output_json_path:
         json_report = benchmark_report_json(report, language_cards, family_cards)
         Path(output_json_path).write_text(json_report, encoding="utf-8")
-        console.print(f"[green]✓ Wrote JSON report to {output_json_path}[/green]")
+        _console().print(f"[green]✓ Wrote JSON report to {output_json_path}[/green]")
 
     if not coverage.valid:
-        console.print("[yellow]Dataset coverage issues detected:[/yellow]")
-        for issue in coverage.issues:
-            console.print(f"[yellow]- {issue}[/yellow]")
+        _console().print("[yellow]Dataset coverage issues detected:[/yellow]")
+        _print_items(coverage.issues)
         if strict:
             raise click.ClickException("Benchmark coverage validation failed in strict mode.")
     if not gate.passed:
-        console.print("[yellow]Release gate failures:[/yellow]")
-        for item in gate.failed_checks:
-            console.print(f"[yellow]- {item}[/yellow]")
+        _console().print("[yellow]Release gate failures:[/yellow]")
+        _print_items(gate.failed_checks)
         if enforce_gate:
             raise click.ClickException("Benchmark release gate failed.")
 
@@ -376,14 +507,15 @@ def benchmark(
 )
 def benchmark_init(output_path: str) -> None:
     """Generate default 50-case benchmark corpus template."""
+    from professor.benchmark import DEFAULT_LANGUAGE_TARGETS, generate_corpus_template
+
     target = Path(output_path)
-    if not target.parent.exists():
-        target.parent.mkdir(parents=True, exist_ok=True)
+    target.parent.mkdir(parents=True, exist_ok=True)
 
     payload = generate_corpus_template(target, DEFAULT_LANGUAGE_TARGETS)
     total_cases = payload.get("meta", {}).get("total_cases", 0)
-    console.print(f"[green]✓ Generated corpus template: {output_path}[/green]")
-    console.print(f"[blue]Total cases: {total_cases}[/blue]")
+    _console().print(f"[green]✓ Generated corpus template: {output_path}[/green]")
+    _console().print(f"[blue]Total cases: {total_cases}[/blue]")
 
 
 @cli.command("benchmark-curation-status")
@@ -392,6 +524,11 @@ def benchmark_init(output_path: str) -> None:
 @click.option("--top-pending", type=int, default=10, show_default=True, help="Show first N pending case IDs")
 def benchmark_curation_status(dataset_path: str, strict: bool, top_pending: int) -> None:
     """Show corpus curation completeness and missing labels."""
+    from rich.console import Group
+    from rich.table import Table
+
+    from professor.benchmark import evaluate_curation_status, load_benchmark_dataset
+
     dataset = load_benchmark_dataset(Path(dataset_path))
     status = evaluate_curation_status(dataset)
 
@@ -402,24 +539,21 @@ def benchmark_curation_status(dataset_path: str, strict: bool, top_pending: int)
     table.add_row("Curated Cases", str(status.curated_cases))
     table.add_row("Completion", f"{status.completion_ratio:.2%}")
     table.add_row("Ready", "yes" if status.valid else "no")
-    console.print(table)
 
     lang_table = Table(title="🌐 Curation by Language")
     lang_table.add_column("Language", style="cyan")
     lang_table.add_column("Completion", style="magenta", justify="right")
     for language, ratio in sorted(status.by_language.items()):
         lang_table.add_row(language, f"{ratio:.2%}")
-    console.print(lang_table)
+    _console().print(Group(table, lang_table))
 
     if status.pending_case_ids:
-        console.print("[yellow]Pending case IDs:[/yellow]")
-        for case_id in status.pending_case_ids[:top_pending]:
-            console.print(f"[yellow]- {case_id}[/yellow]")
+        _console().print("[yellow]Pending case IDs:[/yellow]")
+        _print_items(status.pending_case_ids[:top_pending])
         if len(status.pending_case_ids) > top_pending:
-            console.print(f"[yellow]... and {len(status.pending_case_ids) - top_pending} more[/yellow]")
+            _console().print(f"[yellow]... and {len(status.pending_case_ids) - top_pending} more[/yellow]")
 
-    for issue in status.issues:
-        console.print(f"[yellow]- {issue}[/yellow]")
+    _print_items(status.issues)
 
     if strict and not status.valid:
         raise click.ClickException("Corpus curation is incomplete.")
@@ -459,6 +593,8 @@ def benchmark_curation_update(
     predicted_category: Optional[str],
 ) -> None:
     """Update one corpus case with labels/metadata."""
+    from professor.benchmark import update_corpus_case
+
     expected_finding = None
     predicted_finding = None
 
@@ -495,8 +631,8 @@ def benchmark_curation_update(
         expected_finding=expected_finding,
         predicted_finding=predicted_finding,
     )
-    console.print(f"[green]✓ Updated case {result['case_id']}[/green]")
-    console.print(
+    _console().print(f"[green]✓ Updated case {result['case_id']}[/green]")
+    _console().print(
         f"[blue]Expected: {result['expected_count']} | Predicted: {result['predicted_count']} | "
         f"Source set: {result['source_url_set']}[/blue]"
     )
@@ -508,16 +644,20 @@ def benchmark_curation_update(
 @click.option("--strict", is_flag=True, help="Fail if updates payload is invalid")
 def benchmark_curation_import(dataset_path: str, updates_path: str, strict: bool) -> None:
     """Apply batch curation updates from JSON payload."""
+    from rich.table import Table
+
+    from professor.benchmark import load_curation_updates, update_corpus_cases
+
     try:
         updates = load_curation_updates(Path(updates_path))
         results = update_corpus_cases(Path(dataset_path), updates)
     except Exception as exc:
         if strict:
             raise click.ClickException(f"Batch import failed: {exc}")
-        console.print(f"[red]Batch import failed: {exc}[/red]")
+        _console().print(f"[red]Batch import failed: {exc}[/red]")
         return
 
-    console.print(f"[green]✓ Applied {len(results)} curation updates[/green]")
+    _console().print(f"[green]✓ Applied {len(results)} curation updates[/green]")
     table = Table(title="🧩 Batch Curation Results")
     table.add_column("Case ID", style="cyan")
     table.add_column("Expected", justify="right", style="yellow")
@@ -530,9 +670,9 @@ def benchmark_curation_import(dataset_path: str, updates_path: str, strict: bool
             str(row["predicted_count"]),
             "yes" if row["source_url_set"] else "no",
         )
-    console.print(table)
+    _console().print(table)
     if len(results) > 20:
-        console.print(f"[blue]... and {len(results) - 20} more updates[/blue]")
+        _console().print(f"[blue]... and {len(results) - 20} more updates[/blue]")
 
 
 @cli.command("benchmark-curation-plan")
@@ -548,14 +688,16 @@ def benchmark_curation_import(dataset_path: str, updates_path: str, strict: bool
 @click.option("--per-language-limit", type=int, default=3, show_default=True)
 def benchmark_curation_plan(dataset_path: str, output_path: str, per_language_limit: int) -> None:
     """Generate batch work items for pending curation cases."""
+    from professor.benchmark import generate_curation_work_items, load_benchmark_dataset
+    from professor.benchmark.harness import _write_json
+
     dataset = load_benchmark_dataset(Path(dataset_path))
     payload = generate_curation_work_items(dataset, per_language_limit=per_language_limit)
     target = Path(output_path)
-    if not target.parent.exists():
-        target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    console.print(f"[green]✓ Wrote curation work items to {output_path}[/green]")
-    console.print(f"[blue]Planned updates: {payload['meta']['total_updates']}[/blue]")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    _write_json(target, payload)
+    _console().print(f"[green]✓ Wrote curation work items to {output_path}[/green]")
+    _console().print(f"[blue]Planned updates: {payload['meta']['total_updates']}[/blue]")
 
 @cli.command()
 @click.option("--host", default="0.0.0.0", show_default=True, help="Bind host")
@@ -565,16 +707,21 @@ def serve_github_app(host: str, port: int) -> None:
     from professor.github_app.server import create_app
     import uvicorn
 
-    console.print(f"[blue]Starting Professor GitHub App server on {host}:{port}[/blue]")
+    _console().print(f"[blue]Starting Professor GitHub App server on {host}:{port}[/blue]")
     uvicorn.run(create_app(), host=host, port=port)
 
 
 @cli.command()
 def config_show() -> None:
     """Show current configuration."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from professor.config import get_settings
+
     settings = get_settings()
     
-    console.print(Panel.fit(
+    _console().print(Panel.fit(
         "[bold cyan]🔧 Professor Configuration[/bold cyan]",
         border_style="cyan"
     ))
@@ -591,46 +738,24 @@ def config_show() -> None:
     table.add_row("Log Level", settings.log.level)
     table.add_row("Max Review Files", str(settings.review.max_review_files))
     
-    console.print(table)
+    _console().print(table)
 
 
 @cli.command()
 def init() -> None:
     """Initialize Professor in the current directory."""
-    console.print("[blue]Initializing Professor...[/blue]")
-    
-    # Create default config file
-    config_content = """# Professor Configuration
-professor:
-  version: 1
-  
-  standards:
-    severity_threshold: medium
-    auto_approve_threshold: low
-    
-  analyzers:
-    - llm:
-        provider: anthropic
-        model: claude-3-5-sonnet-20240620
-    - static:
-        - ruff
-        - mypy
-        
-  rules:
-    max_file_changes: 50
-    max_function_complexity: 15
-    require_tests: true
-    require_docs: true
-"""
+    _console().print("[blue]Initializing Professor...[/blue]")
     
     config_path = Path("professor.yaml")
-    if config_path.exists():
-        console.print("[yellow]professor.yaml already exists[/yellow]")
+    try:
+        # "x" creates the file or fails if it exists, in one step
+        with open(config_path, "xb") as config_file:
+            config_file.write(_DEFAULT_CONFIG)
+    except FileExistsError:
+        _console().print("[yellow]professor.yaml already exists[/yellow]")
         return
-    
-    config_path.write_text(config_content)
-    console.print("[green]✓ Created professor.yaml[/green]")
-    console.print("[blue]Edit professor.yaml to customize your configuration[/blue]")
+    _console().print("[green]✓ Created professor.yaml[/green]")
+    _console().print("[blue]Edit professor.yaml to customize your configuration[/blue]")
 
 
 def main() -> None:
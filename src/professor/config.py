@@ -1,9 +1,9 @@
 """Configuration management for Professor."""
 
+import os
 from typing import Any, Optional
 from pathlib import Path
-import yaml
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -74,6 +74,7 @@ class ReviewSettings(BaseSettings):
     max_review_files: int = Field(default=50, alias="MAX_REVIEW_FILES")
     max_file_size_kb: int = Field(default=500, alias="MAX_FILE_SIZE_KB")
     timeout_seconds: int = Field(default=300, alias="REVIEW_TIMEOUT_SECONDS")
+    cache_dir: str = Field(default=".professor-cache", alias="PROFESSOR_CACHE_DIR")
 
     model_config = SettingsConfigDict(env_prefix="")
 
@@ -103,6 +104,36 @@ class Settings(BaseSettings):
         env_file=".env", env_file_encoding="utf-8", extra="ignore"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _share_dotenv(cls, data: Any) -> Any:
+        """Build the nested settings with the ``.env`` entries meant for them.
+
+        Only ``Settings`` reads ``.env``. Entries that are not its own
+        fields reach this validator as lowercased keys, so the file is
+        parsed once and each nested section not given explicitly gets the
+        entries for its variables. Environment variables still win over
+        ``.env``, as they do for top-level fields.
+        """
+        if not isinstance(data, dict):
+            return data
+        environ = {name.lower() for name in os.environ}
+        data = dict(data)
+        for name, field in cls.model_fields.items():
+            section = field.annotation
+            if name in data or not (
+                isinstance(section, type) and issubclass(section, BaseSettings)
+            ):
+                continue
+            values = {}
+            for field_name, section_field in section.model_fields.items():
+                key = (section_field.alias or field_name).lower()
+                if key in data and key not in environ:
+                    values[section_field.alias or field_name] = data[key]
+            if values:
+                data[name] = section(**values)
+        return data
+
     @classmethod
     def from_yaml(cls, path: Path) -> "Settings":
         """Load settings from YAML file.
@@ -113,8 +144,13 @@ class Settings(BaseSettings):
         Returns:
             Settings instance
         """
-        with open(path) as f:
-            config = yaml.safe_load(f)
+        # Only this loader needs PyYAML; importing it here keeps it off CLI startup
+        import yaml
+
+        # The libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path, "rb") as f:
+            config = yaml.load(f.read(), Loader=loader)
 
         return cls(**config)
 
@@ -18,6 +18,10 @@ class AnalyzerConfig(ABC):
 class Analyzer(ABC):
     """Abstract base class for all code analyzers."""
 
+    # Bump when an analyzer's output for the same input changes, so cached
+    # results from older versions are not reused
+    version: str = "1"
+
     def __init__(self, config: Optional[AnalyzerConfig] = None) -> None:
         """Initialize the analyzer.
 
@@ -31,6 +35,11 @@ class Analyzer(ABC):
     async def analyze(self, context: dict[str, Any]) -> list[Finding]:
         """Analyze code and return findings.
 
+        Dispatchers (``LanguageAnalyzerRouter.get_analyzers`` with a context,
+        ``CompositeAnalyzer``) only call this for contexts ``supports``
+        accepts, so implementations need no more than a cheap guard for
+        direct callers.
+
         Args:
             context: Analysis context containing code, files, metadata, etc.
 
@@ -54,10 +63,25 @@ class Analyzer(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """Release resources kept across ``analyze`` calls, such as subprocesses.
+
+        The default does nothing.
+        """
+        return None
+
     def get_name(self) -> str:
         """Get the name of this analyzer."""
         return self.name
 
+    def cache_namespace(self) -> str:
+        """Identify this analyzer's output for result caching.
+
+        Subclasses whose findings depend on settings beyond the analysis
+        context should include those settings.
+        """
+        return f"{self.name}:{self.version}"
+
     def __str__(self) -> str:
         """String representation of the analyzer."""
         return f"{self.__class__.__name__}()"
@@ -111,6 +135,10 @@ class CompositeAnalyzer(Analyzer):
         """
         return any(analyzer.supports(context) for analyzer in self.analyzers)
 
+    async def aclose(self) -> None:
+        """Close all sub-analyzers."""
+        await asyncio.gather(*(analyzer.aclose() for analyzer in self.analyzers))
+
     def __str__(self) -> str:
         """String representation."""
         analyzer_names = [a.get_name() for a in self.analyzers]
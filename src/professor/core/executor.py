@@ -0,0 +1,81 @@
+"""Shared process pool for CPU-bound analyzer work."""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+import structlog
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+# Files smaller than this (in characters) are analyzed inline; pickling the
+# source to a worker costs more than the analysis itself.
+PROCESS_POOL_MIN_SIZE = 100_000
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def shutdown_process_pool(wait: bool = True) -> None:
+    """Shut down the shared process pool if it was started."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+def run_sync_in_process(func: Callable[..., T], *args: Any) -> T:
+    """Run ``func(*args)`` in the shared pool, blocking for the result.
+
+    Falls back to running inline if the pool has died (e.g. a worker was
+    killed), so a broken pool degrades throughput rather than failing reviews.
+    """
+    try:
+        return get_process_pool().submit(func, *args).result()
+    except BrokenProcessPool as e:
+        logger.warning("process_pool_broken", error=str(e))
+        shutdown_process_pool(wait=False)
+        return func(*args)
+
+
+async def run_in_process(func: Callable[..., T], *args: Any) -> T:
+    """Run ``func(*args)`` in the shared pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(get_process_pool(), func, *args)
+    except BrokenProcessPool as e:
+        logger.warning("process_pool_broken", error=str(e))
+        shutdown_process_pool(wait=False)
+        return func(*args)
+
+
+def map_sync_in_process(func: Callable[..., T], *iterables: list[Any]) -> list[T]:
+    """Run ``map(func, *iterables)`` in the shared pool, returning results in order.
+
+    Like ``run_sync_in_process``, falls back to running inline on a broken pool.
+    """
+    try:
+        return list(get_process_pool().map(func, *iterables))
+    except BrokenProcessPool as e:
+        logger.warning("process_pool_broken", error=str(e))
+        shutdown_process_pool(wait=False)
+        return list(map(func, *iterables))
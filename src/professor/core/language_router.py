@@ -1,5 +1,7 @@
 """Language capability matrix and analyzer router."""
 
+import asyncio
+import itertools
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -61,3 +63,13 @@ class LanguageAnalyzerRouter:
             return analyzers
         return [analyzer for analyzer in analyzers if analyzer.supports(context)]
 
+    async def aclose(self) -> None:
+        """Close every registered analyzer once."""
+        analyzers = {
+            id(analyzer): analyzer
+            for analyzer in itertools.chain(
+                self._global_analyzers, *self._language_analyzers.values()
+            )
+        }
+        await asyncio.gather(*(analyzer.aclose() for analyzer in analyzers.values()))
+
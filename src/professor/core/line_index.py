@@ -0,0 +1,123 @@
+"""Newline offset index for mapping match offsets to line numbers."""
+
+from array import array
+from bisect import bisect_left
+from typing import Any, AnyStr, Iterable, Optional, Union, cast
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional vectorized newline search
+    numpy = None  # type: ignore[assignment]
+
+Text = Union[str, bytes]
+
+# Texts shorter than this are indexed with str.find; NumPy's fixed call
+# overhead only pays off beyond it
+NUMPY_MIN_SIZE = 1024
+
+
+def build_newline_offsets(text: Text) -> array:
+    """Return the sorted offsets of every newline in ``text``.
+
+    Works on ``str`` (character offsets) and ``bytes`` (byte offsets).
+    With NumPy installed, longer texts are searched in one vectorized pass.
+    """
+    if numpy is not None and len(text) >= NUMPY_MIN_SIZE:
+        return _numpy_newline_offsets(text)
+    if isinstance(text, bytes):
+        return _find_newline_offsets(text, b"\n")
+    return _find_newline_offsets(text, "\n")
+
+
+def _find_newline_offsets(text: AnyStr, newline: AnyStr) -> array:
+    """Collect newline offsets with repeated ``find`` calls."""
+    offsets = array("q")
+    find = text.find
+    position = find(newline)
+    while position != -1:
+        offsets.append(position)
+        position = find(newline, position + 1)
+    return offsets
+
+
+def _numpy_newline_offsets(text: Text) -> array:
+    """Find newlines by comparing the whole buffer at once.
+
+    ``str`` offsets must count characters, so non-ASCII text is viewed as
+    UTF-32 code units (one per character); ASCII text and ``bytes`` are
+    viewed as single bytes.
+    """
+    if isinstance(text, bytes):
+        buffer = numpy.frombuffer(text, dtype=numpy.uint8)
+    elif text.isascii():
+        buffer = numpy.frombuffer(text.encode("ascii"), dtype=numpy.uint8)
+    else:
+        # surrogatepass keeps lone surrogates as single code units
+        buffer = numpy.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=numpy.uint32)
+    offsets = array("q")
+    offsets.frombytes(numpy.flatnonzero(buffer == 10).astype(numpy.int64).tobytes())
+    return offsets
+
+
+def get_newline_offsets(context: dict[str, Any]) -> array:
+    """Return the newline index for ``context["code"]``, building it once.
+
+    The index is stored on the context under ``"newline_offsets"`` so every
+    analyzer looking at the same file shares it.
+    """
+    offsets = cached_newline_offsets(context)
+    if offsets is None:
+        code = context.get("code", "")
+        offsets = build_newline_offsets(code)
+        context["newline_offsets"] = offsets
+        context["newline_offsets_code"] = code
+    return offsets
+
+
+def cached_newline_offsets(context: dict[str, Any]) -> Optional[array]:
+    """Return the stored newline index if one was built, without building it.
+
+    An index copied along with a context whose code was since replaced
+    (e.g. ``{**context, "code": ""}``) is ignored.
+    """
+    offsets = cast(Optional[array], context.get("newline_offsets"))
+    if offsets is None or context.get("newline_offsets_code") is not context.get("code", ""):
+        return None
+    return offsets
+
+
+def line_of(offsets: array, offset: int) -> int:
+    """Return the 1-based line containing ``offset``.
+
+    A newline character belongs to the line it terminates.
+    """
+    return bisect_left(offsets, offset) + 1
+
+
+def line_span(text: Text, offsets: array, line: int) -> tuple[int, int]:
+    """Return the ``(start, end)`` offsets of 1-based ``line``, excluding its newline."""
+    start = offsets[line - 2] + 1 if line > 1 else 0
+    end = offsets[line - 1] if line <= len(offsets) else len(text)
+    return start, end
+
+
+def line_text(text: str, offsets: array, line: int) -> str:
+    """Return the content of 1-based ``line`` without its newline."""
+    start, end = line_span(text, offsets, line)
+    return text[start:end]
+
+
+def lines_for_spans(offsets: array, spans: Iterable[tuple[int, int]]) -> list[int]:
+    """Map sorted ``(start, end)`` offsets to 1-based line numbers.
+
+    A match spanning several lines (e.g. ``\\s*`` across a newline) marks every
+    line it covers so per-line rule checks cannot be shadowed.
+    """
+    candidates: list[int] = []
+    for start, end in spans:
+        first = line_of(offsets, start)
+        last = line_of(offsets, end)
+        if candidates:
+            first = max(first, candidates[-1] + 1)
+        candidates.extend(range(first, last + 1))
+    return candidates
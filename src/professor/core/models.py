@@ -3,11 +3,18 @@
 from enum import Enum
 from typing import Any, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Severity(str, Enum):
-    """Severity levels for code review findings."""
+    """Severity levels for code review findings.
+
+    Values stay plain strings for serialization; each member also carries an
+    integer ``rank`` and members order by it, so ``f.severity >= Severity.HIGH``
+    is an int comparison.
+    """
+
+    rank: int
 
     CRITICAL = "critical"  # Security vulnerabilities, data loss, crashes
     HIGH = "high"  # Bugs, logic errors, major performance issues
@@ -15,6 +22,33 @@ class Severity(str, Enum):
     LOW = "low"  # Minor improvements, style suggestions
     INFO = "info"  # Informational notes, best practices
 
+    def __lt__(self, other: object) -> bool:
+        if isinstance(other, Severity):
+            return self.rank < other.rank
+        return NotImplemented
+
+    def __le__(self, other: object) -> bool:
+        if isinstance(other, Severity):
+            return self.rank <= other.rank
+        return NotImplemented
+
+    def __gt__(self, other: object) -> bool:
+        if isinstance(other, Severity):
+            return self.rank > other.rank
+        return NotImplemented
+
+    def __ge__(self, other: object) -> bool:
+        if isinstance(other, Severity):
+            return self.rank >= other.rank
+        return NotImplemented
+
+
+# Ranks follow declaration order (INFO lowest) and are set after class
+# creation so lookups like Severity("high") keep the str-enum signature
+for _rank, _severity in enumerate(reversed(Severity)):
+    _severity.rank = _rank
+del _rank, _severity
+
 
 class FindingCategory(str, Enum):
     """Categories of code review findings."""
@@ -30,7 +64,13 @@ class FindingCategory(str, Enum):
 
 
 class Location(BaseModel):
-    """Location of a finding in code."""
+    """Location of a finding in code.
+
+    Immutable (and hashable), so one instance can be shared by every finding
+    on the same line; use ``model_copy(update=...)`` to derive a new one.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     file_path: str = Field(..., description="Path to the file")
     line_start: int = Field(..., description="Starting line number", ge=1)
@@ -0,0 +1,263 @@
+"""Single-pass multi-pattern scanning for candidate lines."""
+
+import re
+from array import array
+from collections.abc import Sequence
+from typing import Any, Optional, Union
+
+import structlog
+
+from professor.core.line_index import build_newline_offsets, lines_for_spans
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional SIMD multi-pattern backend
+    hyperscan = None  # type: ignore[assignment]
+
+logger = structlog.get_logger()
+
+# A ``\b`` assertion not preceded by an escaping backslash
+_WORD_BOUNDARY_RE = re.compile(r"(?<!\\)((?:\\\\)*)\\b")
+
+# Non-ASCII characters that re.IGNORECASE matches to an ASCII letter, mapped
+# to that letter. str.lower() alone gets the Kelvin sign right but not the rest
+_CASELESS_ASCII = str.maketrans(
+    {"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"}
+)
+
+
+class PatternSet:
+    """Regex patterns scanned together to find the lines any of them can match.
+
+    The patterns are joined into one alternation so a text is scanned in one
+    pass. When the optional ``hyperscan`` package is installed, they are
+    matched by a Hyperscan block-mode database instead, compiled on first use.
+    Either backend may report extra lines but never misses one, so callers
+    re-check the returned lines against the individual patterns.
+
+    Patterns may declare literal anchors, one of which every match contains.
+    ``active`` checks them with plain substring searches, or with Hyperscan
+    in one pass over the text, and patterns whose anchors are all absent
+    from a text are left out of its scan.
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[str],
+        flags: Union[int, Sequence[int]] = 0,
+        name: str = "",
+        anchors: Optional[Sequence[Optional[Sequence[str]]]] = None,
+    ) -> None:
+        """Compile the pattern set.
+
+        Args:
+            patterns: Regex patterns in Python ``re`` syntax
+            flags: ``re`` flags shared by all patterns, or one value per
+                pattern. IGNORECASE may differ between patterns; other flags
+                apply to the whole set. Only IGNORECASE is carried over to
+                Hyperscan.
+            name: Owner name used in log messages
+            anchors: Per pattern, literals of which every match contains at
+                least one; an empty or None entry means the pattern is
+                always run
+        """
+        self.patterns = tuple(patterns)
+        self.name = name
+        if isinstance(flags, int):
+            flags = [flags] * len(self.patterns)
+        self.caseless = tuple(bool(pattern_flags & re.IGNORECASE) for pattern_flags in flags)
+        self.flags = 0
+        for pattern_flags in flags:
+            self.flags |= pattern_flags & ~re.IGNORECASE
+        self._any_caseless = any(self.caseless)
+        if anchors is None:
+            anchors = [()] * len(self.patterns)
+        self.anchors = tuple(
+            tuple(anchor.lower() if caseless else anchor for anchor in literals or ())
+            for literals, caseless in zip(anchors, self.caseless, strict=True)
+        )
+        self._all = tuple(range(len(self.patterns)))
+        self._unions: dict[tuple[int, ...], re.Pattern[str]] = {}
+        self.union = self._union(self._all)
+        self._hs_db: Any = None
+        self._hs_anchor_db: Any = None
+        self._hs_disabled = hyperscan is None
+        self._hs_anchors_disabled = not all(
+            literal.isascii() for literals in self.anchors for literal in literals
+        )
+
+    def active(self, text: str) -> tuple[int, ...]:
+        """Return the indices of patterns whose anchors occur in ``text``.
+
+        The other patterns cannot match anywhere in ``text``.
+        """
+        if not any(self.anchors):
+            return self._all
+        found = self._hyperscan_anchors(text)
+        if found is not None:
+            return tuple(index for index in self._all if not self.anchors[index] or index in found)
+
+        folded = None
+        active = []
+        for index, literals in enumerate(self.anchors):
+            if literals and self.caseless[index]:
+                if folded is None:
+                    folded = text.translate(_CASELESS_ASCII) if not text.isascii() else text
+                    folded = folded.lower()
+                haystack = folded
+            else:
+                haystack = text
+            if not literals or any(literal in haystack for literal in literals):
+                active.append(index)
+        return tuple(active)
+
+    def candidate_lines(
+        self, text: str, offsets: array, active: Optional[tuple[int, ...]] = None
+    ) -> list[int]:
+        """Return 1-based line numbers touched by a pattern match, in order.
+
+        Args:
+            text: Text to scan
+            offsets: Newline index of ``text``
+            active: Indices of the patterns to scan for, from ``active``;
+                all patterns when not given
+        """
+        if active is None:
+            active = self._all
+        if not active:
+            return []
+
+        database = self._hyperscan_database()
+        if database is not None:
+            if self._any_caseless and not text.isascii():
+                # Hyperscan's caseless mode does not fold these the way re does
+                text = text.translate(_CASELESS_ASCII)
+            try:
+                data = text.encode("utf-8")
+            except UnicodeEncodeError:
+                # Lone surrogates are not valid UTF-8 for Hyperscan
+                data = None
+            if data is not None:
+                spans: list[tuple[int, int]] = []
+
+                def on_match(rule_id: int, start: int, end: int, flags: int, ctx: Any) -> None:
+                    spans.append((start, end))
+
+                database.scan(data, match_event_handler=on_match)
+                spans.sort()
+                # Byte and character offsets only coincide for ASCII input
+                if len(data) != len(text):
+                    offsets = build_newline_offsets(data)
+                return lines_for_spans(offsets, spans)
+
+        union = self._union(active)
+        return lines_for_spans(offsets, (m.span() for m in union.finditer(text)))
+
+    def _hyperscan_anchors(self, text: str) -> Optional[set[int]]:
+        """Return the indices of patterns with an anchor in ``text``, using Hyperscan.
+
+        Returns None when Hyperscan is unavailable or cannot scan ``text``.
+        """
+        database = self._hyperscan_anchor_database()
+        if database is None:
+            return None
+        if self._any_caseless and not text.isascii():
+            # Caseless literals only fold ASCII letters
+            text = text.translate(_CASELESS_ASCII)
+        try:
+            data = text.encode("utf-8")
+        except UnicodeEncodeError:
+            return None
+
+        found: set[int] = set()
+
+        def on_match(rule_id: int, start: int, end: int, flags: int, ctx: Any) -> None:
+            found.add(rule_id)
+
+        database.scan(data, match_event_handler=on_match)
+        return found
+
+    def _union(self, active: tuple[int, ...]) -> re.Pattern[str]:
+        """Return the alternation of the ``active`` patterns, compiling it once."""
+        union = self._unions.get(active)
+        if union is None:
+            union = re.compile(
+                "|".join(
+                    f"(?i:{self.patterns[index]})"
+                    if self.caseless[index]
+                    else f"(?:{self.patterns[index]})"
+                    for index in active
+                ),
+                self.flags,
+            )
+            self._unions[active] = union
+        return union
+
+    def _hyperscan_database(self) -> Any:
+        """Lazily compile the patterns into a Hyperscan database.
+
+        Patterns are compiled in UTF-8/Unicode-property mode so ``\\s`` and
+        ``\\w`` match as in Python. Hyperscan does not support ``\\b`` in that
+        mode; dropping it only widens the matches, which is safe for a
+        prefilter.
+        """
+        if self._hs_db is not None or self._hs_disabled:
+            return self._hs_db
+
+        flags = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        count = len(self.patterns)
+        try:
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(
+                expressions=[
+                    _WORD_BOUNDARY_RE.sub(r"\1", pattern).encode("utf-8")
+                    for pattern in self.patterns
+                ],
+                ids=list(range(count)),
+                elements=count,
+                flags=[
+                    flags | hyperscan.HS_FLAG_CASELESS if caseless else flags
+                    for caseless in self.caseless
+                ],
+            )
+        except Exception as e:
+            logger.warning("hyperscan_compile_failed", analyzer=self.name, error=str(e))
+            self._hs_disabled = True
+            return None
+
+        self._hs_db = database
+        return database
+
+    def _hyperscan_anchor_database(self) -> Any:
+        """Lazily compile the anchors into a Hyperscan literal database.
+
+        Each anchor is reported under its pattern's index, at most once per
+        scan. Anchors must be ASCII, as caseless matching only covers ASCII.
+        """
+        if self._hs_anchor_db is not None or self._hs_disabled or self._hs_anchors_disabled:
+            return self._hs_anchor_db
+
+        expressions: list[bytes] = []
+        ids: list[int] = []
+        flags: list[int] = []
+        for index, literals in enumerate(self.anchors):
+            for literal in literals:
+                expressions.append(re.escape(literal).encode("ascii"))
+                ids.append(index)
+                flags.append(
+                    hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_CASELESS
+                    if self.caseless[index]
+                    else hyperscan.HS_FLAG_SINGLEMATCH
+                )
+        try:
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(
+                expressions=expressions, ids=ids, elements=len(expressions), flags=flags
+            )
+        except Exception as e:
+            logger.warning("hyperscan_compile_failed", analyzer=self.name, error=str(e))
+            self._hs_anchors_disabled = True
+            return None
+
+        self._hs_anchor_db = database
+        return database
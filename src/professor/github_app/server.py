@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-from typing import Any
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from fastapi import FastAPI, HTTPException, Request
 
@@ -12,8 +15,17 @@ from professor.config import get_settings
 from professor.logging import get_logger, setup_logging
 from professor.reviewer import PRReviewer
 
+if TYPE_CHECKING:
+    import httpx
+
+    from professor.scm.github import GitHubClient
+
 logger = get_logger(__name__)
 
+# HTTP client shared by the LLM clients of every review, so connections to
+# the provider are kept alive between webhooks; closed on app shutdown
+_http_client: httpx.AsyncClient | None = None
+
 
 def verify_github_signature(body: bytes, signature_header: str | None, secret: str | None) -> bool:
     """Verify GitHub webhook signature (sha256)."""
@@ -28,14 +40,45 @@ def verify_github_signature(body: bytes, signature_header: str | None, secret: s
     return hmac.compare_digest(expected, signature_header)
 
 
+def _shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client for LLM requests, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            follow_redirects=True,
+        )
+    return _http_client
+
+
+async def _close_shared_http_client() -> None:
+    """Close the shared HTTP client if one was created."""
+    global _http_client
+    client, _http_client = _http_client, None
+    if client is not None:
+        await client.aclose()
+
+
+@lru_cache(maxsize=1)
+def _github_client(token: str) -> GitHubClient:
+    """Return the GitHub client for ``token``, reused across reviews."""
+    from professor.scm.github import GitHubClient
+
+    return GitHubClient(token)
+
+
 def _build_reviewer() -> PRReviewer:
-    """Create reviewer instance from runtime settings."""
+    """Create reviewer instance from runtime settings.
+
+    Each review gets its own LLM client, as review cost is measured from the
+    client's running total, but all of them share one HTTP connection pool.
+    """
     settings = get_settings()
     if not settings.github.token:
         raise ValueError("GITHUB_TOKEN is required for GitHub App review execution.")
 
-    from professor.scm.github import GitHubClient
-
     if settings.llm.provider == "anthropic":
         from professor.llm import AnthropicClient
 
@@ -45,6 +88,7 @@ def _build_reviewer() -> PRReviewer:
             api_key=settings.llm.anthropic_api_key,
             model=settings.llm.model,
             temperature=settings.llm.temperature,
+            http_client=_shared_http_client(),
         )
     elif settings.llm.provider == "openai":
         from professor.llm import OpenAIClient
@@ -55,12 +99,13 @@ def _build_reviewer() -> PRReviewer:
             api_key=settings.llm.openai_api_key,
             model=settings.llm.model,
             temperature=settings.llm.temperature,
+            http_client=_shared_http_client(),
         )
     else:
         raise ValueError(f"Unsupported LLM provider: {settings.llm.provider}")
 
     return PRReviewer(
-        github_client=GitHubClient(settings.github.token),
+        github_client=_github_client(settings.github.token),
         llm_client=llm_client,
         max_files=settings.review.max_review_files,
         max_file_size_kb=settings.review.max_file_size_kb,
@@ -81,7 +126,10 @@ async def _handle_pull_request_event(payload: dict[str, Any]) -> dict[str, Any]:
         raise HTTPException(status_code=400, detail="Invalid pull_request payload.")
 
     reviewer = _build_reviewer()
-    result = await reviewer.review_pull_request(owner, repo, int(pr_number))
+    try:
+        result = await reviewer.review_pull_request(owner, repo, int(pr_number))
+    finally:
+        await reviewer.aclose()
     logger.info(
         "github_app_review_complete",
         owner=owner,
@@ -104,7 +152,13 @@ async def _handle_pull_request_event(payload: dict[str, Any]) -> dict[str, Any]:
 def create_app() -> FastAPI:
     """Create configured FastAPI app for GitHub webhooks."""
     setup_logging()
-    app = FastAPI(title="Professor GitHub App", version="0.1.0")
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        yield
+        await _close_shared_http_client()
+
+    app = FastAPI(title="Professor GitHub App", version="0.1.0", lifespan=lifespan)
 
     @app.get("/health")
     async def health() -> dict[str, str]:
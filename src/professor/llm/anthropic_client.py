@@ -1,6 +1,7 @@
 """Anthropic LLM client implementation."""
 
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
+import httpx
 import structlog
 from anthropic import AsyncAnthropic, APIError, RateLimitError, APITimeoutError
 
@@ -20,6 +21,10 @@ logger = structlog.get_logger()
 class AnthropicClient(BaseLLMClient):
     """Anthropic Claude LLM client."""
 
+    # Prompt cache reads and writes relative to the base input price
+    CACHE_READ_MULTIPLIER = 0.1
+    CACHE_WRITE_MULTIPLIER = 1.25
+
     # Pricing per 1M tokens (as of 2024)
     PRICING = {
         "claude-3-5-sonnet-20240620": {"input": 3.0, "output": 15.0},
@@ -34,6 +39,7 @@ class AnthropicClient(BaseLLMClient):
         model: str = "claude-3-5-sonnet-20240620",
         temperature: float = 0.1,
         max_tokens: int = 4096,
+        http_client: Optional[httpx.AsyncClient] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize Anthropic client.
@@ -43,10 +49,13 @@ class AnthropicClient(BaseLLMClient):
             model: Model name
             temperature: Sampling temperature
             max_tokens: Maximum response tokens
+            http_client: HTTP client to send requests through, e.g. one shared
+                between clients to reuse its connections; the SDK creates its
+                own when omitted
             **kwargs: Additional parameters
         """
         super().__init__(api_key, model, temperature, max_tokens, **kwargs)
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = AsyncAnthropic(api_key=api_key, http_client=http_client)
 
     async def complete(
         self, messages: list[LLMMessage], **kwargs: Any
@@ -64,72 +73,148 @@ class AnthropicClient(BaseLLMClient):
             LLMError: If completion fails
         """
         try:
-            # Convert messages to Anthropic format
-            formatted_messages = [
-                {"role": msg.role, "content": msg.content}
-                for msg in messages
-                if msg.role != "system"
-            ]
-
-            # Extract system message if present
-            system_message = next(
-                (msg.content for msg in messages if msg.role == "system"), None
-            )
-
-            # Call API
             response = await self.client.messages.create(
-                model=kwargs.get("model", self.model),
-                messages=formatted_messages,
-                system=system_message,
-                temperature=kwargs.get("temperature", self.temperature),
-                max_tokens=kwargs.get("max_tokens", self.max_tokens),
+                **self._request_params(messages, kwargs)
             )
-
-            # Extract response
-            content = response.content[0].text
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            total_tokens = input_tokens + output_tokens
-
-            # Calculate cost
-            cost = self.estimate_cost(input_tokens, output_tokens)
-
-            # Update stats
-            self.total_tokens_used += total_tokens
-            self.total_cost += cost
-
-            logger.info(
-                "anthropic_completion",
-                model=self.model,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                cost=cost,
+            return self._record_usage(
+                response.content[0].text, response.usage, response.stop_reason
             )
+        except Exception as e:
+            raise self._translate_error(e) from e
 
-            return LLMResponse(
-                content=content,
-                model=self.model,
-                tokens_used=total_tokens,
-                cost=cost,
-                metadata={
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "stop_reason": response.stop_reason,
-                },
-            )
+    async def stream(
+        self, messages: list[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Stream a completion from Claude as text deltas.
+
+        Usage and cost are recorded once the stream finishes.
+
+        Args:
+            messages: Conversation messages
+            **kwargs: Override parameters
+
+        Yields:
+            Text fragments as they are generated
+
+        Raises:
+            LLMError: If completion fails
+        """
+        try:
+            async with self.client.messages.stream(
+                **self._request_params(messages, kwargs)
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                final = await stream.get_final_message()
+        except Exception as e:
+            raise self._translate_error(e) from e
+
+        self._record_usage(
+            "".join(block.text for block in final.content if block.type == "text"),
+            final.usage,
+            final.stop_reason,
+        )
+
+    def _request_params(
+        self, messages: list[LLMMessage], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build Messages API request parameters."""
+        # Extract system blocks if present
+        system_blocks = [
+            self._content_block(msg) for msg in messages if msg.role == "system"
+        ]
+
+        return {
+            "model": kwargs.get("model", self.model),
+            "messages": self._format_messages(
+                [msg for msg in messages if msg.role != "system"]
+            ),
+            "system": system_blocks or None,
+            "temperature": kwargs.get("temperature", self.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.max_tokens),
+        }
 
-        except RateLimitError as e:
+    def _record_usage(self, content: str, usage: Any, stop_reason: Any) -> LLMResponse:
+        """Update usage stats from an API usage block and build the response."""
+        input_tokens = usage.input_tokens
+        output_tokens = usage.output_tokens
+        cache_read_tokens = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_write_tokens = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        total_tokens = input_tokens + cache_read_tokens + cache_write_tokens + output_tokens
+
+        # Calculate cost
+        cost = self.estimate_cost(input_tokens, output_tokens) + self._estimate_cache_cost(
+            cache_read_tokens, cache_write_tokens
+        )
+
+        # Update stats
+        self.total_tokens_used += total_tokens
+        self.total_cost += cost
+
+        logger.info(
+            "anthropic_completion",
+            model=self.model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_input_tokens=cache_read_tokens,
+            cache_creation_input_tokens=cache_write_tokens,
+            cost=cost,
+        )
+
+        return LLMResponse(
+            content=content,
+            model=self.model,
+            tokens_used=total_tokens,
+            cost=cost,
+            metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_read_input_tokens": cache_read_tokens,
+                "cache_creation_input_tokens": cache_write_tokens,
+                "stop_reason": stop_reason,
+            },
+        )
+
+    @staticmethod
+    def _translate_error(e: Exception) -> LLMError:
+        """Map an Anthropic SDK exception to the matching LLMError."""
+        if isinstance(e, LLMError):
+            return e
+        if isinstance(e, RateLimitError):
             logger.error("anthropic_rate_limit", error=str(e))
-            raise LLMRateLimitError(f"Rate limit exceeded: {e}") from e
-        except APITimeoutError as e:
+            return LLMRateLimitError(f"Rate limit exceeded: {e}")
+        if isinstance(e, APITimeoutError):
             logger.error("anthropic_timeout", error=str(e))
-            raise LLMTimeoutError(f"Request timed out: {e}") from e
-        except APIError as e:
+            return LLMTimeoutError(f"Request timed out: {e}")
+        if isinstance(e, APIError):
             logger.error("anthropic_api_error", error=str(e))
-            raise LLMAPIError(f"API error: {e}") from e
-        except Exception as e:
-            logger.error("anthropic_unexpected_error", error=str(e))
-            raise LLMError(f"Unexpected error: {e}") from e
+            return LLMAPIError(f"API error: {e}")
+        logger.error("anthropic_unexpected_error", error=str(e))
+        return LLMError(f"Unexpected error: {e}")
+
+    @staticmethod
+    def _content_block(msg: LLMMessage) -> dict[str, Any]:
+        """Convert a message to a Messages API text block."""
+        block: dict[str, Any] = {"type": "text", "text": msg.content}
+        if msg.cache_control:
+            block["cache_control"] = msg.cache_control
+        return block
+
+    def _format_messages(self, messages: list[LLMMessage]) -> list[dict[str, Any]]:
+        """Convert messages to Anthropic format.
+
+        Consecutive messages with the same role are merged into one message
+        with several content blocks, so a cached prefix block can be followed
+        by an uncached tail in the same turn.
+        """
+        formatted: list[dict[str, Any]] = []
+        for msg in messages:
+            block = self._content_block(msg)
+            if formatted and formatted[-1]["role"] == msg.role:
+                formatted[-1]["content"].append(block)
+            else:
+                formatted.append({"role": msg.role, "content": [block]})
+        return formatted
 
     def count_tokens(self, text: str) -> int:
         """Count tokens using Anthropic's method.
@@ -162,3 +247,23 @@ class AnthropicClient(BaseLLMClient):
         input_cost = (input_tokens / 1_000_000) * pricing["input"]
         output_cost = (output_tokens / 1_000_000) * pricing["output"]
         return input_cost + output_cost
+
+    def _estimate_cache_cost(self, read_tokens: int, write_tokens: int) -> float:
+        """Estimate cost of prompt-cache reads and writes.
+
+        Args:
+            read_tokens: Input tokens served from the prompt cache
+            write_tokens: Input tokens written to the prompt cache
+
+        Returns:
+            Estimated cost in USD
+        """
+        pricing = self.PRICING.get(self.model)
+        if not pricing:
+            return 0.0
+
+        per_token = pricing["input"] / 1_000_000
+        return per_token * (
+            read_tokens * self.CACHE_READ_MULTIPLIER
+            + write_tokens * self.CACHE_WRITE_MULTIPLIER
+        )
@@ -1,7 +1,7 @@
 """LLM provider abstraction and integration."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 from enum import Enum
 import structlog
 
@@ -19,15 +19,20 @@ class LLMProvider(str, Enum):
 class LLMMessage(ABC):
     """Base class for LLM messages."""
 
-    def __init__(self, role: str, content: str) -> None:
+    def __init__(
+        self, role: str, content: str, cache_control: Optional[dict[str, Any]] = None
+    ) -> None:
         """Initialize message.
 
         Args:
             role: Message role (system, user, assistant)
             content: Message content
+            cache_control: Optional prompt-caching marker, e.g. {"type": "ephemeral"};
+                providers without prompt caching ignore it
         """
         self.role = role
         self.content = content
+        self.cache_control = cache_control
 
 
 class LLMResponse(ABC):
@@ -103,6 +108,26 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    async def stream(
+        self, messages: list[LLMMessage], **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Stream a completion as text fragments.
+
+        Providers without streaming support yield the whole completion at once.
+
+        Args:
+            messages: List of conversation messages
+            **kwargs: Additional parameters for this request
+
+        Yields:
+            Generated text fragments in order
+
+        Raises:
+            LLMError: If completion fails
+        """
+        response = await self.complete(messages, **kwargs)
+        yield response.content
+
     @abstractmethod
     def count_tokens(self, text: str) -> int:
         """Count tokens in text.
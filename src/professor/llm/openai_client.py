@@ -1,6 +1,7 @@
 """OpenAI LLM client implementation."""
 
-from typing import Any
+from typing import Any, Optional
+import httpx
 import structlog
 from openai import AsyncOpenAI, APIError, RateLimitError, APITimeoutError
 import tiktoken
@@ -36,6 +37,7 @@ class OpenAIClient(BaseLLMClient):
         model: str = "gpt-4-turbo-preview",
         temperature: float = 0.1,
         max_tokens: int = 4096,
+        http_client: Optional[httpx.AsyncClient] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize OpenAI client.
@@ -45,10 +47,13 @@ class OpenAIClient(BaseLLMClient):
             model: Model name
             temperature: Sampling temperature
             max_tokens: Maximum response tokens
+            http_client: HTTP client to send requests through, e.g. one shared
+                between clients to reuse its connections; the SDK creates its
+                own when omitted
             **kwargs: Additional parameters
         """
         super().__init__(api_key, model, temperature, max_tokens, **kwargs)
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(api_key=api_key, http_client=http_client)
 
         # Initialize tokenizer
         try:
@@ -1,13 +1,23 @@
 """Pull Request reviewer orchestrator."""
 
-from typing import Any
+import asyncio
+import hashlib
+import os
+import re
+from typing import Any, AsyncIterator, Optional, Union
 from dataclasses import dataclass
 import structlog
 
-from professor.core import CompositeAnalyzer, Review, ReviewStatus
+from professor.cache import CachedAnalyzer, ResultCache
+from professor.core import Analyzer, CompositeAnalyzer, Finding, Review, ReviewStatus, Severity
 from professor.core.language_router import LanguageAnalyzerRouter, LanguageCapabilities
 from professor.llm import BaseLLMClient
 
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional fast content hashing
+    xxhash = None  # type: ignore[assignment]
+
 try:
     from professor.scm.github import GitHubClient, PullRequest, FileChange
 except ModuleNotFoundError:  # pragma: no cover - optional for unit tests without github deps
@@ -17,6 +27,69 @@ except ModuleNotFoundError:  # pragma: no cover - optional for unit tests withou
 
 logger = structlog.get_logger()
 
+# Bytes sniffed for NUL characters when deciding whether content is binary
+BINARY_SNIFF_SIZE = 8192
+
+# In-flight static analyses per review: (extension, content digest) -> (path, result)
+_StaticRuns = dict[tuple[str, bytes], tuple[str, "asyncio.Future[list[Any]]"]]
+
+_VENDOR_PATH_RE = re.compile(r"(^|/)(node_modules|dist|vendor)/|\.min\.js$")
+
+
+def _content_digest(*parts: str) -> bytes:
+    """Hash text parts for duplicate detection (xxh3 when available)."""
+    hasher = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    for part in parts:
+        hasher.update(part.encode("utf-8", "surrogatepass"))
+        hasher.update(b"\x00")
+    return hasher.digest()
+
+
+def _retarget_findings(findings: list[Finding], source: str, target: str) -> list[Finding]:
+    """Copy findings computed for ``source`` so they report ``target`` instead.
+
+    Finding ids embed the path as ``<prefix>-<path>-...``; that segment is rewritten.
+    """
+    return [
+        finding.model_copy(
+            update={
+                "id": finding.id.replace(f"-{source}-", f"-{target}-", 1),
+                "location": finding.location.model_copy(update={"file_path": target}),
+            }
+        )
+        for finding in findings
+    ]
+
+
+def _should_analyze(path: str, code: str, max_size_bytes: int = 500 * 1024) -> bool:
+    """Check whether fetched file content is worth sending to analyzers.
+
+    Args:
+        path: Repository-relative file path
+        code: File content
+        max_size_bytes: Largest UTF-8 encoded content size to analyze
+
+    Returns:
+        False for vendored/bundled paths, oversized content, or binary content
+    """
+    if _VENDOR_PATH_RE.search(path):
+        return False
+    # UTF-8 never takes fewer bytes than characters; only non-ASCII text
+    # near the limit needs encoding to measure
+    if len(code) > max_size_bytes:
+        return False
+    if not code.isascii() and len(code.encode("utf-8", "surrogatepass")) > max_size_bytes:
+        return False
+    return "\x00" not in code[:BINARY_SNIFF_SIZE]
+
+
+@dataclass
+class FileReview:
+    """Findings for one file, emitted as soon as the file is fully analyzed."""
+
+    file_path: str
+    findings: list[Any]
+
 
 @dataclass
 class ReviewResult:
@@ -35,6 +108,9 @@ class ReviewResult:
 class PRReviewer:
     """Orchestrates pull request reviews."""
 
+    # Files estimated at or below this many tokens are grouped into shared LLM calls
+    LLM_BATCH_FILE_TOKENS = 512
+
     def __init__(
         self,
         github_client: GitHubClient,
@@ -46,6 +122,10 @@ class PRReviewer:
         enable_complexity_check: bool = True,
         max_critical_issues: int = 0,
         max_high_issues: int = 0,
+        concurrency: int = 10,
+        llm_batch_tokens: int = 8000,
+        skip_llm_on_critical: bool = False,
+        result_cache: Optional[ResultCache] = None,
     ) -> None:
         """Initialize PR reviewer.
 
@@ -57,6 +137,14 @@ class PRReviewer:
             enable_static_analysis: Enable static analysis (ruff)
             enable_security_scan: Enable security scanning
             enable_complexity_check: Enable complexity checks
+            max_critical_issues: Critical findings allowed before rejecting
+            max_high_issues: High findings allowed before rejecting
+            concurrency: Maximum number of files analyzed at once
+            llm_batch_tokens: Token budget for one batched LLM call over small files
+            skip_llm_on_critical: Skip LLM review of files whose static findings are
+                already CRITICAL, and send only the diff for files with HIGH findings
+            result_cache: On-disk cache of analyzer results; files whose content
+                was already analyzed reuse the stored findings, LLM included
         """
         self.github = github_client
         self.llm = llm_client
@@ -64,6 +152,10 @@ class PRReviewer:
         self.max_file_size_kb = max_file_size_kb
         self.max_critical_issues = max_critical_issues
         self.max_high_issues = max_high_issues
+        self.concurrency = max(1, concurrency)
+        self.llm_batch_tokens = llm_batch_tokens
+        self.skip_llm_on_critical = skip_llm_on_critical
+        self.result_cache = result_cache
 
         # Initialize analyzers and language router
         from professor.analyzers.llm_analyzer import LLMAnalyzer
@@ -77,21 +169,22 @@ class PRReviewer:
             RustStaticAnalyzer,
         )
 
+        # The LLM analyzer runs outside the router so small files can share a call
+        self.llm_analyzer = LLMAnalyzer(llm_client)
         self.router = LanguageAnalyzerRouter()
-        self.router.register_global(LLMAnalyzer(llm_client))
         if enable_security_scan:
-            self.router.register_global(SecurityAnalyzer())
+            self.router.register_global(self._cached(SecurityAnalyzer()))
 
         if enable_complexity_check:
-            self.router.register_language("python", ComplexityAnalyzer())
+            self.router.register_language("python", self._cached(ComplexityAnalyzer()))
 
         if enable_static_analysis:
-            self.router.register_language("javascript", ESLintAnalyzer())
-            self.router.register_language("typescript", ESLintAnalyzer())
-            self.router.register_language("java", JavaStaticAnalyzer())
-            self.router.register_language("go", GoStaticAnalyzer())
-            self.router.register_language("rust", RustStaticAnalyzer())
-            self.router.register_language("cpp", CppStaticAnalyzer())
+            self.router.register_language("javascript", self._cached(ESLintAnalyzer()))
+            self.router.register_language("typescript", self._cached(ESLintAnalyzer()))
+            self.router.register_language("java", self._cached(JavaStaticAnalyzer()))
+            self.router.register_language("go", self._cached(GoStaticAnalyzer()))
+            self.router.register_language("rust", self._cached(RustStaticAnalyzer()))
+            self.router.register_language("cpp", self._cached(CppStaticAnalyzer()))
             try:
                 from professor.analyzers.ruff_analyzer import RuffAnalyzer
 
@@ -173,6 +266,19 @@ class PRReviewer:
             languages=self.router.list_languages(),
         )
 
+    def _cached(self, analyzer: Analyzer) -> Analyzer:
+        """Wrap an analyzer with the result cache, if one is configured."""
+        if self.result_cache is None:
+            return analyzer
+        return CachedAnalyzer(analyzer, self.result_cache)
+
+    async def aclose(self) -> None:
+        """Release resources held by the analyzers, such as the Ruff server.
+
+        Call once the reviewer is no longer needed.
+        """
+        await asyncio.gather(self.router.aclose(), self.llm_analyzer.aclose())
+
     async def review_pull_request(
         self, owner: str, repo: str, pr_number: int
     ) -> ReviewResult:
@@ -186,6 +292,31 @@ class PRReviewer:
         Returns:
             ReviewResult with findings and metadata
 
+        Raises:
+            ReviewError: If review fails
+        """
+        result: Optional[ReviewResult] = None
+        async for event in self.stream_review(owner, repo, pr_number):
+            if isinstance(event, ReviewResult):
+                result = event
+        if result is None:
+            raise ReviewError("Review ended without a result")
+        return result
+
+    async def stream_review(
+        self, owner: str, repo: str, pr_number: int
+    ) -> AsyncIterator[Union[FileReview, ReviewResult]]:
+        """Review a pull request, yielding each file's findings as it finishes.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            pr_number: PR number
+
+        Yields:
+            A FileReview per analyzed file in completion order, then the
+            final ReviewResult
+
         Raises:
             ReviewError: If review fails
         """
@@ -228,35 +359,27 @@ class PRReviewer:
                 )
                 reviewable_files = reviewable_files[: self.max_files]
 
-            # Analyze each file
-            total_cost = 0.0
-            for file_change in reviewable_files:
-                try:
-                    llm_cost_before = getattr(self.llm, "total_cost", 0.0)
-                    findings = await self._analyze_file(
-                        owner, repo, pr.head_branch, file_change
-                    )
-
-                    for finding in findings:
-                        review.add_finding(finding)
-
-                    # Track cost
-                    llm_cost_after = getattr(self.llm, "total_cost", 0.0)
-                    total_cost += max(0.0, llm_cost_after - llm_cost_before)
+            # Analyze files concurrently; the semaphore bounds in-flight LLM calls
+            llm_cost_before = getattr(self.llm, "total_cost", 0.0)
+            async for file_review in self._review_files(
+                owner, repo, pr.head_branch, reviewable_files
+            ):
+                for finding in file_review.findings:
+                    review.add_finding(finding)
+                yield file_review
+
+            # Keep the final review in PR file order regardless of completion order
+            file_order = {
+                file_change.filename: index
+                for index, file_change in enumerate(reviewable_files)
+            }
+            review.findings.sort(
+                key=lambda finding: file_order.get(finding.location.file_path, len(file_order))
+            )
 
-                    logger.info(
-                        "file_analyzed",
-                        file=file_change.filename,
-                        findings=len(findings),
-                    )
-
-                except Exception as e:
-                    logger.error(
-                        "file_analysis_failed",
-                        file=file_change.filename,
-                        error=str(e),
-                    )
-                    continue
+            # Track cost
+            llm_cost_after = getattr(self.llm, "total_cost", 0.0)
+            total_cost = max(0.0, llm_cost_after - llm_cost_before)
 
             # Update review metadata
             review.summary.files_analyzed = len(reviewable_files)
@@ -282,26 +405,240 @@ class PRReviewer:
                 cost=f"${result.cost:.4f}",
             )
 
-            return result
-
         except Exception as e:
             logger.error("pr_review_failed", error=str(e))
             raise ReviewError(f"Failed to review PR: {e}") from e
 
+        yield result
+
+    async def _review_files(
+        self, owner: str, repo: str, ref: str, file_changes: list[FileChange]
+    ) -> AsyncIterator[FileReview]:
+        """Analyze files concurrently, yielding each file once all its findings are in.
+
+        Static analysis runs for every file first. Large files are sent to the
+        LLM as soon as their static pass completes; small files are batched
+        once all static passes are done.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        static_runs: _StaticRuns = {}
+        static_tasks = [
+            asyncio.create_task(
+                self._review_file(semaphore, owner, repo, ref, file_change, static_runs)
+            )
+            for file_change in file_changes
+        ]
+        llm_tasks: list[asyncio.Task[dict[str, list[Any]]]] = []
+        awaiting_llm: dict[str, list[Any]] = {}
+        # Files whose LLM input is identical share one review: representative -> paths
+        llm_groups: dict[tuple[str, bytes], list[str]] = {}
+        llm_duplicates: dict[str, list[str]] = {}
+        small_contexts: list[dict[str, Any]] = []
+
+        try:
+            for next_static in asyncio.as_completed(static_tasks):
+                analyzed = await next_static
+                if analyzed is None:
+                    continue
+                context, findings = analyzed
+                llm_context = self._llm_context(context, findings)
+                if llm_context is None or not self.llm_analyzer.supports(llm_context):
+                    yield FileReview(file_path=context["file_path"], findings=findings)
+                    continue
+
+                awaiting_llm[context["file_path"]] = findings
+                llm_key = (
+                    os.path.splitext(context["file_path"])[1],
+                    _content_digest(llm_context.get("code") or "", llm_context.get("diff") or ""),
+                )
+                group = llm_groups.setdefault(llm_key, [])
+                group.append(context["file_path"])
+                if len(group) > 1:
+                    llm_duplicates.setdefault(group[0], []).append(context["file_path"])
+                    continue
+
+                if self._llm_tokens(llm_context) > self.LLM_BATCH_FILE_TOKENS:
+                    llm_tasks.append(
+                        asyncio.create_task(self._run_llm_batch(semaphore, [llm_context]))
+                    )
+                else:
+                    small_contexts.append(llm_context)
+
+            for batch in self._batch_llm_contexts(small_contexts):
+                llm_tasks.append(asyncio.create_task(self._run_llm_batch(semaphore, batch)))
+
+            for next_llm in asyncio.as_completed(llm_tasks):
+                for file_path, llm_findings in (await next_llm).items():
+                    yield FileReview(
+                        file_path=file_path,
+                        findings=awaiting_llm.pop(file_path, []) + llm_findings,
+                    )
+                    for duplicate in llm_duplicates.get(file_path, []):
+                        yield FileReview(
+                            file_path=duplicate,
+                            findings=awaiting_llm.pop(duplicate, [])
+                            + _retarget_findings(llm_findings, file_path, duplicate),
+                        )
+
+            for file_path, findings in awaiting_llm.items():
+                yield FileReview(file_path=file_path, findings=findings)
+
+        finally:
+            for task in static_tasks + llm_tasks:
+                task.cancel()
+
+    async def _review_file(
+        self,
+        semaphore: asyncio.Semaphore,
+        owner: str,
+        repo: str,
+        ref: str,
+        file_change: FileChange,
+        static_runs: Optional[_StaticRuns] = None,
+    ) -> Optional[tuple[dict[str, Any], list[Any]]]:
+        """Statically analyze one file under the concurrency limit, logging failures.
+
+        Returns:
+            The file's analysis context and static findings, or None if the
+            file was skipped or analysis failed
+        """
+        async with semaphore:
+            try:
+                analyzed = await self._analyze_file(
+                    owner, repo, ref, file_change, static_runs=static_runs
+                )
+            except Exception as e:
+                logger.error(
+                    "file_analysis_failed",
+                    file=file_change.filename,
+                    error=str(e),
+                )
+                return None
+
+        if analyzed is None:
+            return None
+        context, findings = analyzed
+        logger.info(
+            "file_analyzed",
+            file=file_change.filename,
+            findings=len(findings),
+        )
+        return context, findings
+
+    def _llm_context(
+        self, context: dict[str, Any], static_findings: list[Any]
+    ) -> Optional[dict[str, Any]]:
+        """Pick the LLM context for a file given its static findings.
+
+        Returns:
+            The context to send, a diff-only copy when static analysis already
+            found HIGH issues, or None when a CRITICAL finding makes the LLM
+            review unnecessary (only with ``skip_llm_on_critical``)
+        """
+        if not self.skip_llm_on_critical or not static_findings:
+            return context
+
+        worst = max(finding.severity for finding in static_findings)
+        if worst >= Severity.CRITICAL:
+            logger.info("llm_skipped_on_critical", file=context["file_path"])
+            return None
+        if worst >= Severity.HIGH and context.get("diff"):
+            return {**context, "code": ""}
+        return context
+
+    async def _run_llm_batch(
+        self, semaphore: asyncio.Semaphore, batch: list[dict[str, Any]]
+    ) -> dict[str, list[Any]]:
+        """Run one LLM review call under the concurrency limit.
+
+        Files with cached LLM results are answered from the cache; the rest
+        are sent and their results stored.
+
+        Returns:
+            Mapping of file path to LLM findings
+        """
+        results: dict[str, list[Any]] = {}
+        keys: dict[str, bytes] = {}
+        if self.result_cache is not None:
+            namespace = self.llm_analyzer.cache_namespace()
+            misses = []
+            for context in batch:
+                key = ResultCache.key(namespace, context)
+                cached = self.result_cache.get(key)
+                if cached is None:
+                    keys[context["file_path"]] = key
+                    misses.append(context)
+                else:
+                    results[context["file_path"]] = cached
+            batch = misses
+            if not batch:
+                return results
+
+        async with semaphore:
+            fresh = await self.llm_analyzer.analyze_batch(batch)
+        if self.result_cache is not None:
+            for file_path, findings in fresh.items():
+                if file_path not in self.llm_analyzer.failed_paths:
+                    self.result_cache.set(keys[file_path], findings)
+        return {**results, **fresh}
+
+    def _llm_tokens(self, context: dict[str, Any]) -> int:
+        """Estimate the prompt tokens a context contributes to an LLM call."""
+        return self.llm.count_tokens((context.get("code") or "") + (context.get("diff") or ""))
+
+    def _batch_llm_contexts(
+        self, contexts: list[dict[str, Any]]
+    ) -> list[list[dict[str, Any]]]:
+        """Group small files into batches within the LLM token budget.
+
+        Files larger than ``LLM_BATCH_FILE_TOKENS`` are reviewed on their own.
+        """
+        batches: list[list[dict[str, Any]]] = []
+        current: list[dict[str, Any]] = []
+        current_tokens = 0
+
+        for context in contexts:
+            tokens = self._llm_tokens(context)
+            if tokens > self.LLM_BATCH_FILE_TOKENS:
+                batches.append([context])
+                continue
+            if current and current_tokens + tokens > self.llm_batch_tokens:
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(context)
+            current_tokens += tokens
+
+        if current:
+            batches.append(current)
+        return batches
+
     async def _analyze_file(
-        self, owner: str, repo: str, ref: str, file_change: FileChange
-    ) -> list[Any]:
-        """Analyze a single file.
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        file_change: FileChange,
+        static_runs: Optional[_StaticRuns] = None,
+    ) -> Optional[tuple[dict[str, Any], list[Any]]]:
+        """Run static analyzers on a single file.
 
         Args:
             owner: Repository owner
             repo: Repository name
             ref: Git ref
             file_change: File change to analyze
+            static_runs: Per-review registry of in-flight static analyses keyed by
+                (extension, content digest); files with identical content reuse
+                the first file's findings
 
         Returns:
-            List of findings
+            The analysis context and its static findings, or None if the
+            file was skipped
         """
+        if _VENDOR_PATH_RE.search(file_change.filename):
+            logger.info("skipping_vendored_file", file=file_change.filename)
+            return None
+
         # Get file content
         try:
             content = await self.github.get_file_content(
@@ -315,6 +652,10 @@ class PRReviewer:
             )
             content = ""
 
+        if not _should_analyze(file_change.filename, content, self.max_file_size_kb * 1024):
+            logger.info("skipping_unanalyzable_file", file=file_change.filename)
+            return None
+
         # Prepare context
         context = {
             "file_path": file_change.filename,
@@ -326,9 +667,20 @@ class PRReviewer:
 
         analyzers = self.router.get_analyzers(context["language"], context)
         if not analyzers:
-            return []
-        findings = await CompositeAnalyzer(analyzers).analyze(context)
-        return findings
+            return context, []
+        if static_runs is None:
+            return context, await CompositeAnalyzer(analyzers).analyze(context)
+
+        key = (os.path.splitext(file_change.filename)[1], _content_digest(content))
+        existing = static_runs.get(key)
+        if existing is not None:
+            source, run = existing
+            logger.info("duplicate_file_content", file=file_change.filename, source=source)
+            return context, _retarget_findings(await run, source, file_change.filename)
+
+        run = asyncio.ensure_future(CompositeAnalyzer(analyzers).analyze(context))
+        static_runs[key] = (file_change.filename, run)
+        return context, await run
 
     def _filter_files(self, file_changes: list[FileChange]) -> list[FileChange]:
         """Filter files that should be reviewed.
@@ -1,5 +1,6 @@
 """GitHub SCM adapter for Professor."""
 
+import asyncio
 from typing import Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
@@ -47,16 +48,29 @@ class FileChange:
 
 
 class GitHubClient:
-    """GitHub API client for Professor."""
+    """GitHub API client for Professor.
 
-    def __init__(self, token: str) -> None:
+    PyGithub is synchronous, so the async methods run its calls in worker
+    threads; concurrent fetches overlap and never block the event loop.
+    """
+
+    def __init__(self, token: str, requests_per_second: Optional[float] = None) -> None:
         """Initialize GitHub client.
 
+        PyGithub spaces out requests and retries secondary rate limits,
+        honoring ``Retry-After``, on its own. It waits with ``time.sleep``,
+        which only stalls the worker thread making the call.
+
         Args:
             token: GitHub personal access token or app token
+            requests_per_second: Most API requests to send per second; when
+                omitted, PyGithub's default spacing applies
         """
         auth = Auth.Token(token)
-        self.client = Github(auth=auth)
+        if requests_per_second is None:
+            self.client = Github(auth=auth)
+        else:
+            self.client = Github(auth=auth, seconds_between_requests=1 / requests_per_second)
         self.token = token
 
         logger.info("github_client_initialized")
@@ -78,35 +92,7 @@ class GitHubClient:
             GitHubError: If PR fetch fails
         """
         try:
-            repository = self.client.get_repo(f"{owner}/{repo}")
-            pr = repository.get_pull(pr_number)
-
-            logger.info(
-                "fetched_pull_request",
-                owner=owner,
-                repo=repo,
-                pr_number=pr_number,
-                title=pr.title,
-            )
-
-            return PullRequest(
-                number=pr.number,
-                title=pr.title,
-                description=pr.body or "",
-                author=pr.user.login,
-                base_branch=pr.base.ref,
-                head_branch=pr.head.ref,
-                state=pr.state,
-                url=pr.html_url,
-                diff_url=pr.diff_url,
-                created_at=pr.created_at,
-                updated_at=pr.updated_at,
-                additions=pr.additions,
-                deletions=pr.deletions,
-                changed_files=pr.changed_files,
-                commits=pr.commits,
-            )
-
+            return await asyncio.to_thread(self._get_pull_request, owner, repo, pr_number)
         except RateLimitExceededException as e:
             logger.error("github_rate_limit_exceeded", error=str(e))
             raise GitHubRateLimitError("GitHub rate limit exceeded") from e
@@ -117,6 +103,37 @@ class GitHubClient:
             logger.error("unexpected_github_error", error=str(e))
             raise GitHubError(f"Unexpected error: {e}") from e
 
+    def _get_pull_request(self, owner: str, repo: str, pr_number: int) -> PullRequest:
+        """Fetch pull request details; blocking."""
+        repository = self.client.get_repo(f"{owner}/{repo}")
+        pr = repository.get_pull(pr_number)
+
+        logger.info(
+            "fetched_pull_request",
+            owner=owner,
+            repo=repo,
+            pr_number=pr_number,
+            title=pr.title,
+        )
+
+        return PullRequest(
+            number=pr.number,
+            title=pr.title,
+            description=pr.body or "",
+            author=pr.user.login,
+            base_branch=pr.base.ref,
+            head_branch=pr.head.ref,
+            state=pr.state,
+            url=pr.html_url,
+            diff_url=pr.diff_url,
+            created_at=pr.created_at,
+            updated_at=pr.updated_at,
+            additions=pr.additions,
+            deletions=pr.deletions,
+            changed_files=pr.changed_files,
+            commits=pr.commits,
+        )
+
     async def get_file_changes(
         self, owner: str, repo: str, pr_number: int
     ) -> list[FileChange]:
@@ -134,38 +151,41 @@ class GitHubClient:
             GitHubError: If fetch fails
         """
         try:
-            repository = self.client.get_repo(f"{owner}/{repo}")
-            pr = repository.get_pull(pr_number)
-
-            files = pr.get_files()
-            changes = []
-
-            for file in files:
-                change = FileChange(
-                    filename=file.filename,
-                    status=file.status,
-                    additions=file.additions,
-                    deletions=file.deletions,
-                    changes=file.changes,
-                    patch=file.patch,
-                    previous_filename=getattr(file, "previous_filename", None),
-                )
-                changes.append(change)
-
-            logger.info(
-                "fetched_file_changes",
-                owner=owner,
-                repo=repo,
-                pr_number=pr_number,
-                file_count=len(changes),
-            )
-
-            return changes
-
+            return await asyncio.to_thread(self._get_file_changes, owner, repo, pr_number)
         except GithubException as e:
             logger.error("github_api_error", error=str(e))
             raise GitHubError(f"Failed to fetch file changes: {e}") from e
 
+    def _get_file_changes(self, owner: str, repo: str, pr_number: int) -> list[FileChange]:
+        """Get all file changes in a pull request; blocking."""
+        repository = self.client.get_repo(f"{owner}/{repo}")
+        pr = repository.get_pull(pr_number)
+
+        files = pr.get_files()
+        changes = []
+
+        for file in files:
+            change = FileChange(
+                filename=file.filename,
+                status=file.status,
+                additions=file.additions,
+                deletions=file.deletions,
+                changes=file.changes,
+                patch=file.patch,
+                previous_filename=getattr(file, "previous_filename", None),
+            )
+            changes.append(change)
+
+        logger.info(
+            "fetched_file_changes",
+            owner=owner,
+            repo=repo,
+            pr_number=pr_number,
+            file_count=len(changes),
+        )
+
+        return changes
+
     async def get_file_content(
         self, owner: str, repo: str, path: str, ref: str
     ) -> str:
@@ -184,18 +204,21 @@ class GitHubClient:
             GitHubError: If fetch fails
         """
         try:
-            repository = self.client.get_repo(f"{owner}/{repo}")
-            content = repository.get_contents(path, ref=ref)
-
-            if isinstance(content, list):
-                raise GitHubError(f"Path {path} is a directory, not a file")
-
-            return content.decoded_content.decode("utf-8")
-
+            content = await asyncio.to_thread(self._get_contents, owner, repo, path, ref)
         except GithubException as e:
             logger.error("github_api_error", error=str(e))
             raise GitHubError(f"Failed to fetch file content: {e}") from e
 
+        if isinstance(content, list):
+            raise GitHubError(f"Path {path} is a directory, not a file")
+
+        return content.decoded_content.decode("utf-8")
+
+    def _get_contents(self, owner: str, repo: str, path: str, ref: str) -> Any:
+        """Fetch the contents entry for ``path`` at ``ref``; blocking."""
+        repository = self.client.get_repo(f"{owner}/{repo}")
+        return repository.get_contents(path, ref=ref)
+
     async def post_review_comment(
         self,
         owner: str,
@@ -221,26 +244,33 @@ class GitHubClient:
             GitHubError: If posting fails
         """
         try:
-            repository = self.client.get_repo(f"{owner}/{repo}")
-            pr = repository.get_pull(pr_number)
-
-            pr.create_review_comment(
-                body=body, commit=pr.get_commits()[0], path=path, line=line
-            )
-
-            logger.info(
-                "posted_review_comment",
-                owner=owner,
-                repo=repo,
-                pr_number=pr_number,
-                path=path,
-                line=line,
+            await asyncio.to_thread(
+                self._post_review_comment, owner, repo, pr_number, body, path, line
             )
-
         except GithubException as e:
             logger.error("github_api_error", error=str(e))
             raise GitHubError(f"Failed to post comment: {e}") from e
 
+    def _post_review_comment(
+        self, owner: str, repo: str, pr_number: int, body: str, path: str, line: int
+    ) -> None:
+        """Post a review comment on a specific line; blocking."""
+        repository = self.client.get_repo(f"{owner}/{repo}")
+        pr = repository.get_pull(pr_number)
+
+        pr.create_review_comment(
+            body=body, commit=pr.get_commits()[0], path=path, line=line
+        )
+
+        logger.info(
+            "posted_review_comment",
+            owner=owner,
+            repo=repo,
+            pr_number=pr_number,
+            path=path,
+            line=line,
+        )
+
     async def create_review(
         self,
         owner: str,
@@ -264,28 +294,39 @@ class GitHubClient:
             GitHubError: If review creation fails
         """
         try:
-            repository = self.client.get_repo(f"{owner}/{repo}")
-            pr = repository.get_pull(pr_number)
-
-            commit = pr.get_commits()[pr.commits - 1]
-
-            pr.create_review(
-                commit=commit, body=body, event=event, comments=comments or []
-            )
-
-            logger.info(
-                "created_review",
-                owner=owner,
-                repo=repo,
-                pr_number=pr_number,
-                event=event,
-                comment_count=len(comments) if comments else 0,
+            await asyncio.to_thread(
+                self._create_review, owner, repo, pr_number, event, body, comments or []
             )
-
         except GithubException as e:
             logger.error("github_api_error", error=str(e))
             raise GitHubError(f"Failed to create review: {e}") from e
 
+    def _create_review(
+        self,
+        owner: str,
+        repo: str,
+        pr_number: int,
+        event: str,
+        body: str,
+        comments: list[dict[str, Any]],
+    ) -> None:
+        """Create a pull request review; blocking."""
+        repository = self.client.get_repo(f"{owner}/{repo}")
+        pr = repository.get_pull(pr_number)
+
+        commit = pr.get_commits()[pr.commits - 1]
+
+        pr.create_review(commit=commit, body=body, event=event, comments=comments)
+
+        logger.info(
+            "created_review",
+            owner=owner,
+            repo=repo,
+            pr_number=pr_number,
+            event=event,
+            comment_count=len(comments),
+        )
+
     def get_rate_limit(self) -> dict[str, Any]:
         """Get current rate limit status.
 
@@ -2,14 +2,18 @@
 
 import json
 
+import pytest
+
 from professor.benchmark import (
     DEFAULT_LANGUAGE_TARGETS,
     BenchmarkCase,
     BenchmarkDataset,
+    CorpusFile,
     LabeledFinding,
     benchmark_report_json,
     benchmark_report_markdown,
     evaluate_benchmark,
+    evaluate_benchmark_with_scorecards,
     evaluate_case,
     evaluate_curation_status,
     evaluate_release_gate,
@@ -110,6 +114,10 @@ def test_scorecards_and_coverage_validation():
     assert len(lang_cards) == 2
     assert len(family_cards) == 2
     assert coverage.valid
+    report = evaluate_benchmark(dataset)
+    assert scorecards_by_language(dataset, report.case_metrics) == lang_cards
+    assert scorecards_by_repo_family(dataset, report.case_metrics) == family_cards
+    assert evaluate_benchmark_with_scorecards(dataset) == (report, lang_cards, family_cards)
 
 
 def test_report_renderers_include_sections():
@@ -148,7 +156,13 @@ def test_load_benchmark_dataset(tmp_path):
                         "category": "security",
                     }
                 ],
-                "predicted_findings": [],
+                "predicted_findings": [
+                    {
+                        "signature": "src/app.ts:42:eval",
+                        "severity": "HIGH",
+                        "category": "security",
+                    }
+                ],
             }
         ]
     }
@@ -160,6 +174,10 @@ def test_load_benchmark_dataset(tmp_path):
     assert dataset.cases[0].case_id == "json-1"
     assert dataset.cases[0].expected_findings[0].severity == Severity.HIGH
     assert dataset.cases[0].repo_family == "frontend"
+    # Repeated labels share one instance within a load, but not across loads
+    assert dataset.cases[0].predicted_findings[0] is dataset.cases[0].expected_findings[0]
+    reloaded = load_benchmark_dataset(dataset_file)
+    assert reloaded.cases[0].expected_findings[0] is not dataset.cases[0].expected_findings[0]
 
 
 def test_generate_corpus_template_default_targets(tmp_path):
@@ -198,7 +216,10 @@ def test_evaluate_curation_status_flags_pending_cases():
     assert "todo-1" in status.pending_case_ids
 
 
-def test_update_corpus_case_appends_findings_and_metadata(tmp_path):
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_update_corpus_case_appends_findings_and_metadata(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr("professor.benchmark.harness.orjson", None)
     corpus = tmp_path / "corpus.json"
     generate_corpus_template(corpus, {"python": 1})
 
@@ -206,7 +227,7 @@ def test_update_corpus_case_appends_findings_and_metadata(tmp_path):
         corpus,
         "pyt-001",
         source_url="https://github.com/org/repo/pull/1",
-        notes="validated by reviewer",
+        notes="validé by reviewer",
         expected_finding={
             "signature": "a.py:10:sql",
             "severity": "critical",
@@ -218,6 +239,7 @@ def test_update_corpus_case_appends_findings_and_metadata(tmp_path):
     dataset = load_benchmark_dataset(corpus)
     assert dataset.cases[0].source_url == "https://github.com/org/repo/pull/1"
     assert len(dataset.cases[0].expected_findings) == 1
+    assert '"notes": "validé by reviewer"' in corpus.read_text(encoding="utf-8")
 
 
 def test_update_corpus_cases_batch(tmp_path):
@@ -252,6 +274,64 @@ def test_update_corpus_cases_batch(tmp_path):
     assert len(dataset.cases[1].predicted_findings) == 1
 
 
+def test_update_corpus_case_reparses_only_changed_files(tmp_path, monkeypatch):
+    from professor.benchmark import harness
+
+    corpus = tmp_path / "corpus.json"
+    generate_corpus_template(corpus, {"python": 2})
+    reads = []
+    read_json = harness._read_json
+    monkeypatch.setattr(harness, "_read_json", lambda path: reads.append(path) or read_json(path))
+
+    update_corpus_case(corpus, "pyt-001", notes="first")
+    update_corpus_case(corpus, "pyt-002", notes="second")
+    assert len(reads) == 1
+
+    raw = json.loads(corpus.read_text(encoding="utf-8"))
+    raw["cases"][0]["notes"] = "edited elsewhere"
+    corpus.write_text(json.dumps(raw), encoding="utf-8")
+    update_corpus_case(corpus, "pyt-002", source_url="https://github.com/org/repo/pull/2")
+    assert len(reads) == 2
+
+    dataset = load_benchmark_dataset(corpus)
+    assert [case.notes for case in dataset.cases] == ["edited elsewhere", "second"]
+
+
+def test_corpus_file_applies_updates_in_memory_until_saved(tmp_path):
+    corpus_path = tmp_path / "corpus.json"
+    generate_corpus_template(corpus_path, {"python": 2})
+    original = corpus_path.read_bytes()
+    corpus = CorpusFile(corpus_path)
+
+    corpus.update_case("pyt-001", notes="first")
+    corpus.update_case("pyt-002", source_url="https://github.com/org/repo/pull/2")
+    with pytest.raises(ValueError):
+        corpus.update_cases([{"case_id": "pyt-001", "notes": "x"}, {"case_id": "missing"}])
+
+    assert corpus_path.read_bytes() == original
+    corpus.save()
+    dataset = load_benchmark_dataset(corpus_path)
+    assert [case.notes for case in dataset.cases] == ["first", ""]
+    assert dataset.cases[1].source_url == "https://github.com/org/repo/pull/2"
+    assert list(tmp_path.iterdir()) == [corpus_path]
+
+
+def test_corpus_file_rejects_duplicate_case_ids(tmp_path):
+    corpus_path = tmp_path / "corpus.json"
+    generate_corpus_template(corpus_path, {"python": 2})
+    raw = json.loads(corpus_path.read_text(encoding="utf-8"))
+    raw["cases"][1]["case_id"] = "pyt-001"
+    corpus_path.write_text(json.dumps(raw), encoding="utf-8")
+    original = corpus_path.read_bytes()
+
+    with pytest.raises(ValueError, match="more than once"):
+        update_corpus_case(corpus_path, "pyt-001", notes="ambiguous")
+    with pytest.raises(ValueError, match="more than once"):
+        update_corpus_cases(corpus_path, [{"case_id": "pyt-001", "notes": "ambiguous"}])
+
+    assert corpus_path.read_bytes() == original
+
+
 def test_load_curation_updates(tmp_path):
     updates_file = tmp_path / "updates.json"
     updates_file.write_text(
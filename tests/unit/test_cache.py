@@ -0,0 +1,77 @@
+"""Tests for the on-disk analyzer result cache."""
+
+import pytest
+
+from professor.cache import CachedAnalyzer, ResultCache
+from professor.core import Analyzer, Finding, FindingCategory, Location, Severity
+
+
+class CountingAnalyzer(Analyzer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def analyze(self, context):
+        self.calls += 1
+        return [
+            Finding(
+                id=f"counting-{context['file_path']}-1",
+                severity=Severity.LOW,
+                category=FindingCategory.STYLE,
+                title="t",
+                message="m",
+                location=Location(file_path=context["file_path"], line_start=1),
+                analyzer=self.name,
+            )
+        ]
+
+    def supports(self, context):
+        return True
+
+
+def test_result_cache_round_trip(tmp_path):
+    cache = ResultCache(tmp_path)
+    key = ResultCache.key("A:1", {"file_path": "a.py", "code": "x = 1"})
+    findings = [
+        Finding(
+            id="f",
+            severity=Severity.HIGH,
+            category=FindingCategory.SECURITY,
+            title="t",
+            message="m",
+            location=Location(file_path="a.py", line_start=3),
+            analyzer="A",
+        )
+    ]
+
+    assert cache.get(key) is None
+    cache.set(key, findings)
+    cache.close()
+
+    assert ResultCache(tmp_path).get(key) == findings
+
+
+def test_result_cache_key_covers_inputs():
+    context = {"file_path": "a.py", "language": "python", "code": "x = 1", "diff": ""}
+    key = ResultCache.key("A:1", context)
+
+    assert ResultCache.key("A:1", dict(context)) == key
+    assert ResultCache.key("A:2", context) != key
+    assert ResultCache.key("A:1", {**context, "code": "x = 2"}) != key
+    assert ResultCache.key("A:1", {**context, "file_path": "b.py"}) != key
+    assert ResultCache.key("A:1", {**context, "diff": "+x = 1"}) != key
+
+
+@pytest.mark.asyncio
+async def test_cached_analyzer_reuses_results(tmp_path):
+    inner = CountingAnalyzer()
+    analyzer = CachedAnalyzer(inner, ResultCache(tmp_path))
+    context = {"file_path": "a.py", "code": "x = 1"}
+
+    first = await analyzer.analyze(context)
+    second = await analyzer.analyze(dict(context))
+    await analyzer.analyze({**context, "code": "x = 2"})
+
+    assert inner.calls == 2
+    assert second == first
+    assert analyzer.name == "CountingAnalyzer"
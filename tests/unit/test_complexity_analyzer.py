@@ -111,3 +111,57 @@ async def test_supports():
     assert analyzer.supports({"file_path": "test.py", "code": "x = 1"})
     assert not analyzer.supports({"file_path": "test.js", "code": "var x = 1"})
     assert not analyzer.supports({"file_path": "test.py"})
+
+
+@pytest.mark.asyncio
+async def test_parse_is_cached_per_source(monkeypatch):
+    """Identical source is parsed once and yields identical findings."""
+    from professor.analyzers import complexity_analyzer
+
+    parses = []
+    measure = complexity_analyzer.measure
+    monkeypatch.setattr(
+        complexity_analyzer, "measure", lambda code: parses.append(code) or measure(code)
+    )
+    analyzer = ComplexityAnalyzer(max_params=2)
+    code = "def f(a, b, c):\n    return a\n"
+
+    complexity_analyzer._parse_cache.clear()
+    first = await analyzer.analyze({"file_path": "a.py", "code": code})
+    second = await analyzer.analyze({"file_path": "b.py", "code": code})
+
+    assert parses == [code]
+    assert all(isinstance(key, bytes) for key in complexity_analyzer._parse_cache)
+    assert [f.title for f in first] == [f.title for f in second]
+    assert second[0].location.file_path == "b.py"
+
+
+def test_chunked_measure_matches_whole_file():
+    """Pieces split at top-level definitions measure the same as the whole file."""
+    from professor.analyzers._complexity_ext import measure, measure_piece, merge, split_top_level
+
+    code = "import os\n\n" + "".join(
+        f"@decorator\ndef f{i}(a, b):\n    if a and b:\n        return a\n    return b\n\n"
+        f"class C{i}:\n    def m(self):\n        pass\n\n"
+        for i in range(20)
+    )
+
+    pieces = split_top_level(code, chunk_lines=25)
+
+    assert len(pieces) > 1
+    assert "".join(text for _, text in pieces) == code
+    assert all(text.startswith(("import", "@decorator", "class")) for _, text in pieces)
+    assert merge([measure_piece(offset, text) for offset, text in pieces]) == measure(code)
+
+
+def test_chunk_split_inside_string_fails_to_parse():
+    """A cut inside a multi-line string leaves an unparseable piece."""
+    from professor.analyzers._complexity_ext import measure_piece, split_top_level
+
+    code = 'DOC = """\n' + "\n" * 5 + "def not_code():\n" + '"""\n'
+
+    pieces = split_top_level(code, chunk_lines=1)
+
+    assert len(pieces) == 2
+    with pytest.raises(SyntaxError):
+        measure_piece(*pieces[0])
@@ -0,0 +1,32 @@
+"""Tests for settings loading."""
+
+from professor.config import LLMSettings, Settings
+
+
+def test_nested_settings_read_dotenv(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text(
+        "PROFESSOR_ENV=staging\nGITHUB_TOKEN=from-dotenv\nAPI_PORT=9000\nLOG_LEVEL=DEBUG\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.delenv("API_PORT", raising=False)
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+
+    settings = Settings()
+
+    assert settings.env == "staging"
+    assert settings.github.token == "from-dotenv"
+    assert settings.api.port == 9000
+    # The environment takes precedence over .env
+    assert settings.log.level == "WARNING"
+
+
+def test_explicit_nested_settings_are_kept(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text("PROVIDER=openai\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("PROVIDER", raising=False)
+
+    settings = Settings(llm=LLMSettings(provider="anthropic"))
+
+    assert settings.llm.provider == "anthropic"
@@ -1,7 +1,10 @@
 """Tests for top-6 language analyzers."""
 
+import re
+
 import pytest
 
+from professor.analyzers import language_tool_analyzers
 from professor.analyzers.language_tool_analyzers import (
     CppStaticAnalyzer,
     ESLintAnalyzer,
@@ -54,3 +57,68 @@ async def test_cpp_analyzer_detects_strcpy():
     assert findings
     assert findings[0].severity == Severity.CRITICAL
 
+
+
+@pytest.mark.asyncio
+async def test_regex_analyzer_reports_each_rule_per_line_and_skips_comments():
+    analyzer = CppStaticAnalyzer()
+    code = "\n".join(
+        [
+            "// strcpy(dst, src);",
+            "int main() {",
+            "  strcpy(dst, src); sprintf(buf, fmt);",
+            "  system(cmd);",
+            "}",
+        ]
+    )
+    findings = await analyzer.analyze({"file_path": "main.cpp", "code": code})
+
+    assert [(f.location.line_start, f.title) for f in findings] == [
+        (3, "Unsafe strcpy usage"),
+        (3, "Unbounded sprintf usage"),
+        (4, "System shell execution"),
+    ]
+
+
+class FakeRuleSet:
+    """Stands in for ``professor_scan_rs.RuleSet``: ``(line, rule)`` hits in order."""
+
+    def __init__(self, patterns):
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+
+    def scan(self, code):
+        return [
+            (index, rule_index)
+            for index, line in enumerate(code.split("\n"), 1)
+            for rule_index, pattern in enumerate(self.patterns)
+            if pattern.search(line)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_native_scanner_hits_match_python_path(monkeypatch):
+    code = "\n".join(
+        [
+            "// strcpy(dst, src);",
+            "int main() {",
+            "  strcpy(dst, src); sprintf(buf, fmt);",
+            "  system(cmd);",
+            "}",
+        ]
+    )
+    context = {"file_path": "main.cpp", "code": code}
+    expected = await CppStaticAnalyzer().analyze(dict(context))
+
+    fake_module = type("professor_scan_rs", (), {"RuleSet": FakeRuleSet})
+    monkeypatch.setattr(language_tool_analyzers, "professor_scan_rs", fake_module)
+    monkeypatch.setattr(CppStaticAnalyzer, "_rs_rules", None)
+    monkeypatch.setattr(CppStaticAnalyzer, "_rs_disabled", False)
+    analyzer = CppStaticAnalyzer()
+
+    findings = await analyzer.analyze(dict(context))
+
+    assert isinstance(CppStaticAnalyzer._rs_rules, FakeRuleSet)
+    assert [f.model_dump(exclude={"created_at"}) for f in findings] == [
+        f.model_dump(exclude={"created_at"}) for f in expected
+    ]
+    assert len(findings) == 3
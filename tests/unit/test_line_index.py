@@ -0,0 +1,47 @@
+"""Tests for the shared newline offset index."""
+
+import pytest
+
+from professor.core import line_index
+from professor.core.line_index import (
+    build_newline_offsets,
+    cached_newline_offsets,
+    get_newline_offsets,
+    line_of,
+    line_text,
+)
+
+
+def test_line_lookup_and_slicing():
+    code = "first\nsecond\n\nlast"
+    context = {"code": code}
+    offsets = get_newline_offsets(context)
+
+    assert list(offsets) == [5, 12, 13]
+    assert context["newline_offsets"] is offsets
+    assert get_newline_offsets(context) is offsets
+    assert [line_of(offsets, code.index(word)) for word in ("first", "second", "last")] == [1, 2, 4]
+    # A newline belongs to the line it terminates
+    assert line_of(offsets, 5) == 1
+    assert [line_text(code, offsets, line) for line in range(1, 5)] == ["first", "second", "", "last"]
+
+
+def test_index_is_not_reused_for_replaced_code():
+    context = {"code": "a\nb\n"}
+    get_newline_offsets(context)
+    copied = {**context, "code": "no newline"}
+
+    assert cached_newline_offsets(copied) is None
+    assert list(get_newline_offsets(copied)) == []
+    assert list(get_newline_offsets(context)) == [1, 3]
+
+
+@pytest.mark.skipif(line_index.numpy is None, reason="numpy not installed")
+@pytest.mark.parametrize("text", ["a\nb\n\nc", "é\nß\n\U0001f600\nx", "a\ud800\nb", b"a\n\xc3\xa9\n"])
+def test_numpy_offsets_match_scalar_search(monkeypatch, text):
+    monkeypatch.setattr(line_index, "NUMPY_MIN_SIZE", 0)
+    vectorized = build_newline_offsets(text)
+    monkeypatch.setattr(line_index, "numpy", None)
+
+    assert vectorized == build_newline_offsets(text)
+    assert vectorized.typecode == "q"
@@ -0,0 +1,119 @@
+"""Tests for LLM analyzer response handling."""
+
+import pytest
+
+from professor.analyzers import llm_analyzer
+from professor.analyzers.llm_analyzer import LLMAnalyzer
+from professor.core.models import Severity
+from professor.llm.base import BaseLLMClient, LLMResponse
+
+
+class ChunkedLLMClient(BaseLLMClient):
+    """Streams a canned response in small fragments."""
+
+    def __init__(self, text: str, chunk_size: int = 5) -> None:
+        super().__init__(api_key="test", model="test")
+        self.text = text
+        self.chunk_size = chunk_size
+
+    async def complete(self, messages, **kwargs):
+        raise AssertionError("analyze should stream")
+
+    async def stream(self, messages, **kwargs):
+        for start in range(0, len(self.text), self.chunk_size):
+            yield self.text[start : start + self.chunk_size]
+
+    def count_tokens(self, text: str) -> int:
+        return len(text) // 4
+
+    def estimate_cost(self, input_tokens: int, output_tokens: int) -> float:
+        return 0.0
+
+
+@pytest.mark.asyncio
+async def test_streamed_findings_are_parsed_across_fragments():
+    response = (
+        "Findings:\n["
+        '{"severity": "high", "category": "bug", "title": "Off by one", '
+        '"message": "m", "line": 4},'
+        '{"severity": "unknown", "category": "bug", "title": "bad", "message": "m"},'
+        '{"severity": "low", "category": "style", "title": "Naming", "message": "m", "line": 9}'
+        "]"
+    )
+    analyzer = LLMAnalyzer(ChunkedLLMClient(response))
+
+    findings = await analyzer.analyze({"file_path": "a.py", "code": "x = 1"})
+
+    assert [(f.id, f.severity, f.location.line_start) for f in findings] == [
+        ("llm-a.py-0", Severity.HIGH, 4),
+        ("llm-a.py-2", Severity.LOW, 9),
+    ]
+
+
+class FailingArrayStream:
+    """Yields the first two array elements, then fails like a broken parse."""
+
+    def __init__(self) -> None:
+        self.pending = [
+            {"severity": "unknown", "category": "bug", "title": "bad", "message": "m"},
+            {"severity": "high", "category": "bug", "title": "A", "message": "m"},
+        ]
+
+    def feed(self, text):
+        items, self.pending = self.pending, []
+        return items
+
+    def close(self):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_stream_fallback_keeps_findings_after_skipped_elements(monkeypatch):
+    response = (
+        "["
+        '{"severity": "unknown", "category": "bug", "title": "bad", "message": "m"},'
+        '{"severity": "high", "category": "bug", "title": "A", "message": "m"},'
+        '{"severity": "medium", "category": "bug", "title": "B", "message": "m"},'
+        '{"severity": "low", "category": "style", "title": "C", "message": "m"}'
+        "]"
+    )
+    monkeypatch.setattr(llm_analyzer, "ijson", object())
+    monkeypatch.setattr(llm_analyzer, "_JSONArrayStream", FailingArrayStream)
+    analyzer = LLMAnalyzer(ChunkedLLMClient(response))
+
+    findings = await analyzer.analyze({"file_path": "a.py", "code": "x = 1"})
+
+    assert [(f.id, f.title) for f in findings] == [
+        ("llm-a.py-1", "A"),
+        ("llm-a.py-2", "B"),
+        ("llm-a.py-3", "C"),
+    ]
+    assert "a.py" not in analyzer.failed_paths
+
+
+class BatchLLMClient(ChunkedLLMClient):
+    """Answers batches with a canned object and single files by streaming."""
+
+    def __init__(self, batch_text: str, text: str) -> None:
+        super().__init__(text)
+        self.batch_text = batch_text
+
+    async def complete(self, messages, **kwargs):
+        return LLMResponse(self.batch_text, model="test", tokens_used=1)
+
+
+@pytest.mark.asyncio
+async def test_batch_paths_missing_from_response_are_reviewed_alone():
+    llm = BatchLLMClient(
+        '{"a.py": [{"severity": "high", "category": "bug", "title": "A", "message": "m"}]}',
+        '[{"severity": "low", "category": "style", "title": "B", "message": "m"}]',
+    )
+    analyzer = LLMAnalyzer(llm)
+
+    results = await analyzer.analyze_batch(
+        [{"file_path": "a.py", "code": "x = 1"}, {"file_path": "b.py", "code": "y = 2"}]
+    )
+
+    assert [f.title for f in results["a.py"]] == ["A"]
+    assert [f.title for f in results["b.py"]] == ["B"]
+    assert not analyzer.failed_paths
@@ -2,6 +2,7 @@
 
 import pytest
 from datetime import datetime
+from pydantic import ValidationError
 from professor.core.models import (
     Finding,
     FindingCategory,
@@ -174,3 +175,40 @@ def test_review_approval_logic():
     )
     review.add_finding(high_finding)
     assert not review.summary.is_approved
+
+
+def test_severity_orders_by_rank_and_keeps_string_values():
+    """Severities compare by rank while serializing as plain strings."""
+    import pickle
+
+    assert Severity.CRITICAL > Severity.HIGH > Severity.MEDIUM > Severity.LOW > Severity.INFO
+    assert sorted([Severity.LOW, Severity.CRITICAL, Severity.INFO]) == [
+        Severity.INFO,
+        Severity.LOW,
+        Severity.CRITICAL,
+    ]
+    assert Severity("high") is Severity.HIGH
+    assert Severity.HIGH == "high"
+    assert pickle.loads(pickle.dumps(Severity.MEDIUM)) is Severity.MEDIUM
+
+    finding = Finding(
+        id="f",
+        severity="critical",
+        category=FindingCategory.BUG,
+        title="t",
+        message="m",
+        location=Location(file_path="a.py", line_start=1),
+        analyzer="test",
+    )
+    assert finding.severity is Severity.CRITICAL
+    assert finding.model_dump(mode="json")["severity"] == "critical"
+
+
+def test_location_is_immutable_and_hashable():
+    """Test that locations can be shared between findings safely."""
+    location = Location(file_path="src/main.py", line_start=10)
+
+    with pytest.raises(ValidationError):
+        location.line_start = 11
+    assert hash(location) == hash(Location(file_path="src/main.py", line_start=10))
+    assert location.model_copy(update={"file_path": "b.py"}).file_path == "b.py"
@@ -0,0 +1,69 @@
+"""Tests for multi-pattern candidate line scanning."""
+
+import re
+
+import pytest
+
+from professor.core.line_index import build_newline_offsets
+from professor.core.pattern_scan import PatternSet
+
+
+@pytest.mark.parametrize("use_hyperscan", [True, False])
+def test_candidate_lines_cover_every_matching_line(use_hyperscan):
+    patterns = PatternSet(
+        [r"\beval\s*\(", r"password\s*=\s*'[^']+'", r"pickle\.load"], re.IGNORECASE
+    )
+    if not use_hyperscan:
+        patterns._hs_disabled = True
+    # Non-ASCII whitespace, case folds and text shift byte offsets and must still match
+    text = "x = 1\nEVAL\u00a0(y)\nz = 'é'\nretrieval(q)\nPASSWORD = 'a'\nP\u0130CKLE.load\n"
+
+    lines = patterns.candidate_lines(text, build_newline_offsets(text))
+
+    assert {2, 5, 6} <= set(lines)
+    assert lines == sorted(set(lines))
+
+
+def test_multiline_match_marks_every_covered_line():
+    patterns = PatternSet([r"password\s*=\s*'[^']+'"])
+    patterns._hs_disabled = True
+    text = "a\npassword =\n  'x\ny'\nb\n"
+
+    assert patterns.candidate_lines(text, build_newline_offsets(text)) == [2, 3, 4]
+
+
+@pytest.mark.parametrize("use_hyperscan", [True, False])
+def test_patterns_without_anchor_in_text_are_skipped(use_hyperscan):
+    patterns = PatternSet(
+        [r"\beval\s*\(", r"pickle\.loads?\s*\(", r"\d+"],
+        re.IGNORECASE,
+        anchors=[("eval",), ("pickle.load",), ()],
+    )
+    if not use_hyperscan:
+        patterns._hs_disabled = True
+    text = "x = EVAL(y)\nz = 'pickle'\n"
+
+    active = patterns.active(text)
+
+    assert active == (0, 2)
+    assert patterns.active("p\u0131ckle.load(f)") == (1, 2)
+    assert patterns.candidate_lines(text, build_newline_offsets(text), active) == [1]
+    assert patterns.candidate_lines(text, build_newline_offsets(text), ()) == []
+
+
+@pytest.mark.parametrize("use_hyperscan", [True, False])
+def test_per_pattern_flags(use_hyperscan):
+    patterns = PatternSet(
+        [r"AKIA[0-9A-Z]{4}", r"password\s*="],
+        [0, re.IGNORECASE],
+        anchors=[("AKIA",), ("password",)],
+    )
+    if not use_hyperscan:
+        patterns._hs_disabled = True
+    text = "akiaABCD\nPassWord = 1\nAKIAABCD\n"
+
+    active = patterns.active(text)
+
+    assert active == (0, 1)
+    assert patterns.active("akiaABCD") == ()
+    assert patterns.candidate_lines(text, build_newline_offsets(text), active) == [2, 3]
@@ -0,0 +1,240 @@
+"""Tests for PR reviewer orchestration."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from professor.core import Finding, FindingCategory, Location, Severity
+from professor.reviewer import FileReview, PRReviewer, ReviewResult, _should_analyze
+
+
+class FakeGitHubClient:
+    def __init__(self, filenames: list[str], contents: dict[str, str] | None = None) -> None:
+        self.filenames = filenames
+        self.contents = contents or {}
+
+    async def get_pull_request(self, owner, repo, pr_number):
+        return SimpleNamespace(head_branch="main", additions=1, deletions=0)
+
+    async def get_file_content(self, owner, repo, path, ref):
+        return self.contents.get(path, f"# {path}\n")
+
+    async def get_file_changes(self, owner, repo, pr_number):
+        return [
+            SimpleNamespace(filename=name, status="modified", changes=1, patch="")
+            for name in self.filenames
+        ]
+
+
+class FakeLLMClient:
+    total_cost = 0.0
+
+    def __init__(self, content: str = "[]") -> None:
+        self.content = content
+        self.calls = []
+
+    async def complete(self, messages):
+        self.calls.append(messages)
+        return SimpleNamespace(content=self.content, tokens_used=1, cost=0.0, metadata={})
+
+    def count_tokens(self, text: str) -> int:
+        return len(text) // 4
+
+
+@pytest.mark.asyncio
+async def test_files_are_analyzed_concurrently_within_limit():
+    filenames = [f"file{i}.py" for i in range(6)]
+    reviewer = PRReviewer(
+        github_client=FakeGitHubClient(filenames),
+        llm_client=FakeLLMClient(),
+        concurrency=2,
+    )
+    in_flight = 0
+    peak = 0
+
+    async def fake_analyze_file(owner, repo, ref, file_change, static_runs=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if file_change.filename == "file3.py":
+            raise RuntimeError("boom")
+        return {"file_path": file_change.filename, "code": ""}, [
+            Finding(
+                id=f"f-{file_change.filename}",
+                severity=Severity.LOW,
+                category=FindingCategory.STYLE,
+                title="t",
+                message="m",
+                location=Location(file_path=file_change.filename, line_start=1),
+                analyzer="test",
+            )
+        ]
+
+    reviewer._analyze_file = fake_analyze_file
+    result = await reviewer.review_pull_request("o", "r", 1)
+
+    assert peak == 2
+    assert [f.location.file_path for f in result.review.findings] == [
+        name for name in filenames if name != "file3.py"
+    ]
+    assert result.review.summary.files_analyzed == len(filenames)
+
+
+@pytest.mark.asyncio
+async def test_small_files_share_one_llm_call():
+    llm = FakeLLMClient(
+        '{"a.py": [{"severity": "high", "category": "bug", "title": "t", '
+        '"message": "m", "line": 3}], "b.py": []}'
+    )
+    reviewer = PRReviewer(
+        github_client=FakeGitHubClient([]),
+        llm_client=llm,
+        enable_security_scan=False,
+        enable_complexity_check=False,
+        enable_static_analysis=False,
+    )
+    contexts = [
+        {"file_path": "a.py", "code": "x = 1\n", "language": "python"},
+        {"file_path": "b.py", "code": "y = 2\n", "language": "python"},
+        {"file_path": "big.py", "code": "z = 3\n" * 1000, "language": "python"},
+    ]
+
+    assert [len(batch) for batch in reviewer._batch_llm_contexts(contexts)] == [1, 2]
+
+    results = await reviewer._run_llm_batch(asyncio.Semaphore(1), contexts[:2])
+
+    assert len(llm.calls) == 1
+    assert "### FILE: a.py" in llm.calls[0][-1].content
+    assert [f.location.line_start for f in results["a.py"]] == [3]
+    assert results["b.py"] == []
+
+
+def test_should_analyze_rejects_vendored_binary_and_oversized_files():
+    assert _should_analyze("src/app.py", "x = 1\n")
+    assert not _should_analyze("web/node_modules/lib/index.js", "x")
+    assert not _should_analyze("vendor/pkg/a.go", "x")
+    assert not _should_analyze("static/app.min.js", "x")
+    assert not _should_analyze("data/blob.py", "abc\x00def")
+    assert not _should_analyze("src/big.py", "x" * 11, max_size_bytes=10)
+    # The limit is in encoded bytes, not characters
+    assert _should_analyze("src/name.py", "é" * 5, max_size_bytes=10)
+    assert not _should_analyze("src/name.py", "é" * 6, max_size_bytes=10)
+
+
+def _static_finding(severity: Severity) -> Finding:
+    return Finding(
+        id=f"static-{severity.value}",
+        severity=severity,
+        category=FindingCategory.SECURITY,
+        title="t",
+        message="m",
+        location=Location(file_path="a.py", line_start=1),
+        analyzer="test",
+    )
+
+
+def test_llm_context_follows_static_severity_policy():
+    reviewer = PRReviewer(
+        github_client=FakeGitHubClient([]),
+        llm_client=FakeLLMClient(),
+        skip_llm_on_critical=True,
+    )
+    context = {"file_path": "a.py", "code": "x = 1", "diff": "+x = 1"}
+
+    assert reviewer._llm_context(context, []) is context
+    assert reviewer._llm_context(context, [_static_finding(Severity.MEDIUM)]) is context
+    assert reviewer._llm_context(context, [_static_finding(Severity.HIGH)]) == {
+        "file_path": "a.py",
+        "code": "",
+        "diff": "+x = 1",
+    }
+    assert reviewer._llm_context(context, [_static_finding(Severity.CRITICAL)]) is None
+
+    reviewer.skip_llm_on_critical = False
+    assert reviewer._llm_context(context, [_static_finding(Severity.CRITICAL)]) is context
+
+
+@pytest.mark.asyncio
+async def test_stream_review_yields_each_file_then_result():
+    llm = FakeLLMClient('{"a.py": [], "b.py": []}')
+    reviewer = PRReviewer(
+        github_client=FakeGitHubClient(["a.py", "b.py"]),
+        llm_client=llm,
+        enable_security_scan=False,
+        enable_complexity_check=False,
+        enable_static_analysis=False,
+    )
+
+    events = [event async for event in reviewer.stream_review("o", "r", 1)]
+
+    assert sorted(e.file_path for e in events if isinstance(e, FileReview)) == ["a.py", "b.py"]
+    assert isinstance(events[-1], ReviewResult)
+    assert len(llm.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_duplicate_contents_are_analyzed_once():
+    secret = 'password = "hunter2hunter2"\n'
+    llm = FakeLLMClient(
+        '{"a.py": [{"severity": "low", "category": "style", "title": "t", "message": "m"}]}'
+    )
+    reviewer = PRReviewer(
+        github_client=FakeGitHubClient(
+            ["a.py", "copy/a.py", "other.py"],
+            contents={"a.py": secret, "copy/a.py": secret},
+        ),
+        llm_client=llm,
+        enable_complexity_check=False,
+        enable_static_analysis=False,
+    )
+    analyzed = []
+    security = reviewer.router.get_analyzers("python")[0]
+    original = security.analyze
+
+    async def counting_analyze(context):
+        analyzed.append(context["file_path"])
+        return await original(context)
+
+    security.analyze = counting_analyze
+    result = await reviewer.review_pull_request("o", "r", 1)
+
+    assert sorted(analyzed) == ["a.py", "other.py"]
+    by_path = {}
+    for finding in result.review.findings:
+        by_path.setdefault(finding.location.file_path, []).append(finding)
+    assert [f.analyzer for f in by_path["copy/a.py"]] == [f.analyzer for f in by_path["a.py"]]
+    assert all("copy/a.py" in f.id for f in by_path["copy/a.py"])
+    assert "LLMAnalyzer" in [f.analyzer for f in by_path["copy/a.py"]]
+
+
+@pytest.mark.asyncio
+async def test_result_cache_skips_repeat_llm_reviews(tmp_path):
+    from professor.cache import ResultCache
+
+    cache = ResultCache(tmp_path)
+    failing = FakeLLMClient("not json")
+    llm = FakeLLMClient(
+        '{"a.py": [{"severity": "low", "category": "style", "title": "t", "message": "m"}],'
+        ' "b.py": []}'
+    )
+
+    def make_reviewer(client):
+        return PRReviewer(
+            github_client=FakeGitHubClient(["a.py", "b.py"]),
+            llm_client=client,
+            enable_complexity_check=False,
+            enable_static_analysis=False,
+            result_cache=cache,
+        )
+
+    await make_reviewer(failing).review_pull_request("o", "r", 1)
+    first = await make_reviewer(llm).review_pull_request("o", "r", 1)
+    second = await make_reviewer(llm).review_pull_request("o", "r", 1)
+
+    # Failed reviews are not cached; successful ones are served on the re-run
+    assert len(llm.calls) == 1
+    assert [f.title for f in second.review.findings] == [f.title for f in first.review.findings]
+    assert [f.analyzer for f in second.review.findings] == ["LLMAnalyzer"]
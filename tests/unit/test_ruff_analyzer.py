@@ -0,0 +1,117 @@
+"""Tests for Ruff analyzer."""
+
+import asyncio
+import shutil
+import tempfile
+
+import pytest
+
+from professor.analyzers.ruff_analyzer import RuffAnalyzer, _iter_json_array
+from professor.core.models import FindingCategory, Severity
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("disabled", [(), ("orjson",), ("orjson", "ijson")])
+async def test_iter_json_array_yields_elements(monkeypatch, disabled):
+    for parser in disabled:
+        monkeypatch.setattr(f"professor.analyzers.ruff_analyzer.{parser}", None)
+    stream = asyncio.StreamReader()
+    stream.feed_data(b'[{"code": "F401"}, ')
+    stream.feed_data(b'{"code": "E501"}]')
+    stream.feed_eof()
+
+    assert [item async for item in _iter_json_array(stream)] == [
+        {"code": "F401"},
+        {"code": "E501"},
+    ]
+
+
+def test_issue_to_finding_maps_rule_prefix():
+    analyzer = RuffAnalyzer()
+    issue = {
+        "code": "F401",
+        "message": "`os` imported but unused",
+        "location": {"row": 3, "column": 8},
+        "fix": {"message": "Remove unused import: `os`"},
+        "url": "https://docs.astral.sh/ruff/rules/unused-import",
+    }
+
+    finding = analyzer._issue_to_finding(issue, "app.py")
+
+    assert finding.severity == Severity.HIGH
+    assert finding.category == FindingCategory.BUG
+    assert finding.location.line_start == 3
+    assert finding.suggestion == "Remove unused import: `os`"
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff not installed")
+async def test_analyze_batch_maps_issues_to_each_file():
+    analyzer = RuffAnalyzer()
+    contexts = [
+        {"file_path": "pkg/a.py", "code": "import os\n"},
+        {"file_path": "pkg/b.py", "code": "x = 1\n"},
+        {"file_path": "README.md", "code": "import os\n"},
+    ]
+
+    results = await analyzer.analyze_batch(contexts)
+
+    assert set(results) == {"pkg/a.py", "pkg/b.py"}
+    assert "F401" in [f.metadata["rule"] for f in results["pkg/a.py"]]
+    assert all(f.location.file_path == "pkg/a.py" for f in results["pkg/a.py"])
+    assert results["pkg/b.py"] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff not installed")
+async def test_analyze_batch_uses_project_settings(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "pyproject.toml").write_text('[tool.ruff.lint]\nignore = ["F401"]\n')
+    # Settings found above the system temp directory must not apply
+    (tmp_path / "pyproject.toml").write_text('[tool.ruff.lint]\nignore = ["F821"]\n')
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.chdir(project)
+
+    results = await RuffAnalyzer(use_server=False).analyze_batch(
+        [{"file_path": "a.py", "code": "import os\n"}, {"file_path": "b.py", "code": "x = y\n"}]
+    )
+
+    assert results["a.py"] == []
+    assert "F821" in [f.metadata["rule"] for f in results["b.py"]]
+    assert list(project.iterdir()) == [project / "pyproject.toml"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(shutil.which("ruff") is None, reason="ruff not installed")
+async def test_server_findings_match_ruff_check():
+    code = "import os\nx = 'é'; y = undefined_name\n"
+    context = {"file_path": "pkg/a.py", "code": code}
+    server_analyzer = RuffAnalyzer()
+    try:
+        from_server = await server_analyzer.analyze(context)
+        assert server_analyzer.use_server
+    finally:
+        await server_analyzer.aclose()
+    from_check = await RuffAnalyzer(use_server=False).analyze(context)
+
+    def comparable(findings):
+        return sorted(
+            (f.title, f.location.line_start, f.location.column_start, f.suggestion, f.metadata["url"])
+            for f in findings
+        )
+
+    assert "F401" in [f.metadata["rule"] for f in from_server]
+    assert comparable(from_server) == comparable(from_check)
+
+
+@pytest.mark.asyncio
+async def test_analyze_falls_back_when_server_is_unavailable(monkeypatch):
+    async def missing_ruff(*args, **kwargs):
+        raise FileNotFoundError("ruff")
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", missing_ruff)
+    analyzer = RuffAnalyzer()
+
+    assert await analyzer.analyze({"file_path": "a.py", "code": "import os\n"}) == []
+    assert analyzer.use_server is False
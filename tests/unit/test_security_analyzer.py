@@ -46,6 +46,23 @@ def get_user(user_id):
     assert sql_findings[0].severity == Severity.CRITICAL
 
 
+@pytest.mark.asyncio
+async def test_detect_injection_in_capitalized_calls():
+    """Injection patterns match call names regardless of case."""
+    analyzer = SecurityAnalyzer()
+
+    code = """
+var rows = db.Execute(string.Format("SELECT * FROM users WHERE id = {0}", id));
+OS.SYSTEM("rm -rf " + path)
+"""
+
+    findings = await analyzer.analyze({"file_path": "Users.cs", "code": code})
+
+    titles = {f.title for f in findings if f.severity == Severity.CRITICAL}
+    assert any("SQL Injection" in title for title in titles)
+    assert any("Command Injection" in title for title in titles)
+
+
 @pytest.mark.asyncio
 async def test_detect_eval_usage():
     """Test eval() detection."""
@@ -89,3 +106,42 @@ async def test_supports():
 
     assert analyzer.supports({"code": "some code"})
     assert not analyzer.supports({"no_code": "here"})
+
+
+@pytest.mark.asyncio
+async def test_findings_keep_line_and_pattern_order():
+    """Findings are ordered by pattern, then line, with per-line positions."""
+    analyzer = SecurityAnalyzer()
+
+    code = 'x = 1\npassword = "hunter2"\n\ntoken = "ghp_' + "a" * 36 + '"\nh = hashlib.md5(b"")\n'
+
+    findings = await analyzer.analyze({"file_path": "app.py", "code": code})
+
+    assert [(f.title, f.location.line_start) for f in findings] == [
+        ("Potential GitHub Token exposed in code", 4),
+        ("Potential Password in Code exposed in code", 2),
+        ("Hardcoded Password", 2),
+        ("Weak Hash", 5),
+    ]
+    assert findings[0].location.column_start == 10
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_matches_per_file_analysis(monkeypatch):
+    """Test that batch analysis returns each file's own findings."""
+    monkeypatch.setattr("professor.analyzers.security_analyzer.PROCESS_POOL_MIN_SIZE", 1)
+    analyzer = SecurityAnalyzer()
+    contexts = [
+        {"file_path": "a.py", "code": "result = eval(user_input)\n"},
+        {"file_path": "b.py", "code": "x = 1\n"},
+        {"file_path": "c.py", "code": "import pickle\ndata = pickle.loads(raw)\n"},
+        {"file_path": "d.py", "code": ""},
+    ]
+
+    results = await analyzer.analyze_batch(contexts)
+
+    assert set(results) == {"a.py", "b.py", "c.py"}
+    for context in contexts[:3]:
+        expected = await analyzer.analyze(dict(context))
+        assert [f.id for f in results[context["file_path"]]] == [f.id for f in expected]
+    assert [f.title for f in results["c.py"]] == ["Unsafe Deserialization"]